@@ -0,0 +1,951 @@
+"""Benchmarks headless do jogo (sem janela, sem áudio e sem Arduino).
+
+Uso:
+    python benchmark.py                 # roda todas as suítes
+    python benchmark.py stress          # roda só a suíte escolhida
+    python benchmark.py stress --sizes 10 100 --ticks 50
+"""
+import argparse
+import gc
+import itertools
+import os
+import math
+import multiprocessing
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import pygame
+import serial
+
+from config import *
+from main import Game
+from classes.controls import ScriptedInput, sweep_and_fire
+from classes.enemy import Enemy
+from classes.collision import sprite_radius, frame_mask
+from classes.projectiles import ProjectileSystem, PLAYER, ENEMY
+from classes.asset_cache import AssetCache
+from classes.loader import AssetLoader, INTRO, GAMEPLAY
+from classes.rendering import DirtyRenderer
+from classes.fake_arduino import FakeArduino
+from classes.serial_input import SerialReader, TelemetryWriter
+from classes.timestep import sim_clock
+from classes.animation import AnimationScheduler
+from classes.background import BackgroundLoop
+from classes.protocol import FrameDecoder, encode_text_telemetry
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+PROJECTILE_SIZES = [1000, 10000, 50000]
+COLLISION_TARGETS = 100 # Alvos fixos da suíte collision
+SUITES = {}
+
+
+def suite(name):
+    def register(func):
+        SUITES[name] = func
+        return func
+    return register
+
+
+#==============================================================================
+# UTILITÁRIOS
+#==============================================================================
+def make_game(seed=1234, wave_profile=WAVE_PROFILE, **options):
+    """Cria um jogo headless já na tela de jogo, com o jogador invencível.
+
+    `options` vão para o Game (ex.: window_size, resolution_mode).
+    """
+    game = Game(headless=True, seed=seed, input_source=ScriptedInput(sweep_and_fire), wave_profile=wave_profile,
+                **options)
+    game.loader.wait() # Fundo completo e sons: os números não dependem do carregamento
+    game.start_new_game()
+    game.player.lives = 10 ** 9
+    return game
+
+
+def random_point():
+    return (random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT))
+
+
+def random_direction():
+    angle = random.uniform(0, 2 * math.pi)
+    return pygame.math.Vector2(math.cos(angle), math.sin(angle))
+
+
+def populate(game, count, enemies=None):
+    """Completa inimigos, tiros do jogador, tiros inimigos e explosões até `count` de cada.
+
+    `enemies` permite usar uma quantidade diferente só para o grupo de inimigos.
+    """
+    for _ in range((count if enemies is None else enemies) - len(game.enemies)):
+        enemy = Enemy(game.assets['enemy_anim'], game.player)
+        enemy.place(random.uniform(0, SCREEN_WIDTH - enemy.rect.width), random.uniform(0, SCREEN_HEIGHT / 2))
+        game.spawn(enemy, 'enemy', game.enemies)
+    for owner in (PLAYER, ENEMY):
+        missing = count - game.projectiles.live(owner)
+        if missing > 0:
+            positions = [random_point() for _ in range(missing)]
+            if owner == PLAYER:
+                directions = [(0, -1)] * missing
+            else:
+                directions = [tuple(random_direction()) for _ in range(missing)]
+            game.projectiles.spawn_many(positions, directions, BULLET_SPEED if owner == PLAYER else ENEMY_BULLET_SPEED, owner)
+    for _ in range(count - len(game.explosions)):
+        game.spawn_explosion(random_point())
+
+
+class SurfaceAllocations:
+    """Conta as Surfaces criadas de fato enquanto está ativo (with).
+
+    Surface, Font e Mask são tipos em C e não aceitam monkeypatch nos métodos.
+    Então pygame.Surface(...) é trocado por uma subclasse que conta, e as
+    chamadas às funções em C que devolvem uma Surface nova (Font.render,
+    Surface.copy, transform.*, ...) são contadas por sys.setprofile. Um
+    transform.* com superfície de destino também conta, então o número é um
+    limite superior.
+    """
+    METHODS = {'Font': {'render'}, 'Surface': {'copy', 'subsurface', 'convert', 'convert_alpha'},
+               'Mask': {'to_surface'}}
+
+    def __init__(self):
+        self.count = 0
+
+    def _profile(self, frame, event, func):
+        if event != 'c_call':
+            return
+        owner = getattr(func, '__self__', None)
+        if getattr(func, '__module__', None) == 'pygame.transform' or \
+                func.__name__ in self.METHODS.get(type(owner).__name__, ()):
+            self.count += 1
+
+    def __enter__(self):
+        counter = self
+
+        class CountingSurface(pygame.Surface):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                counter.count += 1
+
+        self._surface = pygame.Surface
+        pygame.Surface = CountingSurface
+        sys.setprofile(self._profile)
+        return self
+
+    def __exit__(self, *exc):
+        sys.setprofile(None)
+        pygame.Surface = self._surface
+
+
+def dot_sprites(count, size):
+    """Grupo de sprites genéricos (só rect) espalhados pela tela."""
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(0, 0, size, size)
+        sprite.rect.center = random_point()
+        group.add(sprite)
+    return group
+
+
+class LegacyEnemy(Enemy):
+    """Movimento do Enemy como era antes das tabelas de trajetória (trigonometria por frame)."""
+    def __init__(self, enemy_anim_frames, target_player):
+        super().__init__(enemy_anim_frames, target_player)
+        self.pos = pygame.math.Vector2(self.rect.topleft)
+        if self.movement_type == 'straight': self.vel = pygame.math.Vector2(0, 3)
+        elif self.movement_type == 'diagonal': self.vel = pygame.math.Vector2(random.choice([-2, 2]), 2)
+        elif self.movement_type == 'curve':
+            self.vel = pygame.math.Vector2(0, 2)
+            self.angle = 0
+            self.angle_speed = random.choice([-1, 1]) * 2
+
+    def place(self, x, y):
+        super().place(x, y)
+        self.pos = pygame.math.Vector2(x, y)
+
+    def update(self, projectiles):
+        self.pos += self.vel
+        if self.movement_type == 'curve':
+            self.angle += self.angle_speed
+            self.pos.x += math.sin(math.radians(self.angle)) * 3
+        self.rect.topleft = self.pos
+
+        self.try_to_shoot(projectiles)
+
+        if self.rect.top > SCREEN_HEIGHT:
+            self.kill()
+
+
+class LegacyAnimated(pygame.sprite.Sprite):
+    """Animação como era antes do AnimationScheduler: cada sprite consulta o relógio todo frame."""
+    def __init__(self, frames, anim_speed):
+        super().__init__()
+        self.animation_frames = frames
+        self.current_frame = 0
+        self.image = frames[0]
+        self.rect = self.image.get_rect(center=random_point())
+        self.last_anim_update = sim_clock.get_ticks()
+        self.anim_speed = anim_speed
+
+    def update(self, *args):
+        now = sim_clock.get_ticks()
+        if now - self.last_anim_update > self.anim_speed:
+            self.last_anim_update = now
+            self.current_frame = (self.current_frame + 1) % len(self.animation_frames)
+            old_center = self.rect.center
+            self.image = self.animation_frames[self.current_frame]
+            self.rect = self.image.get_rect(center=old_center)
+
+
+class LegacyBullet(pygame.sprite.Sprite):
+    """Réplica do antigo EnemyBullet (um Sprite e uma Surface por tiro), só para comparação."""
+    def __init__(self, center_pos, direction_vector):
+        super().__init__()
+        self.image = pygame.Surface((10, 10))
+        pygame.draw.circle(self.image, ENEMY_BULLET_COLOR, (5, 5), 5)
+        self.image.set_colorkey((0, 0, 0))
+        self.rect = self.image.get_rect(center=center_pos)
+        self.pos = pygame.math.Vector2(center_pos)
+        self.direction = direction_vector
+        self.speed = ENEMY_BULLET_SPEED
+
+    def update(self, *args):
+        self.pos += self.direction * self.speed
+        self.rect.center = self.pos
+        if not pygame.display.get_surface().get_rect().contains(self.rect):
+            self.kill()
+
+
+def measure(phases, ticks, budget, setup=None):
+    """Roda `ticks` vezes cada fase em sequência e devolve {fase: [segundos, ...]}.
+
+    Para antes se o tempo total passar de `budget` segundos (mínimo de 3 ticks).
+    """
+    samples = {name: [] for name, _ in phases}
+    started = time.perf_counter()
+    for tick in range(ticks):
+        if setup:
+            setup()
+        for name, phase in phases:
+            t0 = time.perf_counter()
+            phase()
+            samples[name].append(time.perf_counter() - t0)
+        if tick >= 2 and time.perf_counter() - started > budget:
+            break
+    return samples
+
+
+def report(title, rows, columns):
+    print(f"\n== {title} ==")
+    header = "".join(f"{col:>14}" for col in columns)
+    print(header)
+    for row in rows:
+        print("".join(f"{value:>14.3f}" if isinstance(value, float) else f"{value:>14}" for value in row))
+
+
+def ms(values):
+    return statistics.mean(values) * 1000.0
+
+
+def resident_mb():
+    """Memória residente do processo em MB (só no Linux; None nos outros sistemas)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+#==============================================================================
+# SUÍTES
+#==============================================================================
+@suite("stress")
+def stress_suite(args):
+    """Custo por fase de update_playing_state e draw_playing_screen com N entidades por grupo."""
+    dt = 1 / 60
+    rows = []
+    for size in args.sizes:
+        game = make_game(args.seed)
+        populate(game, size)
+        phases = [
+            ("animation", game.animations.update),
+            ("player", lambda: game.player.update(dt, game.screen)),
+            ("enemies", lambda: game.enemies.update(game.projectiles)),
+            ("projectiles", game.projectiles.update),
+            ("collisions", game.handle_collisions),
+            ("background", game.draw_background),
+            ("sprites", lambda: game.renderer.add(game.draw_sprites())),
+            ("proj_draw", lambda: game.renderer.add(game.projectiles.draw(game.screen, game.render_alpha()))),
+            ("hud", lambda: game.renderer.add(game.draw_hud())),
+            ("present", game.renderer.end),
+        ]
+        def tick():
+            sim_clock.advance(dt)
+            populate(game, size)
+
+        samples = measure(phases, args.ticks, args.budget, setup=tick)
+        per_phase = [ms(samples[name]) for name, _ in phases]
+        tick_ms = sum(per_phase)
+        rows.append([size, 1000.0 / tick_ms if tick_ms else float("inf"), tick_ms] + per_phase)
+        game.quit()
+    report("stress: ms por fase (update_playing_state + draw_playing_screen)", rows,
+           ["entidades", "ticks/s", "tick"] + [name for name, _ in phases])
+
+
+@suite("collision")
+def collision_suite(args):
+    """Tiros contra alvos: um Sprite por tiro com pygame.sprite.groupcollide contra a
+    grade vetorizada do ProjectileSystem (o que o jogo usa para os tiros).
+
+    O número de alvos é fixo (uma tela cheia de inimigos), então o trabalho só
+    cresce com os tiros: a grade deve ficar perto de linear e a força bruta também,
+    mas com um custo por tiro bem maior.
+    """
+    rows = []
+    for size in args.sizes:
+        random.seed(args.seed)
+        targets = dot_sprites(COLLISION_TARGETS, 70)
+        shots = dot_sprites(size, 16) # Lado par: o rect do tiro fica centrado igual nos dois lados
+        projectiles = ProjectileSystem({PLAYER: pygame.Surface((16, 16))}, capacity=size)
+        projectiles.spawn_many([shot.rect.center for shot in shots], [(0, -1)] * size, 0, PLAYER)
+        pairs = {}
+
+        def brute():
+            hits = pygame.sprite.groupcollide(targets, shots, False, False)
+            pairs['brute'] = sum(len(hit) for hit in hits.values())
+
+        def grid():
+            hits = projectiles.collide_rects(targets, PLAYER, dokill=False)
+            pairs['grid'] = sum(len(hit) for hit in hits.values())
+
+        def move():
+            for shot in shots:
+                shot.rect.y = (shot.rect.y - 10) % SCREEN_HEIGHT
+            projectiles.pos[:size] = [shot.rect.center for shot in shots]
+
+        samples = measure([("brute", brute), ("grid", grid)], args.ticks, args.budget, setup=move)
+        brute_ms, grid_ms = ms(samples["brute"]), ms(samples["grid"])
+        rows.append([size, brute_ms, grid_ms, brute_ms / grid_ms, brute_ms * 1000.0 / size,
+                     grid_ms * 1000.0 / size, pairs['grid'], pairs['grid'] == pairs['brute']])
+    report(f"collision: ms por frame ({COLLISION_TARGETS} alvos, N tiros)", rows,
+           ["tiros", "brute", "grid", "ganho", "us/tiro brute", "us/tiro grid", "pares", "mesmos pares"])
+
+
+@suite("projectiles")
+def projectiles_suite(args):
+    """Um Sprite por tiro (como o antigo EnemyBullet) contra o ProjectileSystem em NumPy."""
+    sizes = args.projectile_sizes
+    rows = []
+    for size in sizes:
+        game = make_game(args.seed)
+        legacy = pygame.sprite.Group()
+        projectiles = game.projectiles
+        radius = sprite_radius(game.player)
+
+        def refill():
+            for _ in range(size - len(legacy)):
+                legacy.add(LegacyBullet(random_point(), random_direction()))
+            populate(game, size // 2, enemies=0)
+
+        def legacy_frame():
+            legacy.update()
+            pygame.sprite.spritecollide(game.player, legacy, False, pygame.sprite.collide_circle)
+            legacy.draw(game.screen)
+
+        def numpy_frame():
+            projectiles.update()
+            projectiles.collide_circle(game.player, radius, ENEMY, dokill=False)
+            projectiles.draw(game.screen)
+
+        samples = measure([("sprites", legacy_frame), ("numpy", numpy_frame)], args.ticks, args.budget, setup=refill)
+        legacy_ms, numpy_ms = ms(samples["sprites"]), ms(samples["numpy"])
+        rows.append([size, legacy_ms, numpy_ms, legacy_ms / numpy_ms])
+        game.quit()
+    report("projectiles: ms por frame (mover + colidir com o jogador + desenhar)", rows,
+           ["projéteis", "sprites", "numpy", "ganho"])
+
+
+@suite("masks")
+def masks_suite(args):
+    """Narrowphase com muitos tiros: só rect/círculo, máscaras pré-calculadas por quadro e
+    máscara feita a cada frame com Mask.overlap por par (como pygame.sprite.collide_mask).
+
+    100 inimigos e N tiros de cada dono; conta também quantos acertos o teste
+    por rect/círculo dá que os pixels não confirmam.
+    """
+    rows = []
+    for size in args.projectile_sizes:
+        game = make_game(args.seed)
+        populate(game, size, enemies=100)
+        projectiles, enemies, player = game.projectiles, game.enemies, game.player
+        radius = sprite_radius(player)
+        hit_counts = {}
+
+        def rect_only():
+            hits = projectiles.collide_rects(enemies, PLAYER, dokill=False)
+            shots = projectiles.collide_circle(player, radius, ENEMY, dokill=False)
+            hit_counts["rect"] = sum(len(centers) for centers in hits.values()) + shots
+
+        def cached_masks():
+            hits = projectiles.collide_rects(enemies, PLAYER, dokill=False, mask_of=frame_mask)
+            shots = projectiles.collide_circle(player, radius, ENEMY, dokill=False, mask=frame_mask(player))
+            hit_counts["máscara"] = sum(len(centers) for centers in hits.values()) + shots
+
+        def built_masks():
+            count = 0
+            hits = projectiles.collide_rects(enemies, PLAYER, dokill=False)
+            for owner, targets in ((PLAYER, hits.items()), (ENEMY, [])):
+                shot_mask = projectiles.masks[owner]
+                half = projectiles.half_size[owner]
+                for sprite, centers in targets:
+                    sprite_mask = pygame.mask.from_surface(sprite.image)
+                    for x, y in (centers - half).astype(int).tolist():
+                        count += sprite_mask.overlap(shot_mask, (x - sprite.rect.x, y - sprite.rect.y)) is not None
+            hit_counts["máscara/frame"] = count
+
+        samples = measure([("rect", rect_only), ("máscara", cached_masks), ("máscara/frame", built_masks)],
+                          args.ticks, args.budget)
+        rows.append([size, ms(samples["rect"]), ms(samples["máscara"]), ms(samples["máscara/frame"]),
+                     hit_counts["rect"], hit_counts["máscara"]])
+        game.quit()
+    report("masks: ms por frame da colisão tiros x inimigos e tiros x jogador (100 inimigos; "
+           "máscara/frame só tiros x inimigos)", rows,
+           ["tiros/dono", "rect", "máscara", "máscara/frame", "acertos rect", "acertos máscara"])
+
+
+@suite("allocations")
+def allocations_suite(args):
+    """Alocações por frame (explosões e superfícies) numa partida roteirizada com inimigos nascendo.
+
+    surfaces_created conta toda Surface criada nos frames medidos (SurfaceAllocations),
+    não só as vindas do SurfaceCache.
+    """
+    game = make_game(args.seed, wave_profile='crescente')
+    frames = max(args.ticks, 600)
+    warmup = frames // 2
+    before = None
+    surfaces = SurfaceAllocations()
+    for frame in range(frames):
+        if frame == warmup:
+            before = dict(game.allocation_stats(), surfaces_created=0)
+            surfaces.__enter__()
+        game.step(1 / 60)
+    surfaces.__exit__(None, None, None)
+    after = dict(game.allocation_stats(), surfaces_created=surfaces.count)
+    rows = [[key, before[key], after[key], (after[key] - before[key]) / (frames - warmup)] for key in after]
+    game.quit()
+    report(f"allocations: contadores depois de {warmup} frames de aquecimento e no fim ({frames}); "
+           "surfaces_created conta só a segunda metade", rows, ["contador", "aquecido", "final", "por frame"])
+
+
+@suite("enemies")
+def enemies_suite(args):
+    """Custo de enemies.update() com N inimigos: trigonometria por frame contra tabelas de trajetória."""
+    rows = []
+    for size in args.sizes:
+        results = []
+        for enemy_class in (LegacyEnemy, Enemy):
+            game = make_game(args.seed)
+            group = pygame.sprite.Group()
+
+            def refill():
+                # Repõe quem saiu da tela, espalhado pela metade de cima
+                for _ in range(size - len(group)):
+                    enemy = enemy_class(game.assets['enemy_anim'], game.player)
+                    enemy.place(random.uniform(0, SCREEN_WIDTH - enemy.rect.width), random.uniform(0, SCREEN_HEIGHT / 2))
+                    group.add(enemy)
+                game.projectiles.clear()
+
+            samples = measure([("update", lambda: group.update(game.projectiles))], args.ticks, args.budget, setup=refill)
+            results.append(ms(samples["update"]))
+            game.quit()
+        rows.append([size] + results + [results[0] / results[1]])
+    report("enemies: ms por passo de enemies.update()", rows, ["inimigos", "trig", "tabelas", "ganho"])
+
+
+@suite("waves")
+def waves_suite(args):
+    """Teste de carga: partidas roteirizadas em cada perfil de ondas (waves.json)."""
+    frames = max(args.ticks, 600)
+    rows = []
+    for profile in ('normal', 'crescente', 'stress', 'stress_max'):
+        game = make_game(args.seed, wave_profile=profile)
+        samples = measure([("frame", lambda: game.step(1 / 60))], frames, args.budget)
+        counts = game.entity_counts()
+        rows.append([profile, len(samples["frame"]), ms(samples["frame"]), max(samples["frame"]) * 1000.0,
+                     counts['enemies'], counts['bombers'], counts['player_shots'] + counts['enemy_shots'],
+                     counts['explosions'], sum(game.waves.capped.values())])
+        game.quit()
+    report(f"waves: até {frames} frames por perfil (jogador invencível)", rows,
+           ["perfil", "frames", "ms/frame", "pior ms", "inimigos", "bombard.", "tiros", "explosões", "barrados"])
+
+
+@suite("animation")
+def animation_suite(args):
+    """Troca de quadros de N inimigos e N explosões: polling por sprite contra o AnimationScheduler."""
+    dt = 1 / 60
+    rows = []
+    for size in args.sizes:
+        game = make_game(args.seed)
+        scheduler = AnimationScheduler()
+        legacy = pygame.sprite.Group()
+        scheduled = pygame.sprite.Group()
+        for name, asset in (('enemy', 'enemy_anim'), ('explosion', 'explosion_anim')):
+            frames = game.assets[asset]
+            # Explosões em loop, para o número de sprites não cair durante a medida
+            scheduler.register(name, frames, ANIMATION_FRAME_MS[name])
+            for _ in range(size):
+                legacy.add(LegacyAnimated(frames, ANIMATION_FRAME_MS[name]))
+                sprite = pygame.sprite.Sprite(scheduled)
+                sprite.rect = frames[0].get_rect(center=random_point())
+                scheduler.play(sprite, name)
+        samples = measure([("polling", legacy.update), ("agendador", scheduler.update)],
+                          args.ticks, args.budget, setup=lambda: sim_clock.advance(dt))
+        rows.append([size * 2, ms(samples["polling"]), ms(samples["agendador"]),
+                     scheduler.frames_advanced / len(samples["agendador"])])
+        game.quit()
+    report("animation: ms por passo para animar N inimigos + N explosões", rows,
+           ["sprites", "polling", "agendador", "trocas/passo"])
+
+
+@suite("audio")
+def audio_suite(args):
+    """Tiroteio pesado no driver de áudio dummy: Sound.play() direto contra o AudioManager."""
+    seconds, rate = 2.0, 120  # disparos por segundo, em tempo real (o mixer toca em tempo real)
+    rows = []
+    for mode in ("direto", "gerenciado"):
+        game = make_game(args.seed)
+        audio, assets = game.audio, game.assets
+        triggers = [('gun', assets['gun_sound'])] * 3 + [('explosion', assets['explosion_sound'])]
+        engine_channel = audio.loops['engine']
+        if mode == "direto":
+            # Como era antes: 8 canais (padrão do pygame), nenhum reservado e o motor num canal qualquer
+            audio.stop_all()
+            pygame.mixer.set_reserved(0)
+            pygame.mixer.set_num_channels(8)
+            engine_channel = assets['engine_sound'].play(loops=-1)
+        lost = peak = 0
+        costs = []
+        started = time.perf_counter()
+        frame = 0
+        while time.perf_counter() - started < seconds:
+            name, sound = triggers[frame % len(triggers)]
+            t0 = time.perf_counter()
+            channel = sound.play() if mode == "direto" else audio.play(name)
+            costs.append(time.perf_counter() - t0)
+            lost += channel is None
+            peak = max(peak, sum(pygame.mixer.Channel(i).get_busy() for i in range(pygame.mixer.get_num_channels())))
+            frame += 1
+            time.sleep(max(0.0, started + frame / rate - time.perf_counter()))
+        engine = engine_channel.get_sound() is assets['engine_sound'] and engine_channel.get_busy()
+        stats = audio.stats()
+        if mode == "gerenciado":
+            lost = stats['dropped']  # os outros None são disparos barrados de propósito
+        rows.append([mode, frame, ms(costs), lost, peak, stats['rate_limited'], stats['capped'], stats['stolen'],
+                     "sim" if engine else "não"])
+        game.quit()
+    report(f"audio: {rate} disparos/s por {seconds:.0f} s (3 tiros : 1 explosão)", rows,
+           ["modo", "disparos", "ms/play", "sem canal", "canais pico", "limitados", "vozes reinic.", "roubados", "motor tocando"])
+
+
+def wallpaper_paths():
+    return [os.path.join(os.path.dirname(os.path.abspath(__file__)), "wallpaper", f"wallpaper{i}.png")
+            for i in range(1, 15)]
+
+
+def build_background(mode, cache):
+    """Fundo animado como era ('quadros': os 14 quadros inteiros) ou o BackgroundLoop ('blocos')."""
+    if mode == "quadros":
+        return [cache.image(path, alpha=False) for path in wallpaper_paths()]
+    background = BackgroundLoop(len(wallpaper_paths()))
+    for path in wallpaper_paths():
+        background.append(cache.image(path, alpha=False))
+    return background
+
+
+def background_resident(mode):
+    """Roda num processo novo: MB residentes a mais depois de montar o fundo."""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    cache = AssetCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), ASSET_CACHE_DIR),
+                       enabled=ASSET_CACHE_ENABLED)
+    cache.image(wallpaper_paths()[0], alpha=False)  # Custo fixo do primeiro carregamento fora da conta
+    gc.collect()
+    before = resident_mb()
+    background = build_background(mode, cache)
+    gc.collect()
+    after = resident_mb()
+    del background # Só precisava ficar vivo até a medição
+    pygame.quit()
+    return None if before is None else after - before
+
+
+@suite("background")
+def background_suite(args):
+    """Fundo animado: os 14 quadros inteiros em memória (como era) contra o BackgroundLoop.
+
+    Compara os bytes de pixels guardados, o aumento da memória residente (cada
+    modo montado num processo novo) e o custo de uma troca de quadro:
+    atualizar o fundo e copiar para a tela o que mudou (pixels contados nas
+    duas cópias).
+    """
+    game = Game(headless=True, seed=args.seed)
+    game.loader.wait()
+    screen = game.screen
+    rows = []
+    for mode in ("quadros", "blocos"):
+        with multiprocessing.get_context('spawn').Pool(1) as pool:
+            resident = pool.apply(background_resident, (mode,))
+        frames = build_background(mode, game.asset_cache)
+        if mode == "quadros":
+            stored = sum(frame.get_height() * frame.get_pitch() for frame in frames)
+            current = [0]
+
+            def advance():
+                current[0] = (current[0] + 1) % len(frames)
+                copied = screen.blit(frames[current[0]], (0, 0))
+                return copied.width * copied.height
+        else:
+            stored = frames.memory()
+
+            def advance():
+                applied = frames.pixels_applied
+                frames.current_frame = (frames.current_frame + 1) % len(frames)
+                copied = 0
+                for rect in frames.update():
+                    rect = screen.blit(frames.image, rect, rect)
+                    copied += rect.width * rect.height
+                return copied + frames.pixels_applied - applied
+        pixels = []
+        samples = measure([("troca", lambda: pixels.append(advance()))], args.ticks, args.budget)
+        rows.append([mode, stored / 2**20, "-" if resident is None else resident,
+                     ms(samples["troca"]), statistics.mean(pixels) / 1000.0])
+    game.quit()
+    report("background: memória e custo por troca de quadro do fundo animado", rows,
+           ["modo", "MB pixels", "MB residente", "ms/troca", "kpx/troca"])
+
+
+@suite("render")
+def render_suite(args):
+    """Tela toda a cada frame contra retângulos sujos: pixels copiados e ms de desenho."""
+    rows = []
+    for size in args.sizes:
+        for mode in ("full", "dirty"):
+            game = make_game(args.seed)
+            game.renderer = DirtyRenderer(game.screen, mode)
+            populate(game, size, enemies=max(1, size // 10))
+
+            def draw():
+                # O fundo animado (110 ms) troca de quadro a cada 7 passos de update_sprites
+                game.draw_playing_screen()
+                if game.update_rects is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(game.update_rects)
+
+            def tick():
+                game.update_sprites(1 / 60)
+                populate(game, size, enemies=max(1, size // 10))
+
+            renderer = game.renderer
+            samples = measure([("draw", draw)], args.ticks, args.budget, setup=tick)
+            rows.append([size, mode, ms(samples["draw"]), renderer.total_pixels / renderer.frames / 1000.0,
+                         renderer.full_frames / renderer.frames * 100.0])
+            game.quit()
+    report("render: draw_playing_screen + display (N/10 inimigos, N tiros e explosões)", rows,
+           ["entidades", "modo", "ms", "kpx/frame", "% cheios"])
+
+
+@suite("hud")
+def hud_suite(args):
+    """HUD por frame: Font.render a cada frame (como era) contra o Hud (atlas de dígitos e TextCache)."""
+    game = make_game(args.seed)
+    screen, font, player = game.screen, game.hud_font, game.player
+    rows = []
+    for label, every in (("pontos parados", 0), ("pontos mudando", 1)):
+        score = [0]
+
+        def tick():
+            score[0] += every * 10
+
+        def legacy():
+            text_surface = font.render(f"Pontos: {score[0]}", True, WHITE)
+            screen.blit(text_surface, text_surface.get_rect(bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20)))
+
+        def cached_score():
+            game.hud.draw_score(screen, score[0])
+
+        def cached():
+            game.hud.draw(screen, score[0], int(player.heat), player.max_heat, 3)
+
+        samples = measure([("antes", legacy), ("pontos", cached_score), ("hud", cached)], args.ticks, args.budget,
+                          setup=tick)
+        rows.append([label, ms(samples["antes"]), ms(samples["pontos"]), ms(samples["hud"])])
+    cache = game.text_cache
+    game.quit()
+    report(f"hud: ms por frame (o hud completo também desenha calor e vidas; "
+           f"TextCache {cache.hits} acertos, {cache.misses} renderizações)", rows,
+           ["pontos", "antes", "só pontos", "hud completo"])
+
+
+@suite("startup")
+def startup_suite(args):
+    """Carregamento dos assets: PNG direto, gravando o cache e lendo do cache, com 1 e N threads.
+
+    Mede quando a intro pode ser desenhada, quando start_new_game pode
+    começar e quando tudo chegou, além da fatia mais longa de pump() na
+    thread principal (com a intro sendo desenhada a cada ASSET_SLICE_MS).
+    """
+    game = Game(headless=True, seed=args.seed)
+    game.loader.wait()
+    cache_dir = tempfile.mkdtemp(prefix="p51-assets-")
+    rows = []
+    try:
+        modes = [("png", lambda: AssetCache(cache_dir, enabled=False)),
+                 ("cache (build)", lambda: AssetCache(cache_dir)),
+                 ("cache", lambda: AssetCache(cache_dir)),
+                 ("cache (hash)", lambda: AssetCache(cache_dir, validate='hash')),
+                 ("zlib (build)", lambda: AssetCache(cache_dir, compress=True)),
+                 ("zlib", lambda: AssetCache(cache_dir, compress=True))]
+        for label, make_cache in modes:
+            if label == "zlib (build)":
+                shutil.rmtree(cache_dir)
+            for workers in sorted({1, ASSET_LOADER_WORKERS}):
+                if label.endswith("(build)") and workers != 1:
+                    continue  # O cache já foi gravado na rodada de 1 thread
+                game.loader.close()
+                game.asset_cache = cache = make_cache()
+                game.loader = loader = AssetLoader(cache, game.assets, workers)
+                marks = {}
+                t0 = time.perf_counter()
+                game.load_assets()
+                while not loader.ready():
+                    loader.pump()
+                    for group in (INTRO, GAMEPLAY):
+                        if group not in marks and loader.ready(group):
+                            marks[group] = (time.perf_counter() - t0) * 1000.0
+                    time.sleep(0.001)  # O resto do frame da intro
+                total = (time.perf_counter() - t0) * 1000.0
+                loader.pool.shutdown(wait=True)  # Gravações pendentes do cache
+                rows.append([label, workers, marks[INTRO], marks[GAMEPLAY], total, loader.slowest_ms,
+                             cache.hits, cache.misses])
+        disk = sum(os.path.getsize(os.path.join(cache_dir, name)) for name in os.listdir(cache_dir))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        game.quit()
+    report(f"startup: ms até a intro, a partida e o fim do carregamento (cache zlib em disco: {disk / 2**20:.1f} MB)",
+           rows, ["modo", "threads", "intro", "partida", "tudo", "pump max", "hits", "misses"])
+
+
+@suite("serial")
+def serial_suite(args):
+    """Atraso de entrada com um Arduino falso (pty) a 50 Hz e frames lentos de 40 ms."""
+    frame_time, duration = 0.040, 2.0
+    rows = []
+    for mode in ("readline", "thread"):
+        # A amostra número `seq` leva o próprio seq no lugar do eixo X
+        fake = FakeArduino(interval=0.020, sample=lambda seq: (seq, 512, 1, 1), protocol='text').start()
+        ser = serial.Serial(fake.port, BAUD_RATE, timeout=0.01)
+        reader = SerialReader(ser, protocol='text').start() if mode == "thread" else None
+        latencies = []
+        started = time.perf_counter()
+        while time.perf_counter() - started < duration:
+            frame_start = time.perf_counter()
+            if reader is None:
+                # Como o jogo fazia antes: uma linha por frame, no próprio loop
+                if ser.in_waiting > 0:
+                    parts = ser.readline().decode('utf-8').strip().split(',')
+                    seq = int(parts[0]) if len(parts) == 4 else None
+                else:
+                    seq = None
+            else:
+                state = reader.take()
+                seq = state.joy_x if state else None
+            if seq is not None and seq < len(fake.sent):
+                latencies.append(time.perf_counter() - fake.sent[seq][1])
+            time.sleep(max(0.0, frame_time - (time.perf_counter() - frame_start)))
+        if reader:
+            reader.stop()
+        ser.close()
+        fake.stop()
+        rows.append([mode, len(fake.sent), len(latencies), len(fake.sent) - len(latencies),
+                     ms(latencies) if latencies else 0.0, max(latencies, default=0.0) * 1000.0])
+    report("serial: atraso entre o envio da amostra e o jogo usá-la", rows,
+           ["modo", "enviadas", "usadas", "não usadas", "média ms", "máx ms"])
+
+
+@suite("protocol")
+def protocol_suite(args):
+    """Protocolo de texto antigo contra o binário, num loop de 60 FPS com Arduino falso a 20 Hz."""
+    frame_time, duration = 1 / 60, 2.0
+    rows = []
+    for protocol in ("text", "binary"):
+        fake = FakeArduino(interval=0.050, sample=lambda seq: (seq, 512, 1, 1), protocol=protocol).start()
+        ser = serial.Serial(fake.port, BAUD_RATE, timeout=0.05)
+        reader = SerialReader(ser, protocol=protocol).start()
+        telemetry = TelemetryWriter(ser, protocol=protocol)
+        latencies = []
+        frame = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < duration:
+            frame_start = time.perf_counter()
+            state = reader.take()
+            if state is not None and state.joy_x < len(fake.sent):
+                latencies.append(time.perf_counter() - fake.sent[state.joy_x][1])
+            # Calor sobe e desce como numa rajada; perde uma vida a cada segundo
+            heat, lives = int(abs(math.sin(frame / 40)) * 100), 3 - frame // 60
+            if protocol == "text":
+                ser.write(encode_text_telemetry(heat, lives))  # Como antes: todo frame
+            else:
+                telemetry.update(heat, lives)
+            frame += 1
+            time.sleep(max(0.0, frame_time - (time.perf_counter() - frame_start)))
+        elapsed = time.perf_counter() - started
+        time.sleep(0.05)
+        reader.stop()
+        ser.close()
+        fake.stop()
+        messages = len(FrameDecoder().feed(bytes(fake.received))) if protocol == "binary" else fake.received.count(b"\n")
+        rows.append([protocol, fake.bytes_sent / elapsed, len(fake.received) / elapsed, messages,
+                     ms(latencies) if latencies else 0.0, reader.malformed])
+    report("protocol: bytes/s em cada direção e atraso de entrada", rows,
+           ["protocolo", "ard->pc B/s", "pc->ard B/s", "telemetrias", "atraso ms", "malformadas"])
+
+
+@suite("timestep")
+def timestep_suite(args):
+    """Velocidade do jogo em máquinas lentas: passo fixo com pulo de frames contra um passo por frame.
+
+    O custo de cada frame é modelado (ms por desenho + ms por passo), então o
+    resultado não depende da máquina que roda o benchmark.
+    """
+    seconds = 10.0
+    budget = 1.0 / RENDER_FPS
+    rows = []
+    for render_ms, step_ms in ((2.0, 0.5), (12.0, 1.0), (30.0, 2.0), (60.0, 3.0), (150.0, 5.0)):
+        game = make_game(args.seed)
+        timestep = game.timestep
+        start = sim_clock.ms
+        elapsed, frame_time, drawn = 0.0, budget, 0
+        while elapsed < seconds:
+            steps = timestep.steps
+            game.step(frame_time)
+            cost = (timestep.steps - steps) * step_ms / 1000.0 + game.frame_rendered * render_ms / 1000.0
+            frame_time = max(cost, budget)
+            elapsed += frame_time
+            drawn += game.frame_rendered
+        speed = (sim_clock.ms - start) / 1000.0 / elapsed
+        # Antes: um passo e um desenho por frame, com clock.tick(60)
+        before = (1000 / 60) / max(1000 / 60, render_ms + step_ms)
+        rows.append([render_ms, step_ms, drawn / elapsed, speed, before, timestep.frames_skipped, timestep.time_dropped])
+        game.quit()
+    report(f"timestep: {seconds:.0f} s simulados com custo de desenho e de passo fixos", rows,
+           ["desenho ms", "passo ms", "FPS", "velocidade", "antes", "pulados", "s perdidos"])
+
+
+@suite("resolution")
+def resolution_suite(args):
+    """Tela de jogo em janelas maiores que 800x600: escala do frame inteiro contra assets escalados uma vez.
+
+    'scale' e 'smoothscale' desenham no canvas de 800x600 e escalam o frame
+    inteiro em present(); 'prescaled' desenha direto na janela com as cópias
+    escaladas. Cenas com 5 e com 50 inimigos, tiros de cada lado e explosões
+    (com poucas áreas sujas o 'prescaled' redesenha pouco; com muitas, a
+    janela inteira).
+    """
+    rows = []
+    for scene, window in itertools.product((5, 50), ((800, 600), (1280, 720), (1920, 1080), (2560, 1440))):
+        for mode, smooth in (("scale", False), ("smoothscale", True), ("prescaled", False)):
+            if window == (800, 600) and mode != "scale":
+                continue  # Sem escala os três modos são o mesmo
+            started = time.perf_counter()
+            game = make_game(args.seed, window_size=window,
+                             resolution_mode='prescaled' if mode == "prescaled" else 'internal')
+            prepare = time.perf_counter() - started
+            game.display.smooth = smooth
+            view = game.view
+            memory = 0 if view.images is None else view.images.memory() + view.backdrop.memory()
+
+            def tick():
+                game.update_playing_state(game.timestep.step)
+                populate(game, scene)
+
+            samples = measure([
+                ("desenho", game.draw_playing_screen),
+                ("present", lambda: game.display.present(game.update_rects, direct=game.frame_direct)),
+            ], args.ticks, args.budget, setup=tick)
+            draw, present = ms(samples["desenho"]), ms(samples["present"])
+            rows.append([scene, f"{window[0]}x{window[1]}", mode, game.display.scale, draw, present, draw + present,
+                         prepare, memory / 2**20])
+            game.quit()
+    report("resolution: ms por frame da tela de jogo", rows,
+           ["entidades", "janela", "modo", "escala", "desenho", "present", "total", "preparo s", "MB escalados"])
+
+
+@suite("governor")
+def governor_suite(args):
+    """Perfil 'stress' em cada nível de qualidade fixo e depois com o governador decidindo.
+
+    Cada frame é um game.step(1/SIM_HZ) completo (simulação e desenho).
+    """
+    frames = args.ticks * 4
+    rows = []
+    for level in range(len(QUALITY_LEVELS) + 1):
+        game = make_game(args.seed, 'stress')
+        game.governor.set_level(level)
+        costs, shots = [], []
+        started = time.perf_counter()
+        while len(costs) < frames and (len(costs) < 3 or time.perf_counter() - started < args.budget):
+            t0 = time.perf_counter()
+            game.step(1 / SIM_HZ)
+            costs.append((time.perf_counter() - t0) * 1000.0)
+            shots.append(game.projectiles.live(ENEMY))
+        costs.sort()
+        rows.append([level, QUALITY_LEVELS[level - 1] if level else "-", len(costs), statistics.median(costs),
+                     costs[int(len(costs) * 0.95)], costs[-1], statistics.mean(shots),
+                     game.animations.frames_advanced / len(costs), game.audio.rate_limited])
+        game.quit()
+    report("governor: frame do perfil 'stress' (ms) em cada nível fixo", rows,
+           ["nível", "+ reduzido", "frames", "p50", "p95", "máx", "tiros inim.", "trocas/frame", "sons barrados"])
+
+    # Com o governador: o orçamento é o p50 do nível 0 aqui, para ele ter o que fazer em qualquer máquina
+    budget = rows[0][3]
+    game = make_game(args.seed, 'stress')
+    governor = game.governor
+    governor.budget_ms = budget
+    levels = []
+    started = time.perf_counter()
+    while len(levels) < frames * 2 and time.perf_counter() - started < args.budget * 2:
+        t0 = time.perf_counter()
+        game.step(1 / SIM_HZ)
+        governor.frame((time.perf_counter() - t0) * 1000.0)
+        levels.append(governor.level)
+    report(f"governor: trocas de nível com orçamento de {budget:.2f} ms ({len(levels)} frames)",
+           [[t.frame, t.previous, t.level, t.frame_ms] for t in governor.transitions],
+           ["frame", "de", "para", "ms"])
+    print(f"nível médio {statistics.mean(levels):.2f}, final {governor.level} ({governor.describe()})")
+    game.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("suites", nargs="*", help=f"suítes disponíveis: {', '.join(SUITES)}")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--projectile-sizes", nargs="+", type=int, default=PROJECTILE_SIZES)
+    parser.add_argument("--ticks", type=int, default=120)
+    parser.add_argument("--budget", type=float, default=5.0, help="tempo máximo (s) por tamanho")
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+    unknown = [name for name in args.suites if name not in SUITES]
+    if unknown:
+        parser.error(f"suíte desconhecida: {', '.join(unknown)}")
+    for name in args.suites or list(SUITES):
+        SUITES[name](args)
+
+
+if __name__ == '__main__':
+    main()
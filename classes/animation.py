@@ -0,0 +1,99 @@
+import heapq
+import pygame
+from classes.timestep import sim_clock
+
+#==============================================================================
+# ANIMAÇÕES (QUADROS COMPARTILHADOS E UM AGENDADOR ÚNICO PARA TODOS OS SPRITES)
+#==============================================================================
+class AnimationSet:
+    """Quadros de uma animação, com o tamanho (e a máscara, se pedida) de cada quadro calculados uma vez."""
+    def __init__(self, name, frames, frame_ms, loop=True, masks=False):
+        self.name = name
+        self.frames = frames
+        self.frame_ms = frame_ms
+        self.base_frame_ms = frame_ms  # o governador de qualidade pode aumentar frame_ms
+        self.step = 1                  # quadros avançados por troca (>1 pula quadros)
+        self.loop = loop
+        # Máscaras de pixel por quadro, para a colisão precisa (classes/collision.py)
+        self.masks = [pygame.mask.from_surface(frame) for frame in frames] if masks else None
+        self.refresh()
+
+    def refresh(self):
+        """Recalcula os tamanhos (a lista de quadros cresce enquanto o AssetLoader carrega)."""
+        self.sizes = [frame.get_size() for frame in self.frames]
+        # Quadros do mesmo tamanho: trocar de quadro não mexe no rect
+        self.uniform = len(set(self.sizes)) == 1
+
+
+class AnimationScheduler:
+    """Avança os quadros de todos os sprites animados a partir de um relógio só.
+
+    Em vez de cada sprite consultar o relógio todo frame, cada um fica numa
+    fila de prioridade pelo instante da próxima troca de quadro; update() só
+    mexe nos sprites cuja troca venceu. A cadência é a mesma do código antigo
+    (troca quando passaram mais de `frame_ms` ms desde a última).
+
+    Os sprites animados ganham os atributos `animation`, `current_frame` e
+    `animation_token`. Sprites mortos (fora de todos os grupos) saem da fila
+    sozinhos; animações sem loop matam o sprite no fim (ex.: explosões).
+    """
+    def __init__(self, clock=sim_clock):
+        self.clock = clock
+        self.sets = {}
+        self._due = []      # heap com os instantes que têm trocas agendadas
+        self._buckets = {}  # instante -> [(sprite, token), ...]
+        # Contadores
+        self.frames_advanced = 0
+
+    def register(self, name, frames, frame_ms, loop=True, masks=False):
+        self.sets[name] = AnimationSet(name, frames, frame_ms, loop, masks)
+        return self.sets[name]
+
+    def clear(self):
+        """Esquece tudo o que estava agendado (ex.: ao começar um jogo novo)."""
+        self._due = []
+        self._buckets = {}
+
+    def play(self, sprite, name):
+        """Começa a animação `name` no sprite, do primeiro quadro."""
+        animation = self.sets[name]
+        sprite.animation = animation
+        sprite.current_frame = 0
+        sprite.image = animation.frames[0]
+        # O token invalida trocas agendadas para uma vida anterior do sprite (pools)
+        sprite.animation_token = getattr(sprite, 'animation_token', 0) + 1
+        self._schedule(sprite, self.clock.get_ticks() + animation.frame_ms + 1)
+
+    def _schedule(self, sprite, when):
+        bucket = self._buckets.get(when)
+        if bucket is None:
+            bucket = self._buckets[when] = []
+            heapq.heappush(self._due, when)
+        bucket.append((sprite, sprite.animation_token))
+
+    def update(self):
+        now = self.clock.get_ticks()
+        due = self._due
+        while due and due[0] <= now:
+            for sprite, token in self._buckets.pop(heapq.heappop(due)):
+                if token == sprite.animation_token and sprite.alive():
+                    self._advance(sprite, now)
+
+    def _advance(self, sprite, now):
+        animation = sprite.animation
+        index = sprite.current_frame + animation.step
+        if index >= len(animation.frames):
+            if not animation.loop:
+                sprite.kill()
+                return
+            index %= len(animation.frames)
+        sprite.current_frame = index
+        sprite.image = animation.frames[index]
+        if not animation.uniform:
+            rect = sprite.rect
+            center = rect.center
+            rect.size = animation.sizes[index]
+            rect.center = center
+        self.frames_advanced += 1
+        self._schedule(sprite, now + animation.frame_ms + 1)
+
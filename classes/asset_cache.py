@@ -0,0 +1,128 @@
+import hashlib
+import os
+import struct
+import threading
+import zlib
+import pygame
+
+#==============================================================================
+# CACHE DE ASSETS EM DISCO (PIXELS JÁ CONVERTIDOS E REDIMENSIONADOS)
+#==============================================================================
+# Cabeçalho: assinatura, versão, flags, largura, altura, mtime_ns e tamanho do
+# arquivo de origem, sha1 da origem. Depois vêm os pixels crus (RGB ou RGBA).
+MAGIC = b'P51A'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIqq20s')
+FLAG_ALPHA = 1
+FLAG_ZLIB = 2
+
+
+class AssetCache:
+    """Carrega imagens a partir de um cache binário em vez de decodificar PNG.
+
+    Na primeira vez a imagem é lida do PNG, redimensionada (se pedido) e os
+    pixels são gravados em `cache_dir`. Nas próximas, os pixels são lidos
+    direto com pygame.image.frombuffer. O cache de um arquivo é refeito
+    quando o PNG muda (mtime/tamanho, ou o sha1 se validate='hash').
+    """
+    def __init__(self, cache_dir, enabled=True, validate='mtime', compress=False):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.validate = validate
+        self.compress = compress
+        self.lock = threading.Lock()  # decode() roda nas threads do AssetLoader
+        self.hits = 0
+        self.misses = 0
+
+    def image(self, path, alpha=True, size=None):
+        """Carrega a imagem de uma vez (decodificação e conversão na thread atual)."""
+        surface, pending = self.decode(path, alpha, size)
+        surface = self.convert(surface, alpha, size)
+        if pending is not None:
+            self.store(pending, surface, alpha)
+        return surface
+
+    def decode(self, path, alpha=True, size=None):
+        """Lê o cache ou decodifica o PNG, sem converter: pode rodar fora da thread principal.
+
+        Devolve (superfície, pendente); `pendente` não é None quando o cache
+        precisa ser gravado com store() depois do convert().
+        """
+        if not self.enabled:
+            return pygame.image.load(path), None
+        cache_path = self._cache_path(path, alpha, size)
+        stat = os.stat(path)
+        surface = self._read(cache_path, path, stat)
+        with self.lock:
+            if surface is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if surface is not None:
+            return surface, None
+        return pygame.image.load(path), (cache_path, path, stat)
+
+    def convert(self, surface, alpha=True, size=None):
+        """Converte para o formato da tela (thread principal) e redimensiona."""
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        if size is not None and surface.get_size() != tuple(size):
+            surface = pygame.transform.scale(surface, size)
+        return surface
+
+    def store(self, pending, surface, alpha=True):
+        """Grava no cache os pixels já convertidos (pode rodar numa thread)."""
+        cache_path, path, stat = pending
+        self._write(cache_path, path, stat, surface, alpha)
+
+    def _cache_path(self, path, alpha, size):
+        key = f"{os.path.abspath(path)}|{alpha}|{size}".encode('utf-8')
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, f"{name}-{hashlib.sha1(key).hexdigest()[:12]}.bin")
+
+    def _source_hash(self, path):
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).digest()
+
+    def _read(self, cache_path, path, stat):
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < HEADER.size:
+            return None
+        magic, version, flags, width, height, mtime_ns, source_size, digest = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            return None
+        if self.validate == 'hash':
+            if digest != self._source_hash(path):
+                return None
+        elif mtime_ns != stat.st_mtime_ns or source_size != stat.st_size:
+            return None
+        pixels = memoryview(data)[HEADER.size:]
+        if flags & FLAG_ZLIB:
+            pixels = zlib.decompress(pixels)
+        fmt = 'RGBA' if flags & FLAG_ALPHA else 'RGB'
+        if len(pixels) != width * height * len(fmt):
+            return None
+        return pygame.image.frombuffer(pixels, (width, height), fmt)
+
+    def _write(self, cache_path, path, stat, surface, alpha):
+        fmt = 'RGBA' if alpha else 'RGB'
+        pixels = pygame.image.tobytes(surface, fmt)
+        flags = FLAG_ALPHA if alpha else 0
+        if self.compress:
+            pixels = zlib.compress(pixels, 1)
+            flags |= FLAG_ZLIB
+        header = HEADER.pack(MAGIC, VERSION, flags, surface.get_width(), surface.get_height(),
+                             stat.st_mtime_ns, stat.st_size, self._source_hash(path))
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Grava num arquivo temporário e renomeia, para nunca deixar um cache pela metade
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(header)
+                f.write(pixels)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Sem permissão de escrita: o jogo continua, só não fica em cache
@@ -0,0 +1,164 @@
+import time
+import pygame
+from config import * # Importa as constantes
+
+#==============================================================================
+# GERENCIADOR DE ÁUDIO (CANAIS RESERVADOS, LIMITE DE VOZES E ROUBO POR PRIORIDADE)
+#==============================================================================
+class SoundSpec:
+    def __init__(self, name, sound, priority=0, max_voices=None, min_interval_ms=0):
+        self.name = name
+        self.sound = sound
+        self.priority = priority
+        self.max_voices = max_voices
+        self.min_interval = min_interval_ms / 1000.0
+        self.last_trigger = float('-inf')
+
+
+class BoundSound:
+    """Som preso ao gerenciador: quem recebe só chama play(), como num pygame.mixer.Sound."""
+    def __init__(self, manager, name):
+        self.manager = manager
+        self.name = name
+
+    def play(self):
+        return self.manager.play(self.name)
+
+
+class AudioManager:
+    """Decide em qual canal do mixer cada efeito toca, ou se ele não toca.
+
+    Os `reserved` primeiros canais ficam fora da alocação automática e são
+    usados só por loops (o motor), que assim nunca são cortados. Para os
+    efeitos, em ordem:
+      1. disparos do mesmo som mais próximos que `min_interval_ms` são ignorados;
+      2. com `max_voices` vozes do som tocando, a mais antiga delas é reiniciada;
+      3. sem canal livre, rouba o canal do efeito de menor prioridade (o mais
+         antigo entre os empatados), desde que não seja mais prioritário que o novo.
+    Sons ainda não registrados (o AssetLoader ainda não os carregou) são
+    ignorados; um loop pedido antes disso começa quando o som é registrado.
+    Funciona com o driver de áudio dummy do SDL (modo headless).
+    """
+    def __init__(self, channels=AUDIO_CHANNELS, reserved=AUDIO_RESERVED_CHANNELS, clock=time.perf_counter):
+        self.clock = clock
+        pygame.mixer.set_num_channels(channels)
+        pygame.mixer.set_reserved(reserved)
+        self.loop_channels = [pygame.mixer.Channel(i) for i in range(reserved)]
+        self.effect_channels = [pygame.mixer.Channel(i) for i in range(reserved, channels)]
+        self.specs = {}
+        self.playing = {}  # canal de efeito -> (spec, início)
+        self.loops = {}    # nome -> canal reservado
+        self.pending_loops = set()  # loops pedidos antes de o som ser registrado
+        self.min_interval_floor = 0.0  # s; piso do min_interval de todos os efeitos (throttle())
+        # Contadores
+        self.requested = 0
+        self.played = 0
+        self.rate_limited = 0
+        self.capped = 0    # reinícios de uma voz do mesmo som (limite de vozes)
+        self.stolen = 0    # canais tirados de um som de menor prioridade
+        self.dropped = 0   # sem canal e nada de prioridade menor para roubar
+        self.peak_busy = 0
+
+    def register(self, name, sound, priority=0, max_voices=None, min_interval_ms=0):
+        self.specs[name] = SoundSpec(name, sound, priority, max_voices, min_interval_ms)
+        if name in self.pending_loops:
+            self.pending_loops.discard(name)
+            self.play_loop(name)
+
+    def sound(self, name):
+        return BoundSound(self, name)
+
+    def throttle(self, min_interval_ms):
+        """Disparos do mesmo efeito nunca mais próximos que `min_interval_ms` (0 desliga)."""
+        self.min_interval_floor = min_interval_ms / 1000.0
+
+    # --- Loops em canais reservados ---
+    def play_loop(self, name):
+        if name not in self.specs:
+            self.pending_loops.add(name)
+            return
+        if name not in self.loops:
+            if len(self.loops) == len(self.loop_channels):
+                raise RuntimeError("sem canal reservado livre para o loop " + name)
+            self.loops[name] = self.loop_channels[len(self.loops)]
+        channel = self.loops[name]
+        if channel.get_sound() is not self.specs[name].sound or not channel.get_busy():
+            channel.play(self.specs[name].sound, loops=-1)
+
+    def stop_loop(self, name):
+        self.pending_loops.discard(name)
+        if name in self.loops:
+            self.loops[name].stop()
+
+    # --- Efeitos ---
+    def _voices(self, spec):
+        """Canais que ainda tocam `spec`, do mais antigo para o mais novo."""
+        voices = []
+        for channel, (playing, started) in list(self.playing.items()):
+            if not channel.get_busy() or channel.get_sound() is not playing.sound:
+                del self.playing[channel]
+            elif playing is spec:
+                voices.append((started, channel))
+        voices.sort(key=lambda voice: voice[0])
+        return [channel for _, channel in voices]
+
+    def _free_channel(self):
+        # Não usa pygame.mixer.find_channel(): ele também devolve os canais
+        # reservados e cria outro objeto Channel a cada chamada (as chaves de
+        # `playing` precisam ser sempre os mesmos objetos)
+        for channel in self.effect_channels:
+            if not channel.get_busy():
+                return channel
+        return None
+
+    def _steal(self, spec):
+        victim = None
+        for channel, (playing, started) in self.playing.items():
+            if playing.priority > spec.priority:
+                continue
+            key = (playing.priority, started)
+            if victim is None or key < victim[0]:
+                victim = (key, channel)
+        return None if victim is None else victim[1]
+
+    def play(self, name):
+        spec = self.specs.get(name)
+        self.requested += 1
+        if spec is None:
+            self.dropped += 1 # Som ainda carregando
+            return None
+        now = self.clock()
+        if now - spec.last_trigger < max(spec.min_interval, self.min_interval_floor):
+            self.rate_limited += 1
+            return None
+        spec.last_trigger = now
+
+        voices = self._voices(spec)
+        if spec.max_voices is not None and len(voices) >= spec.max_voices:
+            channel = voices[0]
+            self.capped += 1
+        else:
+            channel = self._free_channel()
+            if channel is None:
+                channel = self._steal(spec)
+                if channel is None:
+                    self.dropped += 1
+                    return None
+                self.stolen += 1
+        channel.play(spec.sound)
+        self.playing[channel] = (spec, now)
+        self.played += 1
+        self.peak_busy = max(self.peak_busy, self.busy())
+        return channel
+
+    def busy(self):
+        return sum(channel.get_busy() for channel in self.effect_channels)
+
+    def stop_all(self):
+        pygame.mixer.stop()
+        self.playing.clear()
+
+    def stats(self):
+        return {'requested': self.requested, 'played': self.played, 'rate_limited': self.rate_limited,
+                'capped': self.capped, 'stolen': self.stolen, 'dropped': self.dropped,
+                'busy': self.busy(), 'peak_busy': self.peak_busy}
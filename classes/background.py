@@ -0,0 +1,115 @@
+import numpy as np
+import pygame
+from config import * # Importa as constantes
+
+#==============================================================================
+# FUNDO ANIMADO COMPACTO (QUADRO-CHAVE + BLOCOS QUE MUDAM ENTRE QUADROS)
+#==============================================================================
+class BackgroundLoop:
+    """Fundo animado guardado como o primeiro quadro mais, para cada troca de
+    quadro, só os blocos de `tile` x `tile` pixels que mudam (blocos vizinhos
+    viram um retângulo só).
+
+    Os quadros chegam por append() (o AssetLoader entrega um por vez), são
+    cortados no tamanho da tela (e, com `view_size`, escalados uma vez para a
+    janela, ver classes/display.py) e descartados depois de comparados com o
+    anterior. `image` é uma superfície só, atualizada no lugar por update();
+    para o AnimationScheduler o objeto se passa pela lista de quadros (todos
+    os itens são `image`), e ele só cuida de `current_frame`.
+    """
+    def __init__(self, count, size=(SCREEN_WIDTH, SCREEN_HEIGHT), tile=BACKGROUND_TILE, view_size=None):
+        self.count = count  # quadros esperados; depois do último o anterior não é mais guardado
+        self.crop = pygame.Rect((0, 0), size)
+        self.rect = pygame.Rect((0, 0), view_size or size)
+        self.tile = tile
+        self.keyframe = None
+        self.image = None
+        self.last = None    # último quadro recebido, para comparar com o próximo
+        self.deltas = []    # deltas[k]: [(retângulo, posição), ...] para ir do quadro k ao k+1
+        self.current_frame = 0
+        self.shown = 0      # quadro que está em `image`
+        # Contadores
+        self.pixels_applied = 0  # pixels copiados para `image` pelas trocas
+        self.full_copies = 0
+
+    def __len__(self):
+        return len(self.deltas) + (self.keyframe is not None)
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.image
+
+    def alive(self):
+        return True
+
+    def append(self, frame):
+        frame = frame.subsurface(self.crop.clip(frame.get_rect()))
+        frame = frame.copy() if self.rect.size == self.crop.size else \
+            pygame.transform.smoothscale(frame, self.rect.size)
+        if self.keyframe is None:
+            self.keyframe = frame
+            self.image = frame.copy()
+        else:
+            self.deltas.append(self._diff(self.last, frame))
+        self.last = frame if len(self) < self.count else None
+
+    def _diff(self, before, after):
+        tile = self.tile
+        width, height = after.get_size()
+        old = pygame.surfarray.pixels2d(before)
+        new = pygame.surfarray.pixels2d(after)
+        # Um booleano por bloco: algum pixel dele mudou?
+        changed = np.logical_or.reduceat(old != new, np.arange(0, width, tile), axis=0)
+        changed = np.logical_or.reduceat(changed, np.arange(0, height, tile), axis=1)
+        del old, new  # Solta o lock das superfícies
+        return [(after.subsurface(rect).copy(), rect.topleft) for rect in self._merge(changed)]
+
+    def _merge(self, changed):
+        """Junta os blocos marcados em retângulos: sequências na mesma faixa e,
+        entre faixas seguidas, sequências com as mesmas colunas (menos blits)."""
+        tile = self.tile
+        rects = []
+        growing = {}  # (coluna inicial, coluna final) -> retângulo que ainda pode crescer para baixo
+        for row in range(changed.shape[1]):
+            columns = np.flatnonzero(changed[:, row])
+            # Quebra as colunas marcadas em sequências contíguas
+            breaks = np.flatnonzero(np.diff(columns) != 1) + 1
+            runs = [(run[0], run[-1] + 1) for run in np.split(columns, breaks) if len(run)]
+            still_growing = {}
+            for run in runs:
+                rect = growing.pop(run, None)
+                if rect is None:
+                    rect = pygame.Rect(run[0] * tile, row * tile, (run[1] - run[0]) * tile, tile)
+                else:
+                    rect.height += tile
+                still_growing[run] = rect
+            rects.extend(growing.values())
+            growing = still_growing
+        rects.extend(growing.values())
+        return [rect.clip(self.rect) for rect in rects]
+
+    def update(self):
+        """Leva `image` até `current_frame`. Devolve as áreas que mudaram."""
+        target = self.current_frame
+        if target == self.shown or self.keyframe is None:
+            return []
+        full = target < self.shown
+        if full:
+            # Volta ao início (fim do loop ou jogo novo): copia o quadro-chave inteiro
+            self.image.blit(self.keyframe, (0, 0))
+            self.shown = 0
+            self.full_copies += 1
+            self.pixels_applied += self.rect.width * self.rect.height
+        changed = []
+        while self.shown < target:
+            rects = self.image.blits(self.deltas[self.shown])
+            self.pixels_applied += sum(rect.width * rect.height for rect in rects)
+            changed.extend(rects)
+            self.shown += 1
+        return [self.rect] if full else changed
+
+    def memory(self):
+        """Bytes de pixels guardados (quadro-chave, imagem atual e retângulos das trocas)."""
+        surfaces = [self.keyframe, self.image, self.last] + [block for delta in self.deltas for block, _ in delta]
+        return sum(s.get_height() * s.get_pitch() for s in surfaces if s is not None)
@@ -0,0 +1,160 @@
+import argparse
+import csv
+import itertools
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from config import * # Importa as constantes
+from classes.controls import ScriptedInput, BotPilot, sweep_and_fire
+from classes.timestep import sim_clock
+
+#==============================================================================
+# SIMULAÇÕES EM LOTE (MUITAS PARTIDAS HEADLESS EM PARALELO)
+#==============================================================================
+# Piloto -> função que cria a fonte de entrada para o jogo
+PILOTS = {
+    'bot': BotPilot,
+    'sweep': lambda game: ScriptedInput(sweep_and_fire),
+    'idle': lambda game: ScriptedInput(),
+}
+COUNTS = ('enemies', 'bombers', 'player_shots', 'enemy_shots', 'explosions')
+PERCENTILES = (50, 95, 99)
+
+_game = None  # Um jogo por processo, reaproveitado entre as partidas
+
+
+def _worker_game():
+    global _game
+    if _game is None:
+        from main import Game  # Importado aqui: só os processos do pool abrem o pygame
+        _game = Game(headless=True, record=False)
+        _game.profiler.enabled = False
+    return _game
+
+
+def run_session(seed, pilot='bot', wave_profile=WAVE_PROFILE, max_seconds=BATCH_MAX_SECONDS, draw=False):
+    """Uma partida completa, passo a passo e sem esperar o relógio. Devolve o resumo.
+
+    Cada chamada de Game.step recebe o tempo de exatamente um passo fixo, como
+    um frame do jogo a SIM_HZ: os assets que faltam continuam chegando e, com
+    `draw`, a tela é desenhada com a mesma interpolação do jogo. O custo medido
+    é o do frame inteiro, por passo.
+    """
+    game = _worker_game()
+    game.seed = seed
+    game.wave_profile = wave_profile
+    game.input_source = PILOTS[pilot](game)
+    game.start_new_game()
+    step = game.timestep.step
+    costs = []
+    peaks = dict.fromkeys(COUNTS, 0)
+    clock = time.perf_counter
+    for _ in range(int(max_seconds * SIM_HZ)):
+        started = clock()
+        game.step(step, draw=draw)
+        costs.append(clock() - started)
+        if game.game_state != "playing":
+            break
+        counts = game.entity_counts()
+        for name in COUNTS:
+            if counts[name] > peaks[name]:
+                peaks[name] = counts[name]
+    percentiles = np.percentile(costs, PERCENTILES) * 1000.0
+    summary = {
+        'seed': seed,
+        'pilot': pilot,
+        'wave_profile': wave_profile,
+        'score': game.score,
+        'survived_s': sim_clock.ms / 1000.0,
+        'died': game.game_state != "playing",
+        'steps': len(costs),
+        'max_ms': max(costs) * 1000.0,
+    }
+    summary.update({f"p{p}_ms": float(value) for p, value in zip(PERCENTILES, percentiles)})
+    summary.update({f"peak_{name}": peaks[name] for name in COUNTS})
+    return summary
+
+
+def _run(job):
+    return run_session(*job)
+
+
+def run_batch(seeds, pilots=('bot',), wave_profiles=(WAVE_PROFILE,), max_seconds=BATCH_MAX_SECONDS, draw=False,
+              workers=None):
+    """Roda cada seed com cada piloto e perfil, distribuído entre `workers` processos."""
+    jobs = [(seed, pilot, profile, max_seconds, draw)
+            for pilot, profile in itertools.product(pilots, wave_profiles) for seed in seeds]
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run, jobs, chunksize=max(1, len(jobs) // (workers * 8))))
+
+
+def aggregate(results):
+    """Uma linha por (piloto, perfil): pontos, sobrevivência, picos e custo por passo."""
+    groups = {}
+    for result in results:
+        groups.setdefault((result['pilot'], result['wave_profile']), []).append(result)
+    rows = []
+    for (pilot, profile), runs in groups.items():
+        scores = [run['score'] for run in runs]
+        survived = [run['survived_s'] for run in runs]
+        rows.append({
+            'pilot': pilot,
+            'wave_profile': profile,
+            'runs': len(runs),
+            'died_pct': 100.0 * sum(run['died'] for run in runs) / len(runs),
+            'score_mean': statistics.mean(scores),
+            'score_p90': float(np.percentile(scores, 90)),
+            'survived_mean_s': statistics.mean(survived),
+            'survived_median_s': statistics.median(survived),
+            # Custo: mediana das partidas para o p50, a pior partida para o p99 e o máximo
+            'p50_ms': statistics.median(run['p50_ms'] for run in runs),
+            'p99_ms': max(run['p99_ms'] for run in runs),
+            'max_ms': max(run['max_ms'] for run in runs),
+            **{f"peak_{name}": max(run[f"peak_{name}"] for run in runs) for name in COUNTS},
+        })
+    return rows
+
+
+def print_report(rows, elapsed, steps):
+    columns = list(rows[0])
+    print(f"\n== {sum(row['runs'] for row in rows)} partidas, {steps} passos em {elapsed:.1f} s "
+          f"({steps / SIM_HZ / elapsed:.0f}x o tempo real) ==")
+    for row in rows:
+        for name in columns:
+            value = row[name]
+            print(f"{name:>18}: {value:.3f}" if isinstance(value, float) else f"{name:>18}: {value}")
+        print()
+
+
+def write_csv(path, results):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]))
+        writer.writeheader()
+        writer.writerows(results)
+
+
+if __name__ == '__main__':
+    # Uso: python -m classes.batch --runs 1000 --pilots bot sweep --profiles normal crescente --csv partidas.csv
+    parser = argparse.ArgumentParser(description="Roda muitas partidas headless em paralelo e resume os resultados.")
+    parser.add_argument("--runs", type=int, default=100, help="partidas por piloto e perfil")
+    parser.add_argument("--first-seed", type=int, default=1)
+    parser.add_argument("--pilots", nargs="+", default=['bot'], choices=list(PILOTS))
+    parser.add_argument("--profiles", nargs="+", default=[WAVE_PROFILE])
+    parser.add_argument("--max-seconds", type=float, default=BATCH_MAX_SECONDS, help="tempo simulado máximo por partida")
+    parser.add_argument("--draw", action="store_true", help="também desenha cada passo (mede o custo do desenho)")
+    parser.add_argument("--workers", type=int, default=None, help="processos (padrão: um por núcleo)")
+    parser.add_argument("--csv", help="grava o resumo de cada partida neste arquivo")
+    args = parser.parse_args()
+    started = time.perf_counter()
+    results = run_batch(range(args.first_seed, args.first_seed + args.runs), args.pilots, args.profiles,
+                        args.max_seconds, args.draw, args.workers)
+    elapsed = time.perf_counter() - started
+    print_report(aggregate(results), elapsed, sum(result['steps'] for result in results))
+    if args.csv:
+        write_csv(args.csv, results)
+        print(f"Resumo de cada partida em {args.csv}")
@@ -0,0 +1,34 @@
+#==============================================================================
+# RAIO DE COLISÃO
+#==============================================================================
+def sprite_radius(sprite):
+    """Mesmo raio que pygame.sprite.collide_circle usa.
+
+    Calculado do rect a cada chamada (não é guardado no sprite), para
+    acompanhar sprites animados cujo rect muda de tamanho.
+    """
+    radius = getattr(sprite, 'radius', None)
+    if radius is None:
+        radius = 0.5 * ((sprite.rect.width ** 2 + sprite.rect.height ** 2) ** 0.5)
+    return radius
+
+#==============================================================================
+# COLISÃO POR MÁSCARA (PIXELS), DEPOIS DE UM FILTRO POR CÍRCULO
+#==============================================================================
+def frame_mask(sprite):
+    """Máscara do quadro atual do sprite, calculada uma vez por quadro da animação."""
+    return sprite.animation.masks[sprite.current_frame]
+
+def collide_circle_mask(left, right):
+    """Como collide_circle, mas o par só colide se algum pixel opaco se sobrepõe.
+
+    O círculo (mesmo raio de collide_circle) descarta quase todos os pares
+    antes de olhar as máscaras.
+    """
+    dx = right.rect.centerx - left.rect.centerx
+    dy = right.rect.centery - left.rect.centery
+    reach = sprite_radius(left) + sprite_radius(right)
+    if dx * dx + dy * dy > reach * reach:
+        return False
+    offset = (right.rect.x - left.rect.x, right.rect.y - left.rect.y)
+    return frame_mask(left).overlap(frame_mask(right), offset) is not None
@@ -0,0 +1,77 @@
+import itertools
+from classes.projectiles import ENEMY
+
+#==============================================================================
+# FONTES DE ENTRADA ALTERNATIVAS (SEM TECLADO / SEM ARDUINO)
+#==============================================================================
+class ScriptedInput:
+    """Fonte de entrada roteirizada: devolve um comando (dx, dy, atirar) por frame.
+
+    Aceita uma lista de comandos (repetida em loop) ou uma função que recebe o
+    número do frame e devolve o comando.
+    """
+    def __init__(self, script=None, loop=True):
+        self.frame = 0
+        if script is None:
+            script = [(0, 0, False)]
+        if callable(script):
+            self._next = script
+        else:
+            commands = itertools.cycle(script) if loop else iter(script)
+            self._next = lambda frame: next(commands, (0, 0, False))
+
+    def poll(self):
+        dx, dy, shoot = self._next(self.frame)
+        self.frame += 1
+        return dx, dy, bool(shoot)
+
+
+def sweep_and_fire(frame):
+    """Piloto simples para testes: varre a tela de um lado a outro atirando sempre."""
+    dx = -1 if (frame // 60) % 2 else 1
+    return dx, 0, True
+
+
+class BotPilot:
+    """Piloto automático para simulações em lote (classes/batch.py).
+
+    Desvia do tiro inimigo mais próximo quando ele chega perto; senão se
+    alinha com o inimigo mais baixo da tela. Atira quando há um inimigo à
+    frente e sobra calor para mais de um tiro. Só olha o estado do jogo,
+    então a partida continua reproduzível pela seed.
+    """
+    def __init__(self, game, danger=120):
+        self.game = game
+        self.danger = danger
+
+    def poll(self):
+        game = self.game
+        player = game.player
+        px, py = player.rect.center
+        dx, dy = 0, 0
+        threat = self.nearest_shot(game.projectiles, px, py)
+        if threat is not None:
+            # Sai para o lado oposto ao tiro (e desce, se ele vem de cima)
+            dx = 1 if threat[0] <= px else -1
+            dy = 1 if threat[1] < py else 0
+        else:
+            target = max(game.enemies, key=lambda enemy: enemy.rect.bottom, default=None)
+            if target is not None and abs(target.rect.centerx - px) > player.speed / 2:
+                dx = 1 if target.rect.centerx > px else -1
+        ahead = any(abs(enemy.rect.centerx - px) < enemy.rect.width / 2 and enemy.rect.bottom < py
+                    for enemy in game.enemies)
+        shoot = ahead and player.heat <= player.max_heat - 2 * player.heat_per_shot
+        return dx, dy, shoot
+
+    def nearest_shot(self, projectiles, px, py):
+        n = projectiles.count
+        if n == 0:
+            return None
+        pos = projectiles.pos[:n][projectiles.owner[:n] == ENEMY]
+        if len(pos) == 0:
+            return None
+        distance = ((pos - (px, py)) ** 2).sum(axis=1)
+        nearest = int(distance.argmin())
+        if distance[nearest] > self.danger ** 2:
+            return None
+        return pos[nearest]
@@ -0,0 +1,110 @@
+import pygame
+from config import * # Importa as constantes
+from classes.rendering import DirtyRenderer
+
+#==============================================================================
+# JANELA DE QUALQUER TAMANHO (RESOLUÇÃO INTERNA FIXA)
+#==============================================================================
+class Display:
+    """Janela de qualquer tamanho para um jogo que desenha em `internal_size`.
+
+    A imagem ocupa a maior área da janela com a mesma proporção (`viewport`;
+    o resto fica preto) e `scale` é o fator entre as duas. Com a janela do
+    tamanho interno, `canvas` é a própria janela e nada muda. Senão o jogo
+    desenha no `canvas` e present() o escala inteiro para a janela, uma vez
+    por frame; ou, no modo 'prescaled', a tela de jogo desenha direto em
+    `view` (a área da janela, ver ScaledView) e present(direct=True) só
+    atualiza a janela.
+    """
+    def __init__(self, window_size=None, internal_size=(SCREEN_WIDTH, SCREEN_HEIGHT), fullscreen=False,
+                 smooth=SCALE_SMOOTH):
+        self.internal_size = tuple(internal_size)
+        self.smooth = smooth
+        self.window = pygame.display.set_mode(window_size or internal_size, pygame.FULLSCREEN if fullscreen else 0)
+        width, height = self.window.get_size()
+        self.scale = min(width / internal_size[0], height / internal_size[1])
+        self.viewport = pygame.Rect(0, 0, round(internal_size[0] * self.scale), round(internal_size[1] * self.scale))
+        self.viewport.center = self.window.get_rect().center
+        self.scaled = self.window.get_size() != self.internal_size
+        if self.scaled:
+            self.window.fill((0, 0, 0))
+            pygame.display.flip()
+            self.canvas = pygame.Surface(self.internal_size).convert()
+            self.view = self.window.subsurface(self.viewport)
+        else:
+            self.canvas = self.view = self.window
+        # Contadores
+        self.scaled_frames = 0
+
+    def present(self, rects=None, direct=False):
+        """Mostra o frame. `rects`: áreas que mudaram (None = tudo), no canvas ou, com `direct`, na view."""
+        if self.scaled and not direct:
+            if self.viewport.size == self.internal_size:
+                self.view.blit(self.canvas, (0, 0))
+            elif self.smooth:
+                pygame.transform.smoothscale(self.canvas, self.viewport.size, self.view)
+            else:
+                pygame.transform.scale(self.canvas, self.viewport.size, self.view)
+            self.scaled_frames += 1
+            pygame.display.update(self.viewport)
+        elif rects is None:
+            pygame.display.flip()
+        else:
+            offset = self.viewport.topleft
+            pygame.display.update([rect.move(offset) for rect in rects] if offset != (0, 0) else rects)
+
+    def to_internal(self, pos):
+        """Posição da janela (ex.: do mouse) em coordenadas do jogo."""
+        return ((pos[0] - self.viewport.x) / self.scale, (pos[1] - self.viewport.y) / self.scale)
+
+#==============================================================================
+# TELA DE JOGO NA RESOLUÇÃO DA JANELA (ASSETS ESCALADOS UMA VEZ)
+#==============================================================================
+class ScaledImages(dict):
+    """Superfície original -> cópia escalada, criada na primeira vez que é pedida."""
+    def __init__(self, scale):
+        super().__init__()
+        self.scale = scale
+        # Contadores
+        self.misses = 0  # escalas feitas depois de prescale() (durante o jogo)
+
+    def __missing__(self, surface):
+        self.misses += 1
+        return self._scale(surface)
+
+    def _scale(self, surface):
+        width, height = surface.get_size()
+        size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+        scaled = self[surface] = pygame.transform.smoothscale(surface, size)
+        return scaled
+
+    def prescale(self, surfaces):
+        for surface in surfaces:
+            if surface not in self:
+                self._scale(surface)
+
+    def memory(self):
+        return sum(s.get_height() * s.get_pitch() for s in self.values())
+
+
+class ScaledView:
+    """Onde a tela de jogo é desenhada e em que escala.
+
+    Na escala 1 é o canvas do Display com os assets originais. No modo
+    'prescaled' é a área da janela: as posições do jogo são multiplicadas
+    por `scale` e cada superfície sai de `images`, escalada uma vez; o fundo
+    animado é um BackgroundLoop próprio, montado com os quadros já escalados
+    (`backdrop`, criado por quem carrega os quadros).
+    """
+    def __init__(self, surface, scale=1.0, direct=False):
+        self.surface = surface
+        self.scale = scale
+        self.direct = direct  # True: `surface` é a área da janela (present(direct=True))
+        self.renderer = DirtyRenderer(surface, RENDER_MODE)
+        self.images = ScaledImages(scale) if scale != 1.0 else None
+        self.backdrop = None
+        self.hud = None
+
+    def font(self, size):
+        """Fonte padrão do pygame no tamanho `size` da resolução interna."""
+        return pygame.font.Font(None, round(size * self.scale))
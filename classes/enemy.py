@@ -1,13 +1,17 @@
 import pygame
 import random
-import math
 from config import * # Importa as constantes
-from classes.effects import EnemyBullet
+from classes.timestep import sim_clock
+from classes.projectiles import ENEMY
+from classes.trajectory import PATTERNS
 
 #==============================================================================
 # CLASSE DO INIMIGO
 #==============================================================================
 class Enemy(pygame.sprite.Sprite):
+    kind = 'enemy'     # tipo no TypedGroup e no perfil de ondas
+    score_value = 10
+
     def __init__(self, enemy_anim_frames, target_player):
         super().__init__()
         self.animation_frames = enemy_anim_frames
@@ -17,63 +21,68 @@ class Enemy(pygame.sprite.Sprite):
         
         self.target_player = target_player
         self.shoot_cooldown = random.randint(1500, 3500)
-        self.last_shot_time = pygame.time.get_ticks()
-
-        self.movement_type = random.choice(['straight', 'diagonal', 'curve'])
-        start_x = random.randint(0, SCREEN_WIDTH - self.rect.width)
-        start_y = -self.rect.height
-        self.pos = pygame.math.Vector2(start_x, start_y)
-        self.vel = pygame.math.Vector2(0, 0)
-        if self.movement_type == 'straight': self.vel = pygame.math.Vector2(0, 3)
-        elif self.movement_type == 'diagonal': self.vel = pygame.math.Vector2(random.choice([-2, 2]), 2)
-        elif self.movement_type == 'curve':
-            self.vel = pygame.math.Vector2(0, 2)
-            self.angle = 0
-            self.angle_speed = random.choice([-1, 1]) * 2
-        self.rect.topleft = self.pos
-        self.last_anim_update = pygame.time.get_ticks()
-        self.anim_speed = 75
-
-    def update(self, all_sprites_group, enemy_bullets_group):
-        self.animate()
-        self.pos += self.vel
-        if self.movement_type == 'curve':
-            self.angle += self.angle_speed
-            self.pos.x += math.sin(math.radians(self.angle)) * 3
-        self.rect.topleft = self.pos
+        self.last_shot_time = sim_clock.get_ticks()
+        # Mesmo critério de antes (mais de shoot_cooldown ms desde o último tiro), sem consultar o relógio a cada passo
+        self.next_shot_time = self.last_shot_time + self.shoot_cooldown + 1
+
+        # O padrão de movimento é uma tabela pré-calculada (classes/trajectory.py)
+        self.movement_type = random.choice(list(PATTERNS))
+        variants = PATTERNS[self.movement_type]
+        self.trajectory = variants[0] if len(variants) == 1 else random.choice(variants)
+        self.place(random.randint(0, SCREEN_WIDTH - self.rect.width), -self.rect.height)
+
+    def place(self, x, y):
+        """(Re)começa a trajetória com o canto superior esquerdo em (x, y)."""
+        self.start_x, self.start_y = x, y
+        self.path_index = 0
+        self.path = self.trajectory.table
+        self.rect.topleft = (x, y)
+
+    def predict(self, steps=1):
+        """Canto superior esquerdo daqui a `steps` passos, sem mexer no inimigo."""
+        dx, dy = self.trajectory.offset(self.path_index + steps)
+        return self.start_x + dx, self.start_y + dy
+
+    def update(self, projectiles):
+        self.path_index += 1
+        if self.path_index < len(self.path):
+            dx, dy = self.path[self.path_index]
+        else:
+            dx, dy = self.trajectory.offset(self.path_index)
+        self.rect.topleft = (self.start_x + dx, self.start_y + dy)
         
-        self.try_to_shoot(all_sprites_group, enemy_bullets_group)
+        if sim_clock.ms >= self.next_shot_time:
+            self.try_to_shoot(projectiles)
 
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
 
-    def try_to_shoot(self, all_sprites, enemy_bullets):
-        now = pygame.time.get_ticks()
+    def hit(self):
+        """Chamado quando o inimigo é atingido. Devolve True se ele foi destruído."""
+        self.kill()
+        return True
+
+    def try_to_shoot(self, projectiles):
+        now = sim_clock.get_ticks()
         if self.target_player.alive() and now - self.last_shot_time > self.shoot_cooldown:
             self.last_shot_time = now
+            self.next_shot_time = now + self.shoot_cooldown + 1
             player_pos = pygame.math.Vector2(self.target_player.rect.center)
             enemy_pos = pygame.math.Vector2(self.rect.center)
             try:
                 direction = (player_pos - enemy_pos).normalize()
             except ValueError:
                 direction = pygame.math.Vector2(0, 1)
-            bullet = EnemyBullet(enemy_pos, direction)
-            all_sprites.add(bullet)
-            enemy_bullets.add(bullet)
-
-    def animate(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_anim_update > self.anim_speed:
-            self.last_anim_update = now
-            self.current_frame = (self.current_frame + 1) % len(self.animation_frames)
-            old_center = self.rect.center
-            self.image = self.animation_frames[self.current_frame]
-            self.rect = self.image.get_rect(center=old_center)
+            projectiles.spawn(enemy_pos.x, enemy_pos.y, direction.x, direction.y, ENEMY_BULLET_SPEED, ENEMY)
+
 
 #==============================================================================
 # CLASSE DO BOMBARDDEIRO (COM MOVIMENTO DE CIMA PARA BAIXO)
 #==============================================================================
 class Bomber(pygame.sprite.Sprite):
+    kind = 'bomber'
+    score_value = 50
+
     def __init__(self, bomber_anim_frames):
         super().__init__()
         self.animation_frames = bomber_anim_frames
@@ -93,15 +102,12 @@ class Bomber(pygame.sprite.Sprite):
 
         # Lógica de tiro radial 
         self.shoot_cooldown = 1200
-        self.last_shot_time = pygame.time.get_ticks()
+        self.last_shot_time = sim_clock.get_ticks()
         self.bullets_to_fire = 12
+        angle_step = 360 / self.bullets_to_fire
+        self.volley_directions = [tuple(pygame.math.Vector2(1, 0).rotate(i * angle_step)) for i in range(self.bullets_to_fire)]
 
-        # Lógica de animação 
-        self.last_anim_update = pygame.time.get_ticks()
-        self.anim_speed = 100
-
-    def update(self, all_sprites_group, enemy_bullets_group):
-        self.animate()
+    def update(self, projectiles):
         self.rect.y += self.speed_y
         
         #  verificação de saída da tela agora é para baixo 
@@ -109,33 +115,18 @@ class Bomber(pygame.sprite.Sprite):
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
         
-        self.try_to_shoot(all_sprites_group, enemy_bullets_group)
+        self.try_to_shoot(projectiles)
 
-    def try_to_shoot(self, all_sprites, enemy_bullets):
-        now = pygame.time.get_ticks()
+    def try_to_shoot(self, projectiles):
+        now = sim_clock.get_ticks()
         if now - self.last_shot_time > self.shoot_cooldown:
             self.last_shot_time = now
-            angle_step = 360 / self.bullets_to_fire
-            for i in range(self.bullets_to_fire):
-                angle = i * angle_step
-                direction = pygame.math.Vector2(1, 0).rotate(angle)
-                bullet = EnemyBullet(self.rect.center, direction)
-                all_sprites.add(bullet)
-                enemy_bullets.add(bullet)
+            projectiles.spawn_many(self.rect.center, self.volley_directions, ENEMY_BULLET_SPEED, ENEMY)
     
     def hit(self):
-        """Chamado quando o bombardeiro é atingido."""
+        """Chamado quando o bombardeiro é atingido. Devolve True se ele foi destruído."""
         self.health -= 1
         if self.health <= 0:
             self.kill()
             return True
         return False
-
-    def animate(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_anim_update > self.anim_speed:
-            self.last_anim_update = now
-            self.current_frame = (self.current_frame + 1) % len(self.animation_frames)
-            old_center = self.rect.center
-            self.image = self.animation_frames[self.current_frame]
-            self.rect = self.image.get_rect(center=old_center)
\ No newline at end of file
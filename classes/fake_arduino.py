@@ -0,0 +1,79 @@
+import os
+import select
+import threading
+import time
+
+from config import * # Importa as constantes
+from classes.protocol import encode_input
+
+#==============================================================================
+# ARDUINO FALSO EM UM PSEUDO-TERMINAL (PTY), PARA TESTAR SEM HARDWARE
+#==============================================================================
+class FakeArduino:
+    """Imita o controle.ino: envia uma amostra do controle a cada `interval` s.
+
+    Com protocol='binary' as amostras saem como quadros de classes/protocol.py;
+    com 'text', como as linhas "x,y,btn,shoot" do sketch antigo.
+
+    `port` é o caminho do pty que o jogo (ou um teste) abre com serial.Serial.
+    `sample(seq)` devolve os quatro valores da amostra número `seq`; tudo o que
+    o jogo escreve de volta fica em `received`. Só funciona em sistemas POSIX.
+    """
+    def __init__(self, interval=0.05, sample=None, protocol=SERIAL_PROTOCOL):
+        self.interval = interval
+        self.protocol = protocol
+        self.sample = sample or (lambda seq: (512, 512, 1, 1))
+        self.master, self._slave = os.openpty()
+        self.port = os.ttyname(self._slave)
+        self.sent = []          # (seq, instante do envio em time.perf_counter())
+        self.received = bytearray()
+        self.bytes_sent = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='fake-arduino', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        os.close(self.master)
+        os.close(self._slave)
+
+    def write(self, data):
+        os.write(self.master, data)
+        self.bytes_sent += len(data)
+
+    def _run(self):
+        seq = 0
+        next_send = time.perf_counter()
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            if now >= next_send:
+                values = self.sample(seq)
+                if self.protocol == 'binary':
+                    self.write(encode_input(seq, *values))
+                else:
+                    self.write((",".join(str(v) for v in values) + "\r\n").encode('ascii'))
+                self.sent.append((seq, now))
+                seq += 1
+                next_send += self.interval
+            timeout = max(0.0, next_send - time.perf_counter())
+            readable, _, _ = select.select([self.master], [], [], timeout)
+            if readable:
+                try:
+                    self.received += os.read(self.master, 4096)
+                except OSError:
+                    break
+
+
+if __name__ == '__main__':
+    # Uso: python -m classes.fake_arduino  (depois passe a porta para Game(serial_port=...))
+    fake = FakeArduino().start()
+    print(f"Arduino falso em {fake.port} (Ctrl+C para sair)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        fake.stop()
@@ -0,0 +1,85 @@
+from collections import deque
+from config import * # Importa as constantes
+
+#==============================================================================
+# GOVERNADOR DE QUALIDADE (DESCE E SOBE NÍVEIS CONFORME O TEMPO DOS FRAMES)
+#==============================================================================
+class QualityTransition:
+    def __init__(self, frame, previous, level, frame_ms):
+        self.frame = frame          # frame em que o nível mudou
+        self.previous = previous
+        self.level = level
+        self.frame_ms = frame_ms    # p90 da janela (descida) ou último frame (subida); None se forçado
+
+    def __repr__(self):
+        return f"QualityTransition(frame={self.frame}, {self.previous} -> {self.level}, frame_ms={self.frame_ms})"
+
+
+class QualityGovernor:
+    """Escolhe o nível de qualidade a partir do tempo de trabalho dos frames.
+
+    Nível 0 é a qualidade cheia; o nível N desliga os N primeiros itens de
+    `levels` (ver QUALITY_LEVELS). Desce um nível quando o p90 dos últimos
+    `window` frames passa de `budget_ms`, e sobe um quando `recover_frames`
+    frames seguidos ficam abaixo de `headroom` * `budget_ms`. Depois de cada
+    troca a janela recomeça, para medir o efeito do nível novo.
+
+    O governador só decide; quem aplica os níveis são os `listeners`
+    (função(anterior, novo)). As trocas ficam em `transitions`.
+    """
+    def __init__(self, levels=QUALITY_LEVELS, budget_ms=QUALITY_BUDGET_MS, window=QUALITY_WINDOW,
+                 headroom=QUALITY_HEADROOM, recover_frames=QUALITY_RECOVER_FRAMES, enabled=QUALITY_GOVERNOR):
+        self.levels = levels
+        self.budget_ms = budget_ms
+        self.recent = deque(maxlen=window)
+        self.headroom = headroom
+        self.recover_frames = recover_frames
+        self.enabled = enabled
+        self.level = 0
+        self.calm = 0          # frames seguidos com folga
+        self.frames = 0
+        self.transitions = []
+        self.listeners = []
+
+    def active(self, name):
+        """True se o item `name` de `levels` está reduzido no nível atual."""
+        return self.level > self.levels.index(name)
+
+    def describe(self, level=None):
+        level = self.level if level is None else level
+        return "cheia" if level == 0 else ", ".join(self.levels[:level])
+
+    def frame(self, frame_ms):
+        """Registra o tempo de trabalho (ms) de um frame e troca de nível se preciso."""
+        if not self.enabled:
+            return
+        self.frames += 1
+        recent = self.recent
+        recent.append(frame_ms)
+        self.calm = self.calm + 1 if frame_ms < self.budget_ms * self.headroom else 0
+        if self.level < len(self.levels) and len(recent) == recent.maxlen:
+            p90 = sorted(recent)[int(len(recent) * 0.9)]
+            if p90 > self.budget_ms:
+                self.set_level(self.level + 1, p90)
+                return
+        if self.level > 0 and self.calm >= self.recover_frames:
+            self.set_level(self.level - 1, frame_ms)
+
+    def reset(self):
+        """Volta à qualidade cheia e esquece os frames medidos (ex.: ao começar um jogo novo)."""
+        self.set_level(0)
+        self.recent.clear()
+        self.calm = 0
+
+    def set_level(self, level, frame_ms=None):
+        """Vai para `level` (também usado pelo replay, que refaz os níveis gravados)."""
+        level = min(max(level, 0), len(self.levels))
+        if level == self.level:
+            return
+        previous = self.level
+        self.level = level
+        self.recent.clear()
+        self.calm = 0
+        self.transitions.append(QualityTransition(self.frames, previous, level, frame_ms))
+        for listener in self.listeners:
+            listener(previous, level)
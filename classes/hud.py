@@ -0,0 +1,137 @@
+from collections import OrderedDict
+import pygame
+from config import * # Importa as constantes
+
+#==============================================================================
+# CACHE DE TEXTOS RENDERIZADOS (LRU)
+#==============================================================================
+class TextCache:
+    """Guarda cada texto renderizado por (fonte, texto, cor).
+
+    Com mais de `capacity` textos, sai o usado há mais tempo; textos fixos
+    (rótulos, mensagens do game over) ficam sempre no cache.
+    """
+    def __init__(self, capacity=HUD_TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        # Contadores
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color):
+        key = (font, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        surface = self.surfaces[key] = font.render(text, True, color)
+        self.misses += 1
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+
+class GlyphAtlas:
+    """Caracteres renderizados uma vez; um número vira uma sequência de blits."""
+    def __init__(self, font, color, chars="0123456789x"):
+        self.glyphs = {char: font.render(char, True, color) for char in chars}
+        self.height = max(glyph.get_height() for glyph in self.glyphs.values())
+
+    def width(self, text):
+        return sum(self.glyphs[char].get_width() for char in text)
+
+    def layout(self, text, **anchor):
+        """Blits de `text` posicionado como em get_rect(**anchor) e o retângulo ocupado."""
+        rect = pygame.Rect(0, 0, self.width(text), self.height)
+        for name, value in anchor.items():
+            setattr(rect, name, value)
+        x = rect.x
+        blits = []
+        for char in text:
+            glyph = self.glyphs[char]
+            blits.append((glyph, (x, rect.y)))
+            x += glyph.get_width()
+        return blits, rect
+
+    def draw(self, surface, text, **anchor):
+        blits, rect = self.layout(text, **anchor)
+        surface.blits(blits, doreturn=False)
+        return rect
+
+#==============================================================================
+# HUD DA TELA DE JOGO (PONTOS, CALOR E VIDAS)
+#==============================================================================
+class Hud:
+    """Pontos, barra de calor e vidas, sem rasterizar fonte durante o jogo.
+
+    O número dos pontos sai do GlyphAtlas, os rótulos do TextCache e as
+    barras são retângulos. Os blits dos pontos e das vidas só são
+    recalculados quando o valor muda. Calor e vidas são os mesmos valores
+    que send_data_to_arduino manda para o Arduino. Com `scale` (tela de jogo
+    na resolução da janela, classes/display.py) posições e tamanhos são
+    multiplicados por ele; `font` já vem no tamanho escalado.
+    """
+    MAX_LIFE_ICONS = 5  # acima disso: um ícone e "x N"
+
+    def __init__(self, font, text_cache, life_icon, scale=1.0):
+        self.font = font
+        self.scale = scale
+        self.small_font = pygame.font.Font(None, self.px(24))
+        self.text_cache = text_cache
+        self.digits = GlyphAtlas(font, WHITE)
+        self.small_digits = GlyphAtlas(self.small_font, WHITE)
+        height = self.px(24)
+        width = round(life_icon.get_width() * height / life_icon.get_height())
+        self.life_icon = pygame.transform.smoothscale(life_icon, (width, height))
+        self.size = (self.px(SCREEN_WIDTH), self.px(SCREEN_HEIGHT))
+        self.heat_bar = pygame.Rect(self.px(20), self.size[1] - self.px(36), self.px(160), self.px(16))
+        self.score_layout = (None, [], [])  # (pontos, blits, retângulos)
+        self.lives_layout = (None, [], [])
+
+    def px(self, value):
+        return round(value * self.scale)
+
+    def draw(self, surface, score, heat, max_heat, lives):
+        """Desenha o HUD. Devolve as áreas desenhadas (para o DirtyRenderer)."""
+        return self.draw_score(surface, score) + self.draw_heat(surface, heat, max_heat) + \
+            self.draw_lives(surface, lives)
+
+    def draw_score(self, surface, score):
+        if score != self.score_layout[0]:
+            corner = (self.size[0] - self.px(20), self.size[1] - self.px(20))
+            blits, number = self.digits.layout(str(score), bottomright=corner)
+            label = self.text_cache.render(self.font, "Pontos: ", WHITE)
+            label_rect = label.get_rect(bottomright=number.bottomleft)
+            self.score_layout = (score, [(label, label_rect)] + blits, [label_rect, number])
+        _, blits, rects = self.score_layout
+        surface.blits(blits, doreturn=False)
+        return rects
+
+    def draw_heat(self, surface, heat, max_heat):
+        bar = self.heat_bar
+        fraction = min(max(heat / max_heat, 0.0), 1.0)
+        if fraction > 0:
+            color = pygame.Color(HUD_HEAT_COLOR).lerp(RED, fraction)
+            pygame.draw.rect(surface, color, (bar.x, bar.y, round(bar.width * fraction), bar.height))
+        label = self.text_cache.render(self.small_font, "Calor", WHITE)
+        return [pygame.draw.rect(surface, WHITE, bar, max(1, self.px(1))), surface.blit(label, label.get_rect(bottomleft=bar.topleft))]
+
+    def draw_lives(self, surface, lives):
+        if lives != self.lives_layout[0]:
+            self.lives_layout = (lives,) + self.layout_lives(lives)
+        _, blits, rects = self.lives_layout
+        surface.blits(blits, doreturn=False)
+        return rects
+
+    def layout_lives(self, lives):
+        icon = self.life_icon
+        x, bottom = self.heat_bar.right + self.px(16), self.heat_bar.bottom
+        if lives > self.MAX_LIFE_ICONS:
+            rect = icon.get_rect(bottomleft=(x, bottom))
+            count, count_rect = self.small_digits.layout(f"x{lives}", bottomleft=(rect.right + self.px(4), bottom))
+            return [(icon, rect)] + count, [rect, count_rect]
+        rects = [icon.get_rect(bottomleft=(x + i * (icon.get_width() + self.px(4)), bottom)) for i in range(lives)]
+        return [(icon, rect) for rect in rects], rects
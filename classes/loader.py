@@ -0,0 +1,148 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from config import * # Importa as constantes
+
+#==============================================================================
+# CARREGAMENTO ASSÍNCRONO DE ASSETS (THREADS + CONVERSÃO EM FATIAS DE TEMPO)
+#==============================================================================
+# Grupos de prioridade, na ordem em que são carregados
+INTRO = 0     # tela de introdução
+GAMEPLAY = 1  # o que start_new_game precisa
+EXTRAS = 2    # o resto do fundo animado e os sons
+
+
+class AssetJob:
+    def __init__(self, key, group, future, finish, in_list):
+        self.key = key
+        self.group = group
+        self.future = future
+        self.finish = finish    # roda na thread principal com o resultado da thread
+        self.in_list = in_list  # True: o asset é um quadro de uma lista (animação)
+
+
+class AssetLoader:
+    """Lê e decodifica os assets em threads e os entrega na thread principal.
+
+    Os pedidos entram em ordem de prioridade (INTRO, GAMEPLAY, EXTRAS) e as
+    threads os pegam nessa ordem. A conversão das superfícies para o formato
+    da tela tem que ser na thread principal: pump() faz isso em fatias de
+    tempo, sempre na ordem dos pedidos, então os quadros de uma animação
+    entram na lista em ordem e um grupo fica pronto só depois dos anteriores.
+    """
+    def __init__(self, asset_cache, assets, workers=ASSET_LOADER_WORKERS):
+        self.cache = asset_cache
+        self.assets = assets
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='assets')
+        self.jobs = deque()
+        self.pending = {INTRO: 0, GAMEPLAY: 0, EXTRAS: 0}
+        self.group = INTRO
+        self.ready_callbacks = []  # (grupo, função)
+        self.load_callbacks = {}   # chave -> [função(chave, asset)]
+        self.lists = {}            # chave -> lista (ou objeto) que recebe os quadros
+        # Contadores
+        self.total = 0
+        self.loaded = 0
+        self.slowest_ms = 0.0      # pump() mais demorado
+
+    # --- Pedidos (na ordem de prioridade) ---
+    def _submit(self, key, group, work, finish, in_list=False):
+        if group < self.group:
+            raise ValueError(f"asset '{key}' pedido no grupo {group} depois do grupo {self.group}")
+        self.group = group
+        self.pending[group] += 1
+        self.total += 1
+        self.jobs.append(AssetJob(key, group, self.pool.submit(work), finish, in_list))
+
+    def image(self, key, path, group, alpha=True, size=None):
+        self._submit(key, group, lambda: self.cache.decode(path, alpha, size),
+                     lambda decoded: self._convert(decoded, alpha, size))
+
+    def frames(self, key, paths, group, alpha=True, size=None, into=None):
+        """Quadros de uma animação: assets[key] é uma lista que cresce conforme eles chegam.
+
+        Com `into` (qualquer objeto com append(), ex.: BackgroundLoop) os quadros
+        vão para ele e não ficam em assets.
+        """
+        if key not in self.lists:
+            if into is None:
+                into = self.assets[key] = []
+            self.lists[key] = into
+        for path in paths:
+            self._submit(key, group, lambda path=path: self.cache.decode(path, alpha, size),
+                         lambda decoded: self._convert(decoded, alpha, size), in_list=True)
+
+    def sound(self, key, path, group):
+        # Sound já fica pronto na thread; não há conversão a fazer
+        self._submit(key, group, lambda: pygame.mixer.Sound(path), lambda sound: sound)
+
+    def _convert(self, decoded, alpha, size):
+        surface, pending = decoded
+        surface = self.cache.convert(surface, alpha, size)
+        if pending is not None:
+            self.pool.submit(self.cache.store, pending, surface, alpha)
+        return surface
+
+    # --- Avisos ---
+    def when_ready(self, group, callback):
+        """Chama `callback()` quando o grupo (e os anteriores) terminar; na hora, se já terminou."""
+        if self.ready(group):
+            callback()
+        else:
+            self.ready_callbacks.append((group, callback))
+
+    def on_load(self, key, callback):
+        """Chama `callback(chave, asset)` a cada asset `key` entregue."""
+        self.load_callbacks.setdefault(key, []).append(callback)
+
+    # --- Thread principal ---
+    def pump(self, budget_ms=ASSET_SLICE_MS):
+        """Entrega os assets já decodificados até gastar `budget_ms`. Devolve quantos entregou."""
+        started = time.perf_counter()
+        deadline = started + budget_ms / 1000.0
+        count = 0
+        jobs = self.jobs
+        while jobs and jobs[0].future.done():
+            self._finish(jobs.popleft())
+            count += 1
+            if time.perf_counter() >= deadline:
+                break
+        if count:
+            self.slowest_ms = max(self.slowest_ms, (time.perf_counter() - started) * 1000.0)
+        return count
+
+    def _finish(self, job):
+        asset = job.finish(job.future.result())
+        if job.in_list:
+            self.lists[job.key].append(asset)
+        else:
+            self.assets[job.key] = asset
+        self.loaded += 1
+        self.pending[job.group] -= 1
+        for callback in self.load_callbacks.get(job.key, ()):
+            callback(job.key, asset)
+        if self.ready_callbacks:
+            waiting = []
+            for group, callback in self.ready_callbacks:
+                if self.ready(group):
+                    callback()
+                else:
+                    waiting.append((group, callback))
+            self.ready_callbacks = waiting
+
+    def ready(self, group=EXTRAS):
+        """True se o grupo e todos os anteriores já foram entregues."""
+        return all(self.pending[g] == 0 for g in range(group + 1))
+
+    def wait(self, group=EXTRAS):
+        """Bloqueia até o grupo (e os anteriores) ficar pronto."""
+        while not self.ready(group):
+            self.jobs[0].future.result()
+            self.pump(float('inf'))
+
+    def progress(self):
+        return self.loaded / self.total if self.total else 1.0
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
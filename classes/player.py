@@ -1,6 +1,6 @@
 import pygame
 from config import * # Importa as constantes
-from classes.effects import Bullet 
+from classes.projectiles import PLAYER
 
 
 #==============================================================================
@@ -25,11 +25,8 @@ class Player(pygame.sprite.Sprite):
         self.heat_per_shot = 13.0
         self.cooldown_rate = 2.5
 
-        self.last_anim_update = pygame.time.get_ticks()
-        self.anim_speed = 10
-
     def update(self, dt, screen):
-        self.animate()
+        # A troca de quadros fica com o AnimationScheduler (classes/animation.py)
         self.cool_down(dt)
         self.rect.clamp_ip(screen.get_rect())
 
@@ -42,22 +39,13 @@ class Player(pygame.sprite.Sprite):
         self.rect.x += dx * self.speed
         self.rect.y += dy * self.speed
 
-    def shoot(self, all_sprites, bullets):
+    def shoot(self, projectiles):
         if self.heat <= (self.max_heat - self.heat_per_shot):
             self.heat += self.heat_per_shot
             if self.heat > self.max_heat:
                 self.heat = self.max_heat
                 
-            bullet = Bullet(self.rect.centerx, self.rect.top, self.bullet_image)
-            all_sprites.add(bullet)
-            bullets.add(bullet)
+            # O tiro nasce com a base encostada no topo do avião
+            bullet_y = self.rect.top - self.bullet_image.get_height() / 2
+            projectiles.spawn(self.rect.centerx, bullet_y, 0, -1, BULLET_SPEED, PLAYER)
             self.gun_sound.play()
-    
-    def animate(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_anim_update > self.anim_speed:
-            self.last_anim_update = now
-            self.current_frame = (self.current_frame + 1) % len(self.animation_frames)
-            old_center = self.rect.center
-            self.image = self.animation_frames[self.current_frame]
-            self.rect = self.image.get_rect(center=old_center)
\ No newline at end of file
@@ -0,0 +1,93 @@
+import pygame
+
+#==============================================================================
+# POOL DE SPRITES (REAPROVEITA INSTÂNCIAS EM VEZ DE CRIAR E DESCARTAR)
+#==============================================================================
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite que volta para o seu pool quando é destruído com kill().
+
+    Subclasses colocam a inicialização em reset(), que é chamado tanto na
+    criação quanto a cada reaproveitamento (o SpritePool exige que exista).
+    """
+    pool = None
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class SpritePool:
+    def __init__(self, sprite_class):
+        if not callable(getattr(sprite_class, 'reset', None)):
+            raise TypeError(f"{sprite_class.__name__} precisa definir reset() para ser reaproveitado")
+        self.sprite_class = sprite_class
+        self.free = []
+        self.instances = []
+        # Contadores de alocação
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.in_pool = False
+            sprite.reset(*args)
+            self.reused += 1
+        else:
+            sprite = self._create(*args)
+        return sprite
+
+    def _create(self, *args):
+        sprite = self.sprite_class(*args)
+        sprite.pool = self
+        sprite.in_pool = False
+        self.instances.append(sprite)
+        self.created += 1
+        return sprite
+
+    def release(self, sprite):
+        if not sprite.in_pool:
+            sprite.in_pool = True
+            self.free.append(sprite)
+
+    def reclaim(self):
+        """Devolve todas as instâncias ao pool (ex.: ao começar um jogo novo)."""
+        for sprite in self.instances:
+            sprite.kill()
+
+    def prefill(self, count, *args):
+        """Cria instâncias de antemão (até `count` no total) para não alocar durante o jogo."""
+        for _ in range(count - len(self.instances)):
+            self.release(self._create(*args))
+
+    @property
+    def live(self):
+        return len(self.instances) - len(self.free)
+
+#==============================================================================
+# CACHE DE SUPERFÍCIES PRÉ-RENDERIZADAS (COMPARTILHADAS)
+#==============================================================================
+class SurfaceCache:
+    """Guarda cada Surface gerada pelo jogo e entrega sempre a mesma instância."""
+    def __init__(self):
+        self.surfaces = {}
+        # Contadores de alocação
+        self.misses = 0
+        self.hits = 0
+
+    def get(self, key, render):
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = render()
+            self.misses += 1
+        else:
+            self.hits += 1
+        return surface
+
+    def circle(self, radius, color):
+        def render():
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            return surface.convert_alpha()
+        return self.get(('circle', radius, color), render)
@@ -0,0 +1,204 @@
+import csv
+import gc
+import json
+import sys
+import time
+from contextlib import nullcontext
+
+import numpy as np
+import pygame
+from config import * # Importa as constantes
+
+#==============================================================================
+# PROFILER DE FRAMES (TEMPO POR FASE, CONTAGEM DE ENTIDADES E ALOCAÇÕES)
+#==============================================================================
+class _Phase:
+    __slots__ = ('profiler', 'column', 'start')
+
+    def __init__(self, profiler, column):
+        self.profiler = profiler
+        self.column = column
+
+    def __enter__(self):
+        self.start = self.profiler.clock()
+
+    def __exit__(self, *exc):
+        profiler = self.profiler
+        end = profiler.clock()
+        row = profiler.row
+        # Uma fase pode rodar mais de uma vez no mesmo frame: soma as durações
+        if profiler.durations[row, self.column] == 0.0:
+            profiler.offsets[row, self.column] = self.start - profiler.frame_start
+        profiler.durations[row, self.column] += end - self.start
+
+
+class FrameProfiler:
+    """Mede cada fase do frame e guarda os últimos `capacity` frames num ring buffer.
+
+    Uso: begin_frame(); `with profiler.phase('nome'): ...`; end_frame(contagens).
+    Por frame ficam o tempo e o início de cada fase, o intervalo real entre
+    frames, a contagem de entidades por grupo e os blocos de memória que o
+    Python alocou (sys.getallocatedblocks) e as coletas do GC.
+    """
+    MAX_PHASES = 32
+    MAX_COUNTERS = 16
+
+    def __init__(self, capacity=PROFILER_FRAMES, enabled=True, clock=time.perf_counter):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.clock = clock
+        self.phases = {}    # nome -> coluna
+        self._phase_objects = {}
+        self.counters = {}  # nome -> coluna
+        self.durations = np.zeros((capacity, self.MAX_PHASES))
+        self.offsets = np.zeros((capacity, self.MAX_PHASES))
+        self.counts = np.zeros((capacity, self.MAX_COUNTERS), dtype=np.int64)
+        self.frame_times = np.zeros(capacity)     # trabalho do frame (s)
+        self.intervals = np.zeros(capacity)       # tempo real desde o frame anterior (s)
+        self.starts = np.zeros(capacity)          # início do frame (s, relógio do profiler)
+        self.allocated = np.zeros(capacity, dtype=np.int64)
+        self.collections = np.zeros(capacity, dtype=np.int64)
+        self.frames = 0  # total de frames registrados (o buffer guarda só os últimos)
+        self.row = 0
+        self.frame_start = 0.0
+        self.overlay = False
+        self._overlay_font = None
+        self._overlay_surface = None
+        self._overlay_updated = 0.0
+
+    # --- Coleta ---
+    def phase(self, name):
+        if not self.enabled:
+            return nullcontext()
+        phase = self._phase_objects.get(name)
+        if phase is None:
+            if len(self.phases) >= self.MAX_PHASES:
+                return nullcontext()
+            self.phases[name] = len(self.phases)
+            phase = self._phase_objects[name] = _Phase(self, self.phases[name])
+        return phase
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = self.clock()
+        self.row = self.frames % self.capacity
+        self.durations[self.row] = 0.0
+        self.offsets[self.row] = 0.0
+        self.counts[self.row] = 0
+        self.intervals[self.row] = now - self.frame_start if self.frames else 0.0
+        self.starts[self.row] = now
+        self.frame_start = now
+        self._blocks = sys.getallocatedblocks()
+        self._gc = sum(stat['collections'] for stat in gc.get_stats())
+
+    def end_frame(self, counts=None):
+        if not self.enabled:
+            return
+        row = self.row
+        self.frame_times[row] = self.clock() - self.frame_start
+        self.allocated[row] = sys.getallocatedblocks() - self._blocks
+        self.collections[row] = sum(stat['collections'] for stat in gc.get_stats()) - self._gc
+        for name, value in (counts or {}).items():
+            column = self.counters.get(name)
+            if column is None:
+                if len(self.counters) >= self.MAX_COUNTERS:
+                    continue
+                column = self.counters[name] = len(self.counters)
+            self.counts[row, column] = value
+        self.frames += 1
+
+    # --- Consulta ---
+    def _rows(self):
+        """Índices do buffer em ordem cronológica."""
+        if self.frames <= self.capacity:
+            return np.arange(self.frames)
+        return (np.arange(self.capacity) + self.frames) % self.capacity
+
+    def percentiles(self, values=(50, 95, 99)):
+        """Percentis (ms) do tempo de trabalho por frame, nos frames do buffer."""
+        rows = self._rows()
+        if len(rows) == 0:
+            return {p: 0.0 for p in values}
+        return dict(zip(values, np.percentile(self.frame_times[rows], values) * 1000.0))
+
+    def phase_means(self):
+        rows = self._rows()
+        if len(rows) == 0:
+            return {}
+        return {name: float(self.durations[rows, column].mean() * 1000.0) for name, column in self.phases.items()}
+
+    # --- Overlay ---
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+
+    def draw_overlay(self, surface):
+        """Desenha p50/p95/p99 e as fases mais caras. Devolve o retângulo desenhado."""
+        if not (self.enabled and self.overlay):
+            return None
+        now = self.clock()
+        # Re-renderiza o texto só 4x por segundo para o overlay não pesar no frame
+        if self._overlay_surface is None or now - self._overlay_updated > 0.25:
+            self._overlay_updated = now
+            self._overlay_surface = self._render_overlay()
+        return surface.blit(self._overlay_surface, (8, 8))
+
+    def _render_overlay(self):
+        if self._overlay_font is None:
+            self._overlay_font = pygame.font.Font(None, 20)
+        p = self.percentiles()
+        rows = self._rows()
+        last = rows[-1] if len(rows) else 0
+        lines = [f"frame p50 {p[50]:.2f}  p95 {p[95]:.2f}  p99 {p[99]:.2f} ms",
+                 f"alloc {self.allocated[last]:+d} blocos  gc {self.collections[last]}"]
+        phases = sorted(self.phase_means().items(), key=lambda item: -item[1])
+        lines += [f"{name:<12} {value:6.2f} ms" for name, value in phases[:8]]
+        lines += ["  ".join(f"{name} {self.counts[last, column]}" for name, column in self.counters.items())]
+        images = [self._overlay_font.render(line, True, WHITE) for line in lines]
+        width = max(image.get_width() for image in images) + 8
+        height = sum(image.get_height() for image in images) + 8
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = 4
+        for image in images:
+            panel.blit(image, (4, y))
+            y += image.get_height()
+        return panel
+
+    # --- Exportação ---
+    def export_csv(self, path):
+        rows = self._rows()
+        phases = list(self.phases.items())
+        counters = list(self.counters.items())
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', 'start_ms', 'interval_ms', 'frame_ms', 'alloc_blocks', 'gc_collections']
+                            + [f"{name}_ms" for name, _ in phases] + [name for name, _ in counters])
+            first = self.frames - len(rows)
+            for i, row in enumerate(rows):
+                writer.writerow([first + i, round(self.starts[row] * 1000.0, 3), round(self.intervals[row] * 1000.0, 3),
+                                 round(self.frame_times[row] * 1000.0, 3), self.allocated[row], self.collections[row]]
+                                + [round(self.durations[row, column] * 1000.0, 3) for _, column in phases]
+                                + [int(self.counts[row, column]) for _, column in counters])
+
+    def export_chrome_trace(self, path):
+        """Arquivo para chrome://tracing ou ui.perfetto.dev (formato Trace Event)."""
+        rows = self._rows()
+        first = self.frames - len(rows)
+        events = []
+        for i, row in enumerate(rows):
+            start_us = self.starts[row] * 1e6
+            events.append({'name': 'frame', 'ph': 'X', 'pid': 1, 'tid': 1, 'ts': start_us,
+                           'dur': self.frame_times[row] * 1e6, 'args': {'frame': first + i}})
+            for name, column in self.phases.items():
+                duration = self.durations[row, column]
+                if duration > 0.0:
+                    events.append({'name': name, 'ph': 'X', 'pid': 1, 'tid': 1,
+                                   'ts': start_us + self.offsets[row, column] * 1e6, 'dur': duration * 1e6})
+            if self.counters:
+                events.append({'name': 'entidades', 'ph': 'C', 'pid': 1, 'ts': start_us,
+                               'args': {name: int(self.counts[row, column]) for name, column in self.counters.items()}})
+            events.append({'name': 'alocações', 'ph': 'C', 'pid': 1, 'ts': start_us,
+                           'args': {'blocos': int(self.allocated[row]), 'gc': int(self.collections[row])}})
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
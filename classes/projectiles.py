@@ -0,0 +1,299 @@
+import itertools
+import numpy as np
+import pygame
+from config import * # Importa as constantes
+
+# Dono do projétil
+PLAYER = 0
+ENEMY = 1
+
+#==============================================================================
+# SISTEMA DE PROJÉTEIS (STRUCT-OF-ARRAYS EM NUMPY)
+#==============================================================================
+class ProjectileSystem:
+    """Todos os tiros do jogo em arrays contíguos, sem um Sprite por tiro.
+
+    Cada projétil é uma linha dos arrays `pos` (centro), `direction`, `speed` e
+    `owner`. A ordem das linhas é a ordem de disparo, e é mantida ao remover
+    tiros, então "o primeiro tiro que acertou" continua sendo o mais antigo.
+    """
+    def __init__(self, images, capacity=256, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        self.images = images  # dono -> Surface
+        self.width = width
+        self.height = height
+        # Meia largura/altura, raio (como collide_circle) e máscara de pixels de cada dono
+        self.half_size = np.zeros((len(images), 2))
+        self.radius = np.zeros(len(images))
+        self.masks = {}
+        for owner, image in images.items():
+            w, h = image.get_size()
+            self.half_size[owner] = (w / 2, h / 2)
+            self.radius[owner] = 0.5 * (w ** 2 + h ** 2) ** 0.5
+            self.masks[owner] = pygame.mask.from_surface(image)
+        self.hit_tables = {}  # (máscara do sprite, dono) -> (início, largura, altura) em hit_bits
+        self.hit_bits = np.zeros(0, dtype=bool)
+        self.limits = {}      # dono -> tiros vivos no máximo (os excedentes não são disparados)
+        self.count = 0
+        # Contadores
+        self.capped = 0       # tiros não disparados por causa de `limits`
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.pos = np.zeros((capacity, 2))
+        self.direction = np.zeros((capacity, 2))
+        self.speed = np.zeros(capacity)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+
+    def _reserve(self, extra):
+        needed = self.count + extra
+        capacity = len(self.speed)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        n = self.count
+        old = (self.pos[:n], self.direction[:n], self.speed[:n], self.owner[:n])
+        self._allocate(capacity)
+        self.pos[:n], self.direction[:n], self.speed[:n], self.owner[:n] = old
+
+    def __len__(self):
+        return self.count
+
+    def live(self, owner=None):
+        if owner is None:
+            return self.count
+        return int(np.count_nonzero(self.owner[:self.count] == owner))
+
+    def clear(self):
+        self.count = 0
+
+    def limit(self, owner, count):
+        """No máximo `count` tiros vivos de `owner` (None tira o limite)."""
+        if count is None:
+            self.limits.pop(owner, None)
+        else:
+            self.limits[owner] = count
+
+    def _room(self, owner, wanted):
+        """Quantos dos `wanted` tiros novos de `owner` cabem no limite."""
+        limit = self.limits.get(owner)
+        if limit is None:
+            return wanted
+        room = min(wanted, max(limit - self.live(owner), 0))
+        self.capped += wanted - room
+        return room
+
+    def spawn(self, x, y, dx, dy, speed, owner):
+        if self.limits and not self._room(owner, 1):
+            return
+        self._reserve(1)
+        i = self.count
+        self.pos[i] = (x, y)
+        self.direction[i] = (dx, dy)
+        self.speed[i] = speed
+        self.owner[i] = owner
+        self.count += 1
+
+    def spawn_many(self, positions, directions, speed, owner):
+        """Dispara vários tiros de uma vez (ex.: a rajada radial do Bombardeiro)."""
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        directions = np.asarray(directions, dtype=float).reshape(-1, 2)
+        k = len(directions)
+        if self.limits:
+            k = self._room(owner, k)
+            directions = directions[:k]
+            if len(positions) > 1:
+                positions = positions[:k]
+        self._reserve(k)
+        i, j = self.count, self.count + k
+        self.pos[i:j] = positions
+        self.direction[i:j] = directions
+        self.speed[i:j] = speed
+        self.owner[i:j] = owner
+        self.count = j
+
+    def _keep(self, mask):
+        # Compactação estável: remove as linhas onde mask é False
+        n = int(np.count_nonzero(mask))
+        if n == self.count:
+            return
+        self.pos[:n] = self.pos[:self.count][mask]
+        self.direction[:n] = self.direction[:self.count][mask]
+        self.speed[:n] = self.speed[:self.count][mask]
+        self.owner[:n] = self.owner[:self.count][mask]
+        self.count = n
+
+    def update(self, steps=1):
+        """Move todos os tiros e descarta os que saíram da tela."""
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        pos += self.direction[:n] * (self.speed[:n] * steps)[:, None]
+        half = self.half_size[self.owner[:n]]
+        low, high = pos - half, pos + half
+        # Tiro do jogador some ao passar do topo; tiro inimigo ao encostar em qualquer borda
+        inside = (low[:, 0] >= 0) & (low[:, 1] >= 0) & (high[:, 0] <= self.width) & (high[:, 1] <= self.height)
+        self._keep(np.where(self.owner[:n] == PLAYER, high[:, 1] >= 0, inside))
+
+    def draw(self, surface, alpha=1.0, scale=1.0, images=None):
+        """Desenha todos os tiros e devolve os retângulos afetados.
+
+        Com alpha < 1 cada tiro aparece entre a posição do passo anterior e a
+        atual (o movimento é em linha reta, então basta recuar a velocidade).
+        Com `images` (cópias escaladas, classes/display.py) as posições são
+        multiplicadas por `scale`.
+        """
+        rects = []
+        n = self.count
+        if n == 0:
+            return rects
+        pos = self.pos[:n]
+        if alpha < 1.0:
+            pos = pos - self.direction[:n] * (self.speed[:n] * (1.0 - alpha))[:, None]
+        topleft = pos - self.half_size[self.owner[:n]]
+        if images is not None:
+            topleft = topleft * scale
+        topleft = topleft.astype(int)
+        for owner, image in self.images.items():
+            if images is not None:
+                image = images[image]
+            coords = topleft[self.owner[:n] == owner].tolist()
+            if coords:
+                rects += surface.blits(zip(itertools.repeat(image), coords))
+        return rects
+
+    def _overlapping_pairs(self, rects, pos, half):
+        """Pares (sprite, tiro) cujos retângulos se sobrepõem.
+
+        Os tiros são agrupados por célula de uma grade uniforme e cada sprite só
+        é testado contra as células que cobre, tudo em operações vetorizadas.
+        """
+        size = COLLISION_CELL_SIZE
+        cols, rows = -(-self.width // size), -(-self.height // size)
+        cell_x = np.clip(pos[:, 0] // size, 0, cols - 1).astype(int)
+        cell_y = np.clip(pos[:, 1] // size, 0, rows - 1).astype(int)
+        shot_cell = cell_y * cols + cell_x
+        by_cell = np.argsort(shot_cell, kind='stable')
+        per_cell = np.bincount(shot_cell, minlength=cols * rows)
+        cell_start = np.cumsum(per_cell) - per_cell
+
+        # Células onde o centro de um tiro encostaria em cada sprite
+        x0 = np.clip((rects[:, 0] - half[0]) // size, 0, cols - 1).astype(int)
+        x1 = np.clip((rects[:, 2] + half[0]) // size, 0, cols - 1).astype(int)
+        y0 = np.clip((rects[:, 1] - half[1]) // size, 0, rows - 1).astype(int)
+        y1 = np.clip((rects[:, 3] + half[1]) // size, 0, rows - 1).astype(int)
+        width = x1 - x0 + 1
+        covered = width * (y1 - y0 + 1)
+        sprite_of = np.repeat(np.arange(len(rects)), covered)
+        local = np.arange(covered.sum()) - np.repeat(np.cumsum(covered) - covered, covered)
+        cell = (y0[sprite_of] + local // width[sprite_of]) * cols + x0[sprite_of] + local % width[sprite_of]
+
+        # Expande cada (sprite, célula) nos tiros daquela célula
+        in_cell = per_cell[cell]
+        pair_sprite = np.repeat(sprite_of, in_cell)
+        local = np.arange(in_cell.sum()) - np.repeat(np.cumsum(in_cell) - in_cell, in_cell)
+        pair_shot = by_cell[np.repeat(cell_start[cell], in_cell) + local]
+
+        low, high = pos[pair_shot] - half, pos[pair_shot] + half
+        box = rects[pair_sprite]
+        overlap = (low[:, 0] < box[:, 2]) & (high[:, 0] > box[:, 0]) & (low[:, 1] < box[:, 3]) & (high[:, 1] > box[:, 1])
+        return pair_sprite[overlap], pair_shot[overlap]
+
+    def collide_rects(self, sprites, owner, dokill=True, mask_of=None):
+        """Tiros de `owner` que sobrepõem o rect de cada sprite.
+
+        Devolve {sprite: array de centros dos tiros}, como groupcollide. Com
+        dokill, cada tiro acerta só o primeiro sprite (na ordem de `sprites`)
+        e depois é removido. Com `mask_of` (sprite -> máscara do quadro
+        atual), os pares que passam pelo teste dos rects ainda precisam ter
+        pixels opacos sobrepostos.
+        """
+        hits = {}
+        n = self.count
+        candidates = np.flatnonzero(self.owner[:n] == owner)
+        sprites = list(sprites)
+        if len(candidates) == 0 or not sprites:
+            return hits
+        rects = np.array([(s.rect.left, s.rect.top, s.rect.right, s.rect.bottom) for s in sprites], dtype=float)
+        pos = self.pos[candidates]
+        pair_sprite, pair_shot = self._overlapping_pairs(rects, pos, self.half_size[owner])
+        if mask_of is not None and len(pair_shot):
+            touching = self._masks_overlap(sprites, rects, pos, pair_sprite, pair_shot, owner, mask_of)
+            pair_sprite, pair_shot = pair_sprite[touching], pair_shot[touching]
+        if len(pair_shot) == 0:
+            return hits
+        if dokill:
+            # Cada tiro fica só com o primeiro sprite que ele toca
+            first = np.full(len(candidates), len(sprites))
+            np.minimum.at(first, pair_shot, pair_sprite)
+            pair_shot = np.flatnonzero(first < len(sprites))
+            pair_sprite = first[pair_shot]
+        order = np.lexsort((pair_shot, pair_sprite))
+        pair_sprite, pair_shot = pair_sprite[order], pair_shot[order]
+        sprite_ids, starts = np.unique(pair_sprite, return_index=True)
+        for sprite_id, shots in zip(sprite_ids, np.split(pair_shot, starts[1:])):
+            hits[sprites[sprite_id]] = pos[shots]
+        if dokill:
+            keep = np.ones(n, dtype=bool)
+            keep[candidates[pair_shot]] = False
+            self._keep(keep)
+        return hits
+
+    def _hit_table(self, mask, owner):
+        """(início, largura, altura) da tabela de acertos de `mask` contra um tiro de `owner`.
+
+        A tabela é a convolução das duas máscaras: diz, para cada posição do
+        canto do tiro em relação ao sprite, se algum pixel opaco se sobrepõe.
+        É calculada uma vez por (quadro, dono) e fica num array só
+        (`hit_bits`), para os pares serem conferidos todos de uma vez.
+        `mask` tem que ser uma máscara que dura (ex.: as de AnimationSet.masks).
+        """
+        entry = self.hit_tables.get((mask, owner))
+        if entry is None:
+            table = mask.convolve(self.masks[owner]).to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0))
+            bits = pygame.surfarray.array2d(table) != 0
+            entry = self.hit_tables[(mask, owner)] = (len(self.hit_bits),) + bits.shape
+            self.hit_bits = np.concatenate([self.hit_bits, bits.ravel()])
+        return entry
+
+    def _touching(self, corner, tables, owner):
+        """Consulta as tabelas de acerto: `corner` é o canto de cada tiro relativo ao seu sprite."""
+        start, width, height = tables
+        shot_width, shot_height = self.masks[owner].get_size()
+        x = corner[:, 0] + (shot_width - 1)
+        y = corner[:, 1] + (shot_height - 1)
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        touching = np.zeros(len(corner), dtype=bool)
+        touching[inside] = self.hit_bits[(start + x * height + y)[inside]]
+        return touching
+
+    def _masks_overlap(self, sprites, rects, pos, pair_sprite, pair_shot, owner, mask_of):
+        """Para cada par (sprite, tiro), se os pixels opacos dos dois se sobrepõem."""
+        tables = np.zeros((len(sprites), 3), dtype=int)
+        sprite_ids = np.unique(pair_sprite)
+        tables[sprite_ids] = [self._hit_table(mask_of(sprites[i]), owner) for i in sprite_ids.tolist()]
+        # Mesmo canto que draw() usa para desenhar o tiro
+        corner = (pos[pair_shot] - self.half_size[owner]).astype(int) - rects[pair_sprite, :2].astype(int)
+        return self._touching(corner, tables[pair_sprite].T, owner)
+
+    def collide_circle(self, sprite, radius, owner, dokill=True, mask=None):
+        """Quantos tiros de `owner` tocam o círculo do sprite (mesma regra de collide_circle).
+
+        Com `mask` (a máscara do quadro atual do sprite), só contam os tiros
+        que passam pelo círculo e têm pixels opacos sobre os do sprite.
+        """
+        n = self.count
+        if n == 0:
+            return 0
+        delta = self.pos[:n] - sprite.rect.center
+        reach = (self.radius[self.owner[:n]] + radius) ** 2
+        hit = (self.owner[:n] == owner) & ((delta ** 2).sum(axis=1) <= reach)
+        if mask is not None:
+            shots = np.flatnonzero(hit)
+            corner = (self.pos[shots] - self.half_size[owner]).astype(int) - sprite.rect.topleft
+            hit[shots] = self._touching(corner, self._hit_table(mask, owner), owner)
+        hit_count = int(np.count_nonzero(hit))
+        if dokill and hit_count:
+            self._keep(~hit)
+        return hit_count
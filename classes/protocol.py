@@ -0,0 +1,118 @@
+import struct
+
+#==============================================================================
+# PROTOCOLO BINÁRIO ENTRE O JOGO E O controle.ino
+#==============================================================================
+# Quadro: SYNC0 SYNC1 CABEÇALHO TAMANHO PAYLOAD... CRC8
+#   CABEÇALHO = (versão << 4) | tipo da mensagem
+#   CRC8 (polinômio 0x07) sobre CABEÇALHO, TAMANHO e PAYLOAD
+# Os mesmos valores estão em controle/controle.ino; mude os dois juntos.
+SYNC0 = 0xA5
+SYNC1 = 0x5A
+PROTOCOL_VERSION = 1
+MAX_PAYLOAD = 16
+
+MSG_INPUT = 1      # Arduino -> jogo: seq, joystick X/Y e botões
+MSG_TELEMETRY = 2  # jogo -> Arduino: calor da arma e vidas
+
+INPUT_PAYLOAD = struct.Struct('<BHHB')      # seq, joy_x, joy_y, botões
+TELEMETRY_PAYLOAD = struct.Struct('<BB')    # calor (0-100), vidas
+
+BUTTON_JOY = 0x01    # bit ligado = botão do joystick solto (INPUT_PULLUP)
+BUTTON_SHOOT = 0x02  # bit ligado = botão de tiro solto (INPUT_PULLUP)
+
+
+def _crc8_table():
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table.append(crc)
+    return table
+
+CRC8_TABLE = _crc8_table()
+
+
+def crc8(data):
+    crc = 0
+    for byte in data:
+        crc = CRC8_TABLE[crc ^ byte]
+    return crc
+
+
+def encode_frame(msg_type, payload):
+    body = bytes(((PROTOCOL_VERSION << 4) | msg_type, len(payload))) + payload
+    return bytes((SYNC0, SYNC1)) + body + bytes((crc8(body),))
+
+
+def encode_input(seq, joy_x, joy_y, joy_btn, shoot_btn):
+    buttons = (BUTTON_JOY if joy_btn else 0) | (BUTTON_SHOOT if shoot_btn else 0)
+    return encode_frame(MSG_INPUT, INPUT_PAYLOAD.pack(seq & 0xFF, joy_x, joy_y, buttons))
+
+
+def decode_input(payload):
+    """Payload de MSG_INPUT -> (seq, joy_x, joy_y, joy_btn, shoot_btn)."""
+    seq, joy_x, joy_y, buttons = INPUT_PAYLOAD.unpack(payload)
+    return seq, joy_x, joy_y, int(bool(buttons & BUTTON_JOY)), int(bool(buttons & BUTTON_SHOOT))
+
+
+def encode_telemetry(heat, lives):
+    return encode_frame(MSG_TELEMETRY, TELEMETRY_PAYLOAD.pack(max(0, min(255, heat)), max(0, min(255, lives))))
+
+
+def encode_text_telemetry(heat, lives):
+    """Formato antigo em texto, para sketches que ainda não usam o protocolo binário."""
+    return f"H:{heat},L:{lives}\n".encode('utf-8')
+
+
+class FrameDecoder:
+    """Decodificador incremental: recebe bytes soltos e devolve quadros completos.
+
+    Lixo entre quadros, versões desconhecidas e CRC errado são descartados e
+    contados; o decodificador volta a procurar os bytes de sincronismo.
+    """
+    def __init__(self):
+        self.buffer = bytearray()
+        self.frames = 0
+        self.bad_crc = 0
+        self.bad_version = 0
+        self.skipped_bytes = 0
+
+    def feed(self, data):
+        """Devolve uma lista de (tipo, payload) dos quadros completos recebidos."""
+        buffer = self.buffer
+        buffer += data
+        frames = []
+        while True:
+            start = buffer.find(bytes((SYNC0, SYNC1)))
+            if start < 0:
+                # Guarda um possível SYNC0 no fim, que pode ser o começo de um quadro
+                keep = 1 if buffer[-1:] == bytes((SYNC0,)) else 0
+                self.skipped_bytes += len(buffer) - keep
+                del buffer[:len(buffer) - keep]
+                break
+            if start:
+                self.skipped_bytes += start
+                del buffer[:start]
+            if len(buffer) < 4:
+                break
+            header, length = buffer[2], buffer[3]
+            if header >> 4 != PROTOCOL_VERSION or length > MAX_PAYLOAD:
+                self.bad_version += 1
+                self.skipped_bytes += 2
+                del buffer[:2]
+                continue
+            end = 4 + length + 1
+            if len(buffer) < end:
+                break
+            body = bytes(buffer[2:end - 1])
+            if crc8(body) != buffer[end - 1]:
+                self.bad_crc += 1
+                self.skipped_bytes += 2
+                del buffer[:2]
+                continue
+            frames.append((header & 0x0F, body[2:]))
+            self.frames += 1
+            del buffer[:end]
+        return frames
@@ -0,0 +1,112 @@
+#==============================================================================
+# RENDERIZAÇÃO COM RETÂNGULOS SUJOS (DIRTY RECTS)
+#==============================================================================
+class DirtyRenderer:
+    """Redesenha só o que mudou na tela de jogo.
+
+    No modo 'dirty' o fundo é restaurado apenas onde algo foi desenhado no
+    frame anterior e onde o próprio fundo mudou (os blocos que o
+    BackgroundLoop trocou), e só essas áreas vão para display.update().
+    No modo 'full' tudo é redesenhado sempre (como antes), o que serve de
+    comparação: os dois modos contam os pixels copiados por frame.
+    """
+    def __init__(self, screen, mode='dirty', full_update_ratio=0.5):
+        self.screen = screen
+        self.mode = mode
+        self.screen_rect = screen.get_rect()
+        # Acima dessa fração da tela, um flip() sai mais barato que muitos retângulos
+        self.full_update_area = self.screen_rect.width * self.screen_rect.height * full_update_ratio
+        self.previous = []
+        self.current = []
+        self.background_rects = []
+        self.full = True
+        # Contadores do último frame e acumulados
+        self.pixels = 0
+        self.total_pixels = 0
+        self.frames = 0
+        self.full_frames = 0
+
+    def invalidate(self):
+        """Força um redesenho completo no próximo frame (ex.: ao trocar de tela)."""
+        self.previous = []
+        self.full = True
+
+    def begin(self, background, changed=()):
+        """Começa o frame; `changed` são as áreas do fundo que mudaram desde o anterior."""
+        self.pixels = 0
+        self.current = []
+        self.background_rects = list(changed)
+        if self.mode == 'full' or self.full or self.screen_rect in self.background_rects:
+            self.full = True
+            self.screen.blit(background, (0, 0))
+            self.pixels += self.screen_rect.width * self.screen_rect.height
+        else:
+            blit = self.screen.blit
+            for rect in self.previous + self.background_rects:
+                restored = blit(background, rect, rect)
+                self.pixels += restored.width * restored.height
+
+    def add(self, rects):
+        """Registra as áreas desenhadas neste frame (sprites, tiros, HUD)."""
+        for rect in rects:
+            self.pixels += rect.width * rect.height
+        self.current.extend(rects)
+
+    def end(self):
+        """Fecha o frame. Devolve os retângulos para display.update(), ou None para flip()."""
+        dirty = None
+        if not self.full:
+            dirty = [rect.clip(self.screen_rect) for rect in self.previous + self.background_rects + self.current]
+            if sum(rect.width * rect.height for rect in dirty) > self.full_update_area:
+                dirty = None
+        if dirty is None:
+            self.full_frames += 1
+        self.previous = self.current
+        # Cena muito cheia: restaurar o fundo pedaço por pedaço sairia mais caro que copiá-lo inteiro
+        self.full = sum(rect.width * rect.height for rect in self.current) > self.full_update_area
+        self.frames += 1
+        self.total_pixels += self.pixels
+        return dirty
+
+#==============================================================================
+# INTERPOLAÇÃO ENTRE PASSOS DA SIMULAÇÃO
+#==============================================================================
+def snapshot_centers(group):
+    """Centro de cada sprite antes de um passo da simulação."""
+    return {sprite: sprite.rect.center for sprite in group}
+
+
+def draw_interpolated(surface, group, previous, alpha, scale=1.0, images=None):
+    """Como group.draw(), mas cada sprite aparece a `alpha` do caminho entre o
+    centro guardado em `previous` e o atual. Sprites que nasceram no último
+    passo (sem centro anterior) são desenhados onde estão.
+
+    Com `images` (classes/display.py: ScaledImages) as posições são
+    multiplicadas por `scale` e cada imagem é trocada pela cópia escalada."""
+    if images is not None:
+        return _draw_scaled(surface, group, previous, alpha, scale, images)
+    blits = []
+    for sprite in group:
+        rect = sprite.rect
+        prev = previous.get(sprite)
+        if prev is None:
+            blits.append((sprite.image, rect))
+            continue
+        x = prev[0] + (rect.centerx - prev[0]) * alpha
+        y = prev[1] + (rect.centery - prev[1]) * alpha
+        blits.append((sprite.image, (round(x) - rect.width // 2, round(y) - rect.height // 2)))
+    return surface.blits(blits)
+
+
+def _draw_scaled(surface, group, previous, alpha, scale, images):
+    blits = []
+    for sprite in group:
+        rect = sprite.rect
+        image = images[sprite.image]
+        x, y = rect.center
+        prev = previous.get(sprite)
+        if prev is not None:
+            x = prev[0] + (x - prev[0]) * alpha
+            y = prev[1] + (y - prev[1]) * alpha
+        blits.append((image, (round(x * scale) - image.get_width() // 2, round(y * scale) - image.get_height() // 2)))
+    return surface.blits(blits)
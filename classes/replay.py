@@ -0,0 +1,182 @@
+import struct
+import sys
+import time
+import zlib
+
+from config import * # Importa as constantes
+
+#==============================================================================
+# GRAVAÇÃO E REPRODUÇÃO DE PARTIDAS (ARQUIVO BINÁRIO COMPACTO)
+#==============================================================================
+# Arquivo: CABEÇALHO + fluxo zlib com os frames
+#   CABEÇALHO = magic, versão, seed do random, SIM_HZ e o perfil de ondas
+#   FRAME     = 1 byte com o nº de passos e um comando por passo (1 byte: dx, dy e tiro)
+#   NÍVEL     = LEVEL_MARKER + 1 byte: nível do governador de qualidade a partir
+#               do próximo frame (alguns níveis mudam a simulação)
+#   FIM       = END_MARKER + RESUMO (estado final, para conferir a reprodução)
+# Os spawns não são gravados: o WaveDirector os refaz a partir da seed, do
+# perfil e do tempo da simulação.
+# Os comandos são o que handle_controls aplicou no jogador, venham do teclado,
+# da serial ou de um ScriptedInput; uma amostra serial que não chegou vira
+# (0, 0, sem tiro), que tem o mesmo efeito.
+MAGIC = b'P51R'
+REPLAY_VERSION = 1
+HEADER = struct.Struct('<4sBIHB')       # magic, versão, seed, SIM_HZ, tamanho do nome do perfil
+SUMMARY = struct.Struct('<IIIbHHHH')    # frames, passos, pontos, vidas, inimigos, tiros do jogador/inimigos, explosões
+SUMMARY_FIELDS = ('frames', 'steps', 'score', 'lives', 'enemies', 'player_shots', 'enemy_shots', 'explosions')
+END_MARKER = 0xFF
+LEVEL_MARKER = 0xFE
+MAX_FRAME_STEPS = 253
+
+
+def pack_command(dx, dy, shoot):
+    return (dx + 1) | (dy + 1) << 2 | bool(shoot) << 4
+
+
+def unpack_command(byte):
+    return (byte & 0x03) - 1, (byte >> 2 & 0x03) - 1, bool(byte & 0x10)
+
+
+class InputRecorder:
+    """Grava uma partida: por frame, os comandos de cada passo."""
+    def __init__(self, path, seed, wave_profile):
+        self.path = path
+        self.file = open(path, 'xb') # Nunca sobrescreve outra gravação (FileExistsError)
+        profile = wave_profile.encode('utf-8')
+        self.file.write(HEADER.pack(MAGIC, REPLAY_VERSION, seed, SIM_HZ, len(profile)) + profile)
+        self.compressor = zlib.compressobj(9)
+        self.commands = bytearray()
+        self.level = 0
+        self.frames = 0
+        self.steps = 0
+
+    def quality(self, level):
+        """Nível de qualidade do frame que vai começar; só é gravado quando muda."""
+        if level != self.level:
+            self.level = level
+            self.file.write(self.compressor.compress(bytes((LEVEL_MARKER, level))))
+
+    def command(self, dx, dy, shoot):
+        self.commands.append(pack_command(dx, dy, shoot))
+
+    def end_frame(self):
+        commands = self.commands
+        if len(commands) > MAX_FRAME_STEPS:
+            raise ValueError("frame com passos demais para o formato do replay")
+        self.file.write(self.compressor.compress(bytes((len(commands),)) + commands))
+        self.frames += 1
+        self.steps += len(commands)
+        self.commands = bytearray()
+
+    def close(self, summary):
+        if self.file.closed:
+            return
+        values = dict(summary, frames=self.frames, steps=self.steps)
+        trailer = bytes((END_MARKER,)) + SUMMARY.pack(*(values[name] for name in SUMMARY_FIELDS))
+        self.file.write(self.compressor.compress(trailer) + self.compressor.flush())
+        self.file.close()
+
+
+class ReplayLog:
+    """Conteúdo de um arquivo gravado pelo InputRecorder."""
+    def __init__(self, seed, sim_hz, wave_profile, frames, summary, levels=None):
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.wave_profile = wave_profile
+        self.frames = frames    # lista de comandos de cada frame
+        self.levels = levels if levels is not None else [0] * len(frames)  # nível de qualidade de cada frame
+        self.summary = summary  # dict com SUMMARY_FIELDS, ou None se a gravação foi interrompida
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            magic, version, seed, sim_hz, name_size = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != REPLAY_VERSION:
+                raise ValueError(f"{path}: não é um replay na versão {REPLAY_VERSION}")
+            wave_profile = f.read(name_size).decode('utf-8')
+            # Um arquivo cortado (jogo fechado à força) ainda reproduz até onde foi gravado
+            data = zlib.decompressobj().decompress(f.read())
+        frames = []
+        levels = []
+        level = 0
+        summary = None
+        i = 0
+        while i < len(data):
+            head = data[i]
+            if head == END_MARKER:
+                if len(data) - i - 1 >= SUMMARY.size:
+                    summary = dict(zip(SUMMARY_FIELDS, SUMMARY.unpack_from(data, i + 1)))
+                break
+            if head == LEVEL_MARKER:
+                if i + 1 < len(data):
+                    level = data[i + 1]
+                i += 2
+                continue
+            end = i + 1 + head
+            if end > len(data):
+                break
+            frames.append([unpack_command(byte) for byte in data[i + 1:end]])
+            levels.append(level)
+            i = end
+        return cls(seed, sim_hz, wave_profile, frames, summary, levels)
+
+
+class ReplayInput:
+    """Fonte de entrada que devolve os comandos gravados, um por passo."""
+    def __init__(self):
+        self.commands = []
+        self.index = 0
+
+    def feed(self, commands):
+        self.commands = commands
+        self.index = 0
+
+    def poll(self):
+        command = self.commands[self.index]
+        self.index += 1
+        return command
+
+
+def replay(path, profile=False):
+    """Reproduz um replay no modo headless, o mais rápido possível.
+
+    Devolve (jogo, resumo gravado, resumo obtido); o jogo fica aberto para quem
+    quiser olhar o profiler ou outros contadores (chame game.quit() depois).
+    """
+    from main import Game  # Importado aqui: main.py importa este módulo
+
+    log = ReplayLog.load(path)
+    if log.sim_hz != SIM_HZ:
+        raise ValueError(f"replay gravado a {log.sim_hz} passos/s, mas SIM_HZ = {SIM_HZ}")
+    source = ReplayInput()
+    game = Game(headless=True, seed=log.seed, input_source=source, record=False, wave_profile=log.wave_profile)
+    game.profiler.enabled = profile
+    game.start_new_game()
+    for commands, level in zip(log.frames, log.levels):
+        game.governor.set_level(level)
+        source.feed(commands)
+        game.profiler.begin_frame()
+        game.step(0.0, steps=len(commands))
+        game.profiler.end_frame(game.entity_counts())
+    result = dict(game.replay_summary(), frames=len(log.frames), steps=sum(len(c) for c in log.frames))
+    return game, log.summary, result
+
+
+if __name__ == '__main__':
+    # Uso: python -m classes.replay replays/replay-....p51r [perfil.csv]
+    path = sys.argv[1]
+    started = time.perf_counter()
+    game, expected, result = replay(path, profile=len(sys.argv) > 2)
+    elapsed = time.perf_counter() - started
+    print(f"{result['frames']} frames, {result['steps']} passos em {elapsed:.2f} s "
+          f"({result['steps'] / SIM_HZ / elapsed:.1f}x o tempo real)")
+    print("obtido: ", result)
+    if expected is None:
+        print("gravação sem resumo final (interrompida); nada para conferir")
+    else:
+        print("gravado:", expected)
+        print("OK" if expected == result else "DIVERGIU")
+    if len(sys.argv) > 2:
+        game.profiler.export_csv(sys.argv[2])
+    game.quit()
+    sys.exit(0 if expected in (None, result) else 1)
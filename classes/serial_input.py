@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import namedtuple
+
+import serial
+from config import * # Importa as constantes
+from classes.protocol import FrameDecoder, MSG_INPUT, decode_input, encode_telemetry, encode_text_telemetry
+
+# Uma amostra do controle, na mesma ordem em que o controle.ino envia
+ControllerState = namedtuple('ControllerState', 'joy_x joy_y joy_btn shoot_btn')
+
+#==============================================================================
+# LEITOR SERIAL EM THREAD SEPARADA
+#==============================================================================
+class SerialReader:
+    """Lê as amostras do controle do Arduino numa thread própria.
+
+    `protocol` é 'binary' (quadros de classes/protocol.py) ou 'text' (as
+    linhas "x,y,btn,shoot" do sketch antigo). O loop do jogo nunca espera
+    pela serial: ele só pega a amostra mais recente com take(). Amostras que
+    chegam antes do jogo consumir a anterior substituem a antiga (e contam
+    como descartadas), então o atraso de entrada não acumula quando um
+    frame demora.
+    """
+    def __init__(self, ser, protocol=SERIAL_PROTOCOL):
+        self.ser = ser
+        self.protocol = protocol
+        self.decoder = FrameDecoder()
+        self._last_seq = None
+        self._lock = threading.Lock()
+        self._latest = None
+        self._fresh = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='serial-reader', daemon=True)
+        # Contadores
+        self.samples_read = 0
+        self.dropped = 0
+        self.malformed = 0
+        self.lost = 0  # amostras que nunca chegaram (buracos no seq do protocolo binário)
+        # Exceção que encerrou a leitura antes de stop() (porta fechada, Arduino desconectado)
+        self.error = None
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+
+    def _run(self):
+        pending = b''
+        while not self._stop.is_set():
+            try:
+                chunk = self.ser.read(self.ser.in_waiting or 1)
+            except (serial.SerialException, OSError, TypeError) as error:
+                # Porta fechada ou Arduino desconectado; o jogo confere `error` e volta ao teclado
+                if not self._stop.is_set():
+                    self.error = error
+                break
+            if not chunk:
+                continue
+            if self.protocol == 'binary':
+                self.feed_bytes(chunk)
+                continue
+            pending += chunk
+            *lines, pending = pending.split(b'\n')
+            for line in lines:
+                self.feed_line(line)
+
+    def feed_bytes(self, data):
+        errors = self.decoder.bad_crc + self.decoder.bad_version
+        for msg_type, payload in self.decoder.feed(data):
+            if msg_type != MSG_INPUT:
+                continue
+            seq, *values = decode_input(payload)
+            if self._last_seq is not None:
+                self.lost += (seq - self._last_seq - 1) & 0xFF
+            self._last_seq = seq
+            self._publish(ControllerState(*values))
+        self.malformed += self.decoder.bad_crc + self.decoder.bad_version - errors
+
+    def feed_line(self, line):
+        parts = line.strip().split(b',')
+        try:
+            if len(parts) != 4:
+                raise ValueError
+            state = ControllerState(*map(int, parts))
+        except ValueError:
+            self.malformed += 1
+            return
+        self._publish(state)
+
+    def _publish(self, state):
+        self.samples_read += 1
+        with self._lock:
+            if self._fresh:
+                self.dropped += 1
+            self._latest = state
+            self._fresh = True
+
+    def latest(self):
+        """Última amostra recebida (ou None), já consumida ou não."""
+        with self._lock:
+            return self._latest
+
+    def take(self):
+        """Amostra nova desde a última chamada, ou None se não chegou nada."""
+        with self._lock:
+            if not self._fresh:
+                return None
+            self._fresh = False
+            return self._latest
+
+    def stats(self):
+        return {'samples_read': self.samples_read, 'dropped': self.dropped,
+                'malformed': self.malformed, 'lost': self.lost}
+
+#==============================================================================
+# ENVIO DE TELEMETRIA (CALOR E VIDAS) PARA O LCD DO ARDUINO
+#==============================================================================
+class TelemetryWriter:
+    """Manda calor/vidas só quando mudam, e no máximo uma vez a cada `min_interval` s.
+
+    Uma mudança barrada pelo limite de taxa não se perde: ela sai na próxima
+    chamada de update() depois que o intervalo passar.
+    """
+    def __init__(self, ser, protocol=SERIAL_PROTOCOL, min_interval=TELEMETRY_MIN_INTERVAL, clock=time.perf_counter):
+        self.ser = ser
+        self.encode = encode_telemetry if protocol == 'binary' else encode_text_telemetry
+        self.min_interval = min_interval
+        self.clock = clock
+        self.last_sent = None
+        self.last_time = float('-inf')
+        # Contadores
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self.rate_limited = 0
+
+    def update(self, heat, lives):
+        state = (heat, lives)
+        if state == self.last_sent:
+            return False
+        now = self.clock()
+        if now - self.last_time < self.min_interval:
+            self.rate_limited += 1
+            return False
+        data = self.encode(heat, lives)
+        try:
+            self.ser.write(data)
+        except (serial.SerialException, OSError):
+            return False
+        self.last_sent = state
+        self.last_time = now
+        self.messages_sent += 1
+        self.bytes_sent += len(data)
+        return True
@@ -0,0 +1,83 @@
+from config import * # Importa as constantes
+
+#==============================================================================
+# RELÓGIO DA SIMULAÇÃO
+#==============================================================================
+class SimClock:
+    """Tempo do jogo em ms, que só anda quando a simulação dá um passo.
+
+    Substitui pygame.time.get_ticks() nos sprites: animações e intervalos de
+    tiro passam a contar passos da simulação, e não o relógio de parede, então
+    um frame lento não muda o ritmo do jogo e o modo headless é determinístico.
+    """
+    def __init__(self):
+        self.ms = 0.0
+
+    def reset(self):
+        self.ms = 0.0
+
+    def get_ticks(self):
+        return int(self.ms)
+
+    def advance(self, seconds):
+        self.ms += seconds * 1000.0
+
+# Instância única, usada por todos os sprites
+sim_clock = SimClock()
+
+#==============================================================================
+# PASSO FIXO DA SIMULAÇÃO (ACUMULADOR) COM PULO DE FRAMES
+#==============================================================================
+class FixedTimestep:
+    """Converte o tempo real de cada frame em passos de simulação de tamanho fixo.
+
+    advance(frame_time) devolve quantos passos rodar neste frame; o que sobra
+    no acumulador vira `alpha` (0..1), a fração do próximo passo usada para
+    interpolar o desenho. Se mesmo com `max_steps` passos a simulação ficou
+    para trás, should_render() pula o desenho (até `max_skip` frames seguidos)
+    para a simulação alcançar o tempo real; passado esse limite o atraso é
+    descartado e o jogo fica em câmera lenta em vez de travar.
+    """
+    def __init__(self, rate=SIM_HZ, max_steps=MAX_SIM_STEPS, max_frame_time=MAX_FRAME_TIME, max_skip=MAX_FRAME_SKIP):
+        self.step = 1.0 / rate
+        self.max_steps = max_steps
+        self.max_frame_time = max_frame_time
+        self.max_skip = max_skip
+        self.accumulator = 0.0
+        self.behind = False
+        self._skipped = 0  # frames seguidos sem desenho
+        # Contadores
+        self.steps = 0
+        self.frames_skipped = 0
+        self.time_dropped = 0.0  # s de simulação descartados (o jogo ficou lento)
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.behind = False
+        self._skipped = 0
+
+    def advance(self, frame_time):
+        self.accumulator += min(frame_time, self.max_frame_time)
+        # A folga evita perder um passo por erro de arredondamento (ex.: 3 * (1/60))
+        steps = min(int(self.accumulator / self.step + 1e-6), self.max_steps)
+        self.accumulator = max(0.0, self.accumulator - steps * self.step)
+        self.behind = self.accumulator >= self.step
+        self.steps += steps
+        return steps
+
+    def should_render(self):
+        if self.behind and self._skipped < self.max_skip:
+            self._skipped += 1
+            self.frames_skipped += 1
+            return False
+        self._skipped = 0
+        if self.behind:
+            dropped = self.accumulator - self.accumulator % self.step
+            self.time_dropped += dropped
+            self.accumulator -= dropped
+            self.behind = False
+        return True
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.step, 1.0)
@@ -0,0 +1,57 @@
+import numpy as np
+from config import * # Importa as constantes
+
+#==============================================================================
+# TRAJETÓRIAS PRÉ-CALCULADAS DOS INIMIGOS
+#==============================================================================
+class Trajectory:
+    """Deslocamento acumulado (a partir do ponto de partida) em cada passo.
+
+    A tabela é calculada uma vez e compartilhada por todos os inimigos do
+    mesmo padrão; um inimigo só guarda o ponto de partida e o índice do passo.
+    Passado o fim da tabela, o inimigo segue com a velocidade do último passo.
+    """
+    def __init__(self, name, velocities):
+        self.name = name
+        velocities = np.asarray(velocities, dtype=float)
+        self.offsets = np.vstack([np.zeros((1, 2)), np.cumsum(velocities, axis=0)])
+        # Lista de tuplas: consulta escalar muito mais rápida que indexar o array numpy
+        self.table = [tuple(offset) for offset in self.offsets.tolist()]
+        self.last_velocity = tuple(velocities[-1])
+
+    def __len__(self):
+        return len(self.table)
+
+    def offset(self, index):
+        if index < len(self.table):
+            return self.table[index]
+        extra = index - len(self.table) + 1
+        x, y = self.table[-1]
+        return x + self.last_velocity[0] * extra, y + self.last_velocity[1] * extra
+
+
+def _steps():
+    # Passos suficientes para atravessar a tela na velocidade vertical mais lenta (2 px/passo)
+    return (SCREEN_HEIGHT + TRAJECTORY_MARGIN) // 2
+
+
+def straight(speed_y=3):
+    return np.tile((0.0, float(speed_y)), (_steps(), 1))
+
+
+def diagonal(speed_x, speed_y=2):
+    return np.tile((float(speed_x), float(speed_y)), (_steps(), 1))
+
+
+def curve(angle_speed, amplitude=3, speed_y=2):
+    """Desce em zigue-zague: a cada passo soma sin(ângulo) * amplitude em x."""
+    angles = np.radians(np.arange(1, _steps() + 1) * angle_speed)
+    return np.column_stack([np.sin(angles) * amplitude, np.full(len(angles), float(speed_y))])
+
+
+# Padrão -> variações (o inimigo sorteia o padrão e depois a variação)
+PATTERNS = {
+    'straight': [Trajectory('straight', straight())],
+    'diagonal': [Trajectory('diagonal-', diagonal(-2)), Trajectory('diagonal+', diagonal(2))],
+    'curve': [Trajectory('curve-', curve(-2)), Trajectory('curve+', curve(2))],
+}
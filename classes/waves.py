@@ -0,0 +1,106 @@
+import bisect
+import json
+import pygame
+from config import * # Importa as constantes
+
+#==============================================================================
+# GRUPO COM CONTAGEM POR TIPO (REGISTRO O(1) DE ENTIDADES VIVAS)
+#==============================================================================
+class TypedGroup(pygame.sprite.Group):
+    """Group que mantém, para cada valor de `sprite.kind`, os sprites vivos daquele tipo.
+
+    Entradas e saídas passam por add_internal/remove_internal (inclusive
+    kill()), então count() e of_kind() não precisam percorrer o grupo.
+    """
+    def __init__(self, *sprites):
+        self.by_kind = {}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.by_kind.setdefault(sprite.kind, {})[sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        del self.by_kind[sprite.kind][sprite]
+
+    def count(self, kind):
+        return len(self.by_kind.get(kind, ()))
+
+    def of_kind(self, kind):
+        return self.by_kind.get(kind, {}).keys()
+
+#==============================================================================
+# DIRETOR DE ONDAS (SPAWN A PARTIR DE UM ARQUIVO DE PERFIS)
+#==============================================================================
+def load_wave_profiles(path=WAVE_FILE):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['profiles']
+
+
+class SpawnRule:
+    """Um tipo de inimigo num perfil: de quanto em quanto tempo, quantos e o limite vivo."""
+    def __init__(self, kind, interval_ms, count=1, cap=None, start_ms=None):
+        if interval_ms <= 0:
+            raise ValueError(f"intervalo de spawn inválido para '{kind}': {interval_ms}")
+        self.kind = kind
+        self.interval_ms = interval_ms
+        self.count = count
+        self.cap = cap
+        self.start_ms = interval_ms if start_ms is None else start_ms
+
+
+class WaveDirector:
+    """Decide, a cada passo da simulação, quantos inimigos de cada tipo nascem.
+
+    Substitui os timers do pygame: os intervalos contam o tempo da simulação
+    (então o replay reproduz os spawns sozinho) e são divididos pelo
+    multiplicador da curva de dificuldade no momento do spawn. O limite de
+    cada tipo é conferido no TypedGroup, sem percorrer os inimigos.
+    """
+    def __init__(self, profile, kinds):
+        unknown = set(profile['spawns']) - set(kinds)
+        if unknown:
+            raise ValueError(f"tipos de inimigo desconhecidos no perfil de ondas: {sorted(unknown)}")
+        self.rules = [SpawnRule(kind, **rule) for kind, rule in profile['spawns'].items()]
+        points = sorted(profile.get('difficulty') or [[0, 1.0]])
+        self.curve_times = [t for t, _ in points]
+        self.curve_values = [m for _, m in points]
+        self.reset()
+
+    def reset(self):
+        self.next_spawn = {rule.kind: rule.start_ms for rule in self.rules}
+        # Contadores
+        self.spawned = {rule.kind: 0 for rule in self.rules}
+        self.capped = {rule.kind: 0 for rule in self.rules}
+
+    def difficulty(self, now):
+        """Multiplicador da taxa de spawn em `now` (linear entre os pontos da curva)."""
+        times, values = self.curve_times, self.curve_values
+        i = bisect.bisect_right(times, now)
+        if i == 0:
+            return values[0]
+        if i == len(times):
+            return values[-1]
+        t0, t1 = times[i - 1], times[i]
+        return values[i - 1] + (values[i] - values[i - 1]) * (now - t0) / (t1 - t0)
+
+    def update(self, now, group):
+        """Lista de (tipo, quantidade) a criar neste passo."""
+        spawns = []
+        for rule in self.rules:
+            kind = rule.kind
+            due = 0
+            while now >= self.next_spawn[kind]:
+                due += rule.count
+                self.next_spawn[kind] += rule.interval_ms / self.difficulty(self.next_spawn[kind])
+            if not due:
+                continue
+            if rule.cap is not None:
+                allowed = max(0, rule.cap - group.count(kind))
+                self.capped[kind] += due - min(due, allowed)
+                due = min(due, allowed)
+            if due:
+                self.spawned[kind] += due
+                spawns.append((kind, due))
+        return spawns
@@ -4,7 +4,90 @@ SCREEN_HEIGHT = 600
 WHITE = (255, 255, 255)
 RED = (255, 0, 0)
 PLAYER_SPEED = 50 # Velocidade do jogador ajustável
+BULLET_SPEED = 10 # px por passo (tiro do jogador, para cima)
+ENEMY_BULLET_SPEED = 6 # px por passo (tiro inimigo)
+ENEMY_BULLET_COLOR = (255, 80, 80)
+EXPLOSION_POOL_SIZE = 32 # Explosões criadas de antemão a cada jogo
+TRAJECTORY_MARGIN = 200 # px além da altura da tela cobertos pelas tabelas de trajetória
+COLLISION_CELL_SIZE = 64 # Tamanho (px) da célula da grade de colisão dos projéteis
+COLLISION_MASKS = True # Depois do teste por rect/círculo, confere os pixels (máscaras por quadro)
+BACKGROUND_TILE = 40 # Lado dos blocos do fundo animado guardados entre um quadro e outro
+RENDER_MODE = 'dirty' # 'dirty' (só redesenha o que mudou) ou 'full' (tela toda todo frame)
+HUD_TEXT_CACHE_SIZE = 64 # Textos renderizados guardados (os menos usados saem primeiro)
+HUD_HEAT_COLOR = (255, 160, 40) # Cor da barra de calor (vai para RED perto do máximo)
+ANIMATION_FRAME_MS = { # ms entre quadros de cada animação
+    'player': 10,
+    'enemy': 75,
+    'bomber': 100,
+    'explosion': 40,
+    'background': 110,
+}
+
+# --- Resolução da janela (classes/display.py) ---
+# O jogo sempre simula e desenha em SCREEN_WIDTH x SCREEN_HEIGHT; a janela pode ter outro tamanho
+WINDOW_SIZE = None # (largura, altura) da janela; None = SCREEN_WIDTH x SCREEN_HEIGHT; (0, 0) com tela cheia = a do monitor
+WINDOW_FULLSCREEN = False
+RESOLUTION_MODE = 'internal' # Com escala: 'internal' (escala o frame inteiro) ou 'prescaled' (assets escalados uma vez)
+SCALE_SMOOTH = False # 'internal': smoothscale (suave, mais caro) em vez de scale (duplica pixels)
+
+# --- Passo fixo da simulação ---
+SIM_HZ = 60 # Passos de simulação por segundo (as velocidades em "px por frame" são por passo)
+RENDER_FPS = 60 # Limite de frames desenhados por segundo (0 = sem limite)
+MAX_SIM_STEPS = 10 # Passos no máximo por frame
+MAX_FRAME_TIME = 0.25 # s; um frame mais longo que isso (ex.: janela arrastada) não é recuperado
+MAX_FRAME_SKIP = 4 # Frames seguidos sem desenho quando a simulação fica para trás
+RENDER_INTERPOLATION = True # Desenha os sprites entre o passo anterior e o atual
+
+# --- Ondas de inimigos ---
+WAVE_FILE = 'waves.json' # Perfis de spawn (relativo à pasta do jogo)
+WAVE_PROFILE = 'normal' # 'normal', 'crescente' ou os de teste de carga 'stress' e 'stress_max'
+
+# --- Áudio ---
+AUDIO_CHANNELS = 16 # Canais do mixer
+AUDIO_RESERVED_CHANNELS = 1 # Canais só para loops (o motor), que os efeitos nunca roubam
+AUDIO_SOUNDS = { # nome: (asset, prioridade, vozes no máximo, ms mínimos entre disparos iguais)
+    'engine': ('engine_sound', 3, 1, 0),
+    'player_hit': ('explosion_sound', 3, 2, 0),
+    'explosion': ('explosion_sound', 2, 4, 30),
+    'gun': ('gun_sound', 1, 3, 45),
+}
+
+# --- Profiler de frames ---
+PROFILER_ENABLED = True
+PROFILER_FRAMES = 3600 # Frames guardados no ring buffer (1 min a 60 FPS)
+PROFILER_OVERLAY_KEY = 'f3' # Nome da tecla, como em pygame.key.key_code
+PROFILER_EXPORT_KEY = 'f4'
+PROFILER_EXPORT_DIR = 'profiles' # Relativo à pasta do jogo
+
+# --- Gravação de partidas (replay) ---
+REPLAY_RECORD = False # Grava cada partida em REPLAY_DIR (reproduza com python -m classes.replay)
+REPLAY_DIR = 'replays' # Relativo à pasta do jogo
+
+# --- Governador de qualidade (classes/governor.py) ---
+QUALITY_GOVERNOR = True # Reduz a qualidade quando os frames estouram o orçamento
+QUALITY_BUDGET_MS = 16.6 # Orçamento de trabalho por frame (60 FPS)
+QUALITY_WINDOW = 30 # Frames olhados para decidir descer um nível (pelo p90 deles)
+QUALITY_HEADROOM = 0.6 # Frame com folga: abaixo dessa fração do orçamento
+QUALITY_RECOVER_FRAMES = 180 # Frames seguidos com folga para subir um nível
+QUALITY_LEVELS = ('background', 'sounds', 'explosions', 'animation', 'enemy_shots') # O que é reduzido, nessa ordem
+QUALITY_SOUND_INTERVAL_MS = 120 # 'sounds': ms mínimos entre disparos do mesmo som
+QUALITY_EXPLOSION_STEP = 2 # 'explosions': quadros avançados por troca
+QUALITY_ANIMATION_SLOWDOWN = 2 # 'animation': multiplica os ms entre quadros de jogador e inimigos
+QUALITY_MAX_ENEMY_SHOTS = 60 # 'enemy_shots': tiros inimigos vivos no máximo
+
+# --- Simulações em lote (classes/batch.py) ---
+BATCH_MAX_SECONDS = 300 # Tempo simulado máximo de cada partida
+
+# --- Cache de assets em disco ---
+ASSET_CACHE_ENABLED = True
+ASSET_CACHE_DIR = '.asset_cache' # Relativo à pasta do jogo
+
+# --- Carregamento assíncrono de assets ---
+ASSET_LOADER_WORKERS = 4 # Threads que leem e decodificam os arquivos
+ASSET_SLICE_MS = 4 # Tempo máximo por frame convertendo superfícies na thread principal
 
 # --- Configurações do Arduino ---
 SERIAL_PORT = 'COM3'
-BAUD_RATE = 115200
\ No newline at end of file
+BAUD_RATE = 115200
+SERIAL_PROTOCOL = 'binary' # 'binary' (controle.ino atual) ou 'text' (sketch antigo)
+TELEMETRY_MIN_INTERVAL = 0.05 # s entre envios de calor/vidas (o sketch lê a cada 50 ms)
\ No newline at end of file
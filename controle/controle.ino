@@ -15,6 +15,30 @@ const int SHOOT_BTN_PIN = 3;
 // Variáveis para guardar o estado do jogo recebido do Python
 int weaponHeat = 0;
 int playerLives = 3;
+bool lcdDirty = true; // Só redesenha o LCD quando chega um valor novo
+
+// --- Protocolo binário (mesmos valores de classes/protocol.py) ---
+// Quadro: SYNC0 SYNC1 CABEÇALHO TAMANHO PAYLOAD... CRC8
+// CABEÇALHO = (versão << 4) | tipo; CRC8 (polinômio 0x07) sobre CABEÇALHO, TAMANHO e PAYLOAD
+const byte SYNC0 = 0xA5;
+const byte SYNC1 = 0x5A;
+const byte PROTOCOL_VERSION = 1;
+const byte MAX_PAYLOAD = 16;
+const byte MSG_INPUT = 1;     // Arduino -> jogo: seq, X (2 bytes), Y (2 bytes), botões
+const byte MSG_TELEMETRY = 2; // jogo -> Arduino: calor, vidas
+const byte BUTTON_JOY = 0x01;
+const byte BUTTON_SHOOT = 0x02;
+
+byte inputSeq = 0;
+
+// Estado do leitor de quadros vindos do Python
+enum RxState { WAIT_SYNC0, WAIT_SYNC1, READ_HEADER, READ_LENGTH, READ_PAYLOAD, READ_CRC };
+RxState rxState = WAIT_SYNC0;
+byte rxHeader = 0;
+byte rxLength = 0;
+byte rxCount = 0;
+byte rxCrc = 0;
+byte rxPayload[MAX_PAYLOAD];
 
 // --- Custom Characters ---
 byte heart[8] = {
@@ -49,34 +73,98 @@ void setup() {
 }
 
 void loop() {
-  // 1. LER E ENVIAR DADOS DO JOYSTICK E DO NOVO BOTÃO PARA O PYTHON
+  // 1. LER E ENVIAR DADOS DO JOYSTICK E DO BOTÃO DE TIRO PARA O PYTHON
   int joyX = analogRead(JOYSTICK_X_PIN);
   int joyY = analogRead(JOYSTICK_Y_PIN);
   int joyBtn = digitalRead(JOYSTICK_BTN_PIN);
-  int shootBtn = digitalRead(SHOOT_BTN_PIN); // NOVO: Lê o estado do botão de tiro
-
-  // MODIFICADO: Agora enviamos 4 valores
-  Serial.print(joyX);
-  Serial.print(",");
-  Serial.print(joyY);
-  Serial.print(",");
-  Serial.print(joyBtn); // Mantemos o botão do joystick, talvez para uma bomba no futuro?
-  Serial.print(",");
-  Serial.print(shootBtn); // Adicionamos o novo botão
-  Serial.println(); 
-
-  // 2. RECEBER DADOS DE ESTADO DO JOGO DO PYTHON
-  if (Serial.available() > 0) {
-    String dataFromPython = Serial.readStringUntil('\n');
-    sscanf(dataFromPython.c_str(), "H:%d,L:%d", &weaponHeat, &playerLives);
-  }
+  int shootBtn = digitalRead(SHOOT_BTN_PIN);
+  sendInput(joyX, joyY, joyBtn, shootBtn);
+
+  // 2. RECEBER DADOS DE ESTADO DO JOGO DO PYTHON (sem bloquear)
+  readTelemetry();
 
-  // 3. ATUALIZAR O DISPLAY LCD
-  updateLCD();
+  // 3. ATUALIZAR O DISPLAY LCD (só se algo mudou)
+  if (lcdDirty) {
+    updateLCD();
+    lcdDirty = false;
+  }
 
   delay(50);
 }
 
+byte crc8Update(byte crc, byte data) {
+  crc ^= data;
+  for (byte i = 0; i < 8; i++) {
+    crc = (crc & 0x80) ? (byte)((crc << 1) ^ 0x07) : (byte)(crc << 1);
+  }
+  return crc;
+}
+
+void sendInput(int joyX, int joyY, int joyBtn, int shootBtn) {
+  byte frame[11];
+  frame[0] = SYNC0;
+  frame[1] = SYNC1;
+  frame[2] = (PROTOCOL_VERSION << 4) | MSG_INPUT;
+  frame[3] = 6; // tamanho do payload
+  frame[4] = inputSeq++;
+  frame[5] = joyX & 0xFF;
+  frame[6] = joyX >> 8;
+  frame[7] = joyY & 0xFF;
+  frame[8] = joyY >> 8;
+  frame[9] = (joyBtn ? BUTTON_JOY : 0) | (shootBtn ? BUTTON_SHOOT : 0);
+  byte crc = 0;
+  for (byte i = 2; i < 10; i++) {
+    crc = crc8Update(crc, frame[i]);
+  }
+  frame[10] = crc;
+  Serial.write(frame, sizeof(frame));
+}
+
+void readTelemetry() {
+  while (Serial.available() > 0) {
+    byte b = Serial.read();
+    switch (rxState) {
+      case WAIT_SYNC0:
+        if (b == SYNC0) rxState = WAIT_SYNC1;
+        break;
+      case WAIT_SYNC1:
+        if (b == SYNC1) rxState = READ_HEADER;
+        else if (b != SYNC0) rxState = WAIT_SYNC0;
+        break;
+      case READ_HEADER:
+        if ((b >> 4) != PROTOCOL_VERSION) { rxState = WAIT_SYNC0; break; }
+        rxHeader = b;
+        rxCrc = crc8Update(0, b);
+        rxState = READ_LENGTH;
+        break;
+      case READ_LENGTH:
+        if (b > MAX_PAYLOAD) { rxState = WAIT_SYNC0; break; }
+        rxLength = b;
+        rxCount = 0;
+        rxCrc = crc8Update(rxCrc, b);
+        rxState = (b > 0) ? READ_PAYLOAD : READ_CRC;
+        break;
+      case READ_PAYLOAD:
+        rxPayload[rxCount++] = b;
+        rxCrc = crc8Update(rxCrc, b);
+        if (rxCount == rxLength) rxState = READ_CRC;
+        break;
+      case READ_CRC:
+        if (b == rxCrc) handleFrame(rxHeader & 0x0F, rxLength);
+        rxState = WAIT_SYNC0;
+        break;
+    }
+  }
+}
+
+void handleFrame(byte msgType, byte length) {
+  if (msgType == MSG_TELEMETRY && length >= 2) {
+    weaponHeat = rxPayload[0];
+    playerLives = rxPayload[1];
+    lcdDirty = true;
+  }
+}
+
 void updateLCD() {
   lcd.setCursor(0, 0);
   lcd.print("Temp: ");
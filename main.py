@@ -10,37 +10,121 @@ from config import *
 # --- Importa as classes dos nossos novos arquivos ---
 from classes.player import Player
 from classes.enemy import Enemy, Bomber
-from classes.effects import Bullet, EnemyBullet, Explosion
+from classes.effects import Explosion
+from classes.collision import sprite_radius, frame_mask, collide_circle_mask
+from classes.projectiles import ProjectileSystem, PLAYER, ENEMY
+from classes.pooling import SpritePool, SurfaceCache
+from classes.asset_cache import AssetCache
+from classes.serial_input import SerialReader, TelemetryWriter
+from classes.rendering import snapshot_centers, draw_interpolated
+from classes.profiler import FrameProfiler
+from classes.timestep import FixedTimestep, sim_clock
+from classes.animation import AnimationScheduler
+from classes.background import BackgroundLoop
+from classes.replay import InputRecorder
+from classes.waves import TypedGroup, WaveDirector, load_wave_profiles
+from classes.audio import AudioManager
+from classes.hud import TextCache, Hud
+from classes.loader import AssetLoader, INTRO, GAMEPLAY, EXTRAS
+from classes.governor import QualityGovernor
+from classes.display import Display, ScaledView
 
 #==============================================================================
 # CLASSE PRINCIPAL DO JOGO
 #==============================================================================
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, seed=None, input_source=None, serial_port=None, record=REPLAY_RECORD,
+                 wave_profile=WAVE_PROFILE, window_size=None, resolution_mode=RESOLUTION_MODE):
+        # Modo headless: sem janela, sem áudio e sem Arduino (drivers dummy do SDL)
+        self.headless = headless
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        if seed is not None:
+            random.seed(seed)
+        self.seed = seed
+        # Fonte de entrada roteirizada (ex.: ScriptedInput); substitui teclado/serial
+        self.input_source = input_source
+        # Gravação das partidas para replay (classes/replay.py)
+        self.record = record
+        self.recorder = None
+
         pygame.mixer.pre_init(44100, -16, 2, 512)
         pygame.init()
         pygame.mixer.init()
         
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # O jogo desenha sempre em SCREEN_WIDTH x SCREEN_HEIGHT; a janela pode ter outro tamanho (classes/display.py)
+        if window_size is None and not headless:
+            window_size = WINDOW_SIZE
+        self.display = Display(window_size, fullscreen=WINDOW_FULLSCREEN and not headless)
+        self.screen = self.display.canvas
         pygame.display.set_caption("Mustang P-51")
+        # Tela de jogo: no canvas (escalado inteiro em present) ou direto na janela com assets escalados uma vez
+        if resolution_mode not in ('internal', 'prescaled'):
+            raise ValueError(f"modo de resolução desconhecido: {resolution_mode}")
+        if resolution_mode == 'prescaled' and self.display.scaled:
+            self.view = ScaledView(self.display.view, self.display.scale, direct=True)
+        else:
+            self.view = ScaledView(self.screen)
+        self.frame_direct = False # O frame atual foi desenhado direto na janela (view)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 74)
         self.hud_font = pygame.font.Font(None, 40)
+        self.small_font = pygame.font.Font(None, 36)
+        # Textos renderizados uma vez e reaproveitados (classes/hud.py)
+        self.text_cache = TextCache()
+        self.hud = None
         self.running = True
         self.ser = None
+        self.serial_reader = None
+        self.telemetry = None
         
         self.assets = {}
+        self.surface_cache = SurfaceCache()
+        self.asset_cache = AssetCache(os.path.join(os.path.dirname(__file__), ASSET_CACHE_DIR), enabled=ASSET_CACHE_ENABLED)
+        # Todo som passa pelo AudioManager (limite de vozes e canal reservado para o motor)
+        self.audio = AudioManager()
+        # Um agendador só troca os quadros de todas as animações
+        self.animations = AnimationScheduler()
+        # Sob carga, reduz a qualidade em níveis para o frame caber no orçamento (classes/governor.py)
+        self.governor = QualityGovernor()
+        self.governor.listeners.append(self.on_quality_change)
+        self.play_button_rect = None
+        # Os assets chegam aos poucos (classes/loader.py); a intro aparece antes de tudo carregar
+        self.loader = AssetLoader(self.asset_cache, self.assets)
         self.load_assets()
-        self.setup_serial()
+        self.explosion_pool = SpritePool(Explosion)
+        # No modo headless a serial só é aberta se uma porta for passada (ex.: FakeArduino)
+        if serial_port is None and not headless:
+            serial_port = SERIAL_PORT
+        if serial_port:
+            self.setup_serial(serial_port)
 
         self.game_state = "intro"
-        
-        button_img = self.assets['play_button']
-        self.play_button_rect = button_img.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 170))
-        
-        self.bg_current_frame = 0
-        self.bg_last_update = pygame.time.get_ticks()
-        self.bg_anim_speed = 110
+
+        # Tipos de inimigo que o perfil de ondas pode criar (o nome é também o da animação)
+        self.enemy_factories = {
+            'enemy': lambda: Enemy(self.assets['enemy_anim'], self.player),
+            'bomber': lambda: Bomber(self.assets['bomber_anim']),
+        }
+        self.wave_profiles = load_wave_profiles(os.path.join(os.path.dirname(__file__), WAVE_FILE))
+        if wave_profile not in self.wave_profiles:
+            raise ValueError(f"perfil de ondas desconhecido: {wave_profile}")
+        self.wave_profile = wave_profile
+
+        # Retângulos para display.update() no frame atual (None = flip da tela toda)
+        self.renderer = self.view.renderer
+        self.update_rects = None
+
+        # Simulação em passos fixos; o desenho interpola entre o passo anterior e o atual
+        self.timestep = FixedTimestep()
+        self.prev_centers = {}
+        self.frame_rendered = True
+
+        # Tempo por fase de cada frame (F3 mostra o overlay, F4 exporta a sessão)
+        self.profiler = FrameProfiler(enabled=PROFILER_ENABLED)
+        self.profiler_overlay_key = pygame.key.key_code(PROFILER_OVERLAY_KEY)
+        self.profiler_export_key = pygame.key.key_code(PROFILER_EXPORT_KEY)
 
     def load_assets(self):
         main_dir = os.path.dirname(__file__)
@@ -54,194 +138,463 @@ class Game:
         sound_dir = os.path.join(main_dir, "Sound")
 
         # --- Carregamento dos assets ---
- 
-        self.assets['background_anim'] = []
-        for i in range(1, 15):
-            filename = f"wallpaper{i}.png"
-            img = pygame.image.load(os.path.join(wallpaper_dir, filename)).convert()
-            self.assets['background_anim'].append(img)
-
-        self.assets['intro_background'] = pygame.image.load(os.path.join(main_dir, "wallpaper_intro.png")).convert()
-        self.assets['play_button'] = pygame.image.load(os.path.join(main_dir, "play_button.png")).convert_alpha()
-        self.assets['bullet_img'] = pygame.image.load(os.path.join(shot_dir, "bullet.png")).convert_alpha()
-        self.assets['player_anim'] = [pygame.image.load(os.path.join(plane_dir, f"Avi{i}.png")).convert_alpha() for i in range(1, 13)]
-        self.assets['enemy_anim'] = [pygame.image.load(os.path.join(enemy_dir, f"enemy{i}.png")).convert_alpha() for i in range(1, 9)]
-        self.assets['explosion_anim'] = [pygame.transform.scale(pygame.image.load(os.path.join(explosion_dir, f"boom_flame{i}.png")).convert_alpha(), (75, 75)) for i in range(1, 10)]
-
-        self.assets['bomber_anim'] = []
-        for i in range(1, 7):
-            filename = f"bombardeiro{i}.png"
-            img = pygame.image.load(os.path.join(enemy_dir, filename)).convert_alpha()
-            self.assets['bomber_anim'].append(img)
+        # Pedidos em ordem de prioridade: intro, o que a partida precisa e, por
+        # fim, o resto do fundo animado e os sons (que entram com o jogo rodando)
+        loader = self.loader
+        loader.image('intro_background', os.path.join(main_dir, "wallpaper_intro.png"), INTRO, alpha=False)
+        loader.image('play_button', os.path.join(main_dir, "play_button.png"), INTRO)
+
+        self.assets['enemy_bullet_img'] = self.surface_cache.circle(5, ENEMY_BULLET_COLOR)
+        loader.image('bullet_img', os.path.join(shot_dir, "bullet.png"), GAMEPLAY)
+        loader.frames('player_anim', [os.path.join(plane_dir, f"Avi{i}.png") for i in range(1, 13)], GAMEPLAY)
+        loader.frames('enemy_anim', [os.path.join(enemy_dir, f"enemy{i}.png") for i in range(1, 9)], GAMEPLAY)
+        loader.frames('explosion_anim', [os.path.join(explosion_dir, f"boom_flame{i}.png") for i in range(1, 10)],
+                      GAMEPLAY, size=(75, 75))
+        loader.frames('bomber_anim', [os.path.join(enemy_dir, f"bombardeiro{i}.png") for i in range(1, 7)], GAMEPLAY)
+        # O primeiro quadro do fundo basta para jogar; os outros 13 chegam depois
+        wallpapers = [os.path.join(wallpaper_dir, f"wallpaper{i}.png") for i in range(1, 15)]
+        # O fundo guarda só o primeiro quadro e os blocos que mudam entre um quadro e outro
+        self.backdrop = BackgroundLoop(len(wallpapers))
+        loader.frames('background_anim', wallpapers[:1], GAMEPLAY, alpha=False, into=self.backdrop)
+        if self.view.images is None:
+            self.view.backdrop = self.backdrop
+        else:
+            # A tela de jogo na resolução da janela tem o seu fundo, com os quadros escalados ao chegar
+            self.view.backdrop = BackgroundLoop(len(wallpapers), tile=round(BACKGROUND_TILE * self.view.scale),
+                                                view_size=self.display.viewport.size)
+        loader.frames('background_anim', wallpapers[1:], EXTRAS, alpha=False)
 
         # Carregamento de sons
-        self.assets['engine_sound'] = pygame.mixer.Sound(os.path.join(sound_dir, "engine.wav"))
-        self.assets['explosion_sound'] = pygame.mixer.Sound(os.path.join(sound_dir, "explosion.wav"))
-        self.assets['gun_sound'] = pygame.mixer.Sound(os.path.join(sound_dir, "gun_sound.wav"))
+        loader.sound('engine_sound', os.path.join(sound_dir, "engine.wav"), EXTRAS)
+        loader.sound('explosion_sound', os.path.join(sound_dir, "explosion.wav"), EXTRAS)
+        loader.sound('gun_sound', os.path.join(sound_dir, "gun_sound.wav"), EXTRAS)
+
+        loader.when_ready(INTRO, self.on_intro_assets)
+        loader.when_ready(GAMEPLAY, self.on_gameplay_assets)
+        loader.on_load('background_anim', self.on_background_frame)
+        for key in ('engine_sound', 'explosion_sound', 'gun_sound'):
+            loader.on_load(key, self.on_sound)
+
+    def on_intro_assets(self):
+        button_img = self.assets['play_button']
+        self.play_button_rect = button_img.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 170))
+
+    def on_gameplay_assets(self):
+        # Quem colide ganha uma máscara por quadro, calculada aqui uma vez só
+        for name, asset in (('player', 'player_anim'), ('enemy', 'enemy_anim'), ('bomber', 'bomber_anim')):
+            self.animations.register(name, self.assets[asset], ANIMATION_FRAME_MS[name], masks=True)
+        self.animations.register('explosion', self.assets['explosion_anim'], ANIMATION_FRAME_MS['explosion'], loop=False)
+        # O agendador só conta os quadros do fundo; o BackgroundLoop aplica as mudanças
+        self.animations.register('background', self.backdrop, ANIMATION_FRAME_MS['background'])
+        self.apply_quality()
+        view = self.view
+        if view.images is None:
+            self.hud = Hud(self.hud_font, self.text_cache, self.assets['player_anim'][0])
+        else:
+            # Tudo o que a tela de jogo desenha é escalado agora, e não durante o jogo
+            view.images.prescale(frame for asset in ('player_anim', 'enemy_anim', 'bomber_anim', 'explosion_anim')
+                                 for frame in self.assets[asset])
+            view.images.prescale((self.assets['bullet_img'], self.assets['enemy_bullet_img']))
+            self.hud = Hud(view.font(40), self.text_cache, self.assets['player_anim'][0], view.scale)
 
-    def setup_serial(self):
+    def on_background_frame(self, key, frame):
+        if self.view.backdrop is not self.backdrop:
+            self.view.backdrop.append(frame)
+        if 'background' in self.animations.sets:
+            self.animations.sets['background'].refresh()
+
+    def on_sound(self, key, sound):
+        for name, (asset, priority, max_voices, min_interval_ms) in AUDIO_SOUNDS.items():
+            if asset == key:
+                self.audio.register(name, sound, priority, max_voices, min_interval_ms)
+
+    def setup_serial(self, port=SERIAL_PORT):
         try:
-            self.ser = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=0.01)
-            print(f"Conectado ao Arduino em {SERIAL_PORT}")
+            self.ser = serial.Serial(port, BAUD_RATE, timeout=0.05)
+            # A leitura fica numa thread própria; o loop do jogo só pega a última amostra
+            self.serial_reader = SerialReader(self.ser).start()
+            self.telemetry = TelemetryWriter(self.ser)
+            print(f"Conectado ao Arduino em {port}")
         except serial.SerialException:
             print(f"AVISO: Arduino não encontrado. Controle via teclado habilitado.")
             self.ser = None
 
+    def drop_serial(self):
+        """Fecha a serial depois de uma falha na leitura; o controle passa para o teclado."""
+        print(f"AVISO: conexão com o Arduino perdida ({self.serial_reader.error}). Controle via teclado habilitado.")
+        self.serial_reader.stop()
+        try:
+            self.ser.close()
+        except (serial.SerialException, OSError):
+            pass
+        self.ser = None
+        self.serial_reader = None
+        self.telemetry = None
+
     def run(self):
+        profiler = self.profiler
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
-            events = pygame.event.get()
-
-            if self.game_state == "intro":
-                self.handle_intro_events(events)
-                self.draw_intro_screen()
-            elif self.game_state == "playing":
-                self.handle_playing_events(events)
-                self.update_playing_state(dt)
-                self.draw_playing_screen()
-            elif self.game_state == "game_over":
-                self.handle_game_over_events(events)
-                self.draw_game_over_screen()
-
-            pygame.display.flip()
+            dt = self.clock.tick(RENDER_FPS) / 1000.0
+            started = time.perf_counter()
+            profiler.begin_frame()
+            with profiler.phase('events'):
+                events = pygame.event.get()
+            self.step(dt, events)
+            with profiler.phase('flip'):
+                if self.frame_rendered: # Frame pulado: a tela fica como estava e nada é apresentado
+                    self.display.present(self.update_rects, direct=self.frame_direct)
+            profiler.end_frame(self.entity_counts())
+            if self.game_state == "playing":
+                # Trabalho do frame, sem a espera do tick
+                self.governor.frame((time.perf_counter() - started) * 1000.0)
         
         self.quit()
 
+    def step(self, dt, events=(), steps=None, draw=True):
+        """Executa um frame: eventos, os passos de simulação que couberem em `dt` s e o desenho.
+
+        Sob carga o desenho pode ser pulado (frame_rendered fica False) para a
+        simulação continuar em tempo real. `steps` força o número de passos
+        (usado pelo replay, que refaz os frames exatamente como foram gravados).
+        Com `draw` False a tela de jogo não é desenhada (simulações em lote).
+        """
+        self.update_rects = None
+        self.frame_rendered = True
+        self.frame_direct = False
+        self.handle_profiler_keys(events)
+        if self.loader.jobs:
+            with self.profiler.phase('assets'):
+                self.loader.pump()
+        if self.game_state == "intro":
+            self.handle_intro_events(events)
+            self.draw_intro_screen()
+        elif self.game_state == "playing":
+            self.handle_playing_events(events)
+            if self.recorder:
+                self.recorder.quality(self.governor.level)
+            if steps is None:
+                steps = self.timestep.advance(dt)
+            for _ in range(steps):
+                self.update_playing_state(self.timestep.step)
+                if self.game_state != "playing":
+                    break
+            if self.recorder:
+                self.recorder.end_frame()
+                if self.game_state != "playing":
+                    self.finish_recording()
+            self.frame_rendered = draw and self.timestep.should_render()
+            if self.frame_rendered:
+                self.draw_playing_screen()
+        elif self.game_state == "game_over":
+            self.handle_game_over_events(events)
+            self.draw_game_over_screen()
+
+    def handle_profiler_keys(self, events):
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == self.profiler_overlay_key:
+                self.profiler.toggle_overlay()
+                self.renderer.invalidate()
+            if event.type == pygame.KEYDOWN and event.key == self.profiler_export_key:
+                self.export_profile()
+
+    def export_profile(self):
+        export_dir = os.path.join(os.path.dirname(__file__), PROFILER_EXPORT_DIR)
+        os.makedirs(export_dir, exist_ok=True)
+        base = os.path.join(export_dir, time.strftime("profile-%Y%m%d-%H%M%S"))
+        self.profiler.export_csv(base + ".csv")
+        self.profiler.export_chrome_trace(base + ".json")
+        print(f"Perfil exportado em {base}.csv e {base}.json")
+
+    def entity_counts(self):
+        if self.game_state != "playing":
+            return {}
+        return {
+            'enemies': len(self.enemies),
+            'bombers': self.enemies.count('bomber'),
+            'player_shots': self.projectiles.live(PLAYER),
+            'enemy_shots': self.projectiles.live(ENEMY),
+            'explosions': len(self.explosions),
+            'voices': self.audio.busy(),
+            'quality': self.governor.level,
+        }
+
     def handle_intro_events(self, events):
         for event in events:
             if event.type == pygame.QUIT: self.running = False
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.play_button_rect.collidepoint(event.pos):
+                if self.play_button_rect and self.play_button_rect.collidepoint(self.display.to_internal(event.pos)):
                     self.start_new_game()
     
     def draw_intro_screen(self):
-        self.screen.blit(self.assets['intro_background'], (0, 0))
-        self.screen.blit(self.assets['play_button'], self.play_button_rect)
+        if self.loader.ready(INTRO):
+            self.screen.blit(self.assets['intro_background'], (0, 0))
+            self.screen.blit(self.assets['play_button'], self.play_button_rect)
+        else:
+            self.screen.fill((0, 0, 0))
+        if not self.loader.ready():
+            self.draw_loading_bar(self.loader.progress())
+
+    def draw_loading_bar(self, progress):
+        bar = pygame.Rect(0, 0, SCREEN_WIDTH // 2, 12)
+        bar.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT - 40)
+        pygame.draw.rect(self.screen, WHITE, bar, 1)
+        fill = bar.inflate(-4, -4)
+        fill.width = int(fill.width * progress)
+        pygame.draw.rect(self.screen, WHITE, fill)
 
     def start_new_game(self):
+        # Só espera o que a partida usa; o resto do fundo e os sons continuam chegando
+        self.loader.wait(GAMEPLAY)
+        # Cada partida tem a sua seed; com ela e os comandos gravados, o replay refaz a partida igual
+        self.game_seed = self.seed if self.seed is not None else random.randrange(1 << 32)
+        random.seed(self.game_seed)
+        sim_clock.reset()
+        self.animations.clear()
+        self.animations.play(self.backdrop, 'background')
+        self.finish_recording()
+        if self.record:
+            self.start_recording()
         self.score = 0
         self.all_sprites = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
-        self.enemy_bullets = pygame.sprite.Group()
+        self.enemies = TypedGroup() # Contagem de inimigos vivos por tipo
+        self.projectiles = ProjectileSystem({PLAYER: self.assets['bullet_img'], ENEMY: self.assets['enemy_bullet_img']})
         self.explosions = pygame.sprite.Group()
-        self.player = Player(self.assets['player_anim'], self.assets['bullet_img'], self.assets['gun_sound'])
-        self.all_sprites.add(self.player)
-        self.enemy_spawn_timer = pygame.USEREVENT + 1
-        pygame.time.set_timer(self.enemy_spawn_timer, 1100)
-        self.bomber_spawn_timer = pygame.USEREVENT + 2 # Um número de evento diferente
-        pygame.time.set_timer(self.bomber_spawn_timer, 60000) #timer do bombareiro, 1min
-        self.assets['engine_sound'].play(loops=-1)
+        self.explosion_pool.reclaim()
+        self.explosion_pool.prefill(EXPLOSION_POOL_SIZE, (0, 0), self.assets['explosion_anim'])
+        self.player = Player(self.assets['player_anim'], self.assets['bullet_img'], self.audio.sound('gun'))
+        self.spawn(self.player, 'player')
+        # Os spawns vêm do perfil de ondas (waves.json), no tempo da simulação
+        self.waves = WaveDirector(self.wave_profiles[self.wave_profile], self.enemy_factories)
+        # Cada partida começa na qualidade cheia; o nível da anterior não vale para esta
+        self.governor.reset()
+        self.apply_quality()
+        self.audio.play_loop('engine')
+        self.timestep.reset()
+        self.prev_centers = {}
+        self.renderer.invalidate()
         self.game_state = "playing"
 
     def handle_playing_events(self, events):
-        for event in events:
-            if event.type == pygame.QUIT: self.running = False
-            if event.type == self.enemy_spawn_timer and self.game_state == "playing":
-                new_enemy = Enemy(self.assets['enemy_anim'], self.player)
-                self.all_sprites.add(new_enemy)
-                self.enemies.add(new_enemy)
-            
-            if event.type == self.bomber_spawn_timer and self.game_state == "playing":
-                # Só cria um bombardeiro se não houver outro na tela
-                if not any(isinstance(sprite, Bomber) for sprite in self.enemies):
-                    new_bomber = Bomber(self.assets['bomber_anim'])
-                    self.all_sprites.add(new_bomber)
-                    self.enemies.add(new_bomber) # Adiciona ao grupo de inimigos gerais
-        self.handle_controls()
-                
+        with self.profiler.phase('events'):
+            for event in events:
+                if event.type == pygame.QUIT: self.running = False
+
+    def spawn_waves(self):
+        for kind, count in self.waves.update(sim_clock.get_ticks(), self.enemies):
+            for _ in range(count):
+                self.spawn(self.enemy_factories[kind](), kind, self.enemies)
+
     def handle_controls(self):
-        if self.ser is None:
+        dx, dy, shoot = self.read_controls()
+        if self.recorder:
+            self.recorder.command(dx, dy, shoot)
+        self.player.move(dx, dy)
+        if shoot:
+            self.player.shoot(self.projectiles)
+
+    def read_controls(self):
+        """Comando (dx, dy, atirar) deste passo, da fonte de entrada ativa."""
+        if self.serial_reader is not None and self.serial_reader.error is not None:
+            self.drop_serial()
+        if self.input_source is not None:
+            return self.input_source.poll()
+        elif self.ser is None:
             keys = pygame.key.get_pressed()
             dx, dy = 0, 0
             if keys[pygame.K_LEFT]: dx = -1
             if keys[pygame.K_RIGHT]: dx = 1
             if keys[pygame.K_UP]: dy = -1
             if keys[pygame.K_DOWN]: dy = 1
-            self.player.move(dx, dy)
-            if keys[pygame.K_SPACE]:
-                self.player.shoot(self.all_sprites, self.bullets)
-        elif self.ser.in_waiting > 0:
-            try:
-                line = self.ser.readline().decode('utf-8').strip()
-                parts = line.split(',')
-                if len(parts) == 4:
-                    joy_x, joy_y, joy_btn, shoot_btn = map(int, parts)
-                    dx, dy = 0, 0
-                    if joy_x < 400: dx = -1
-                    elif joy_x > 600: dx = 1
-                    if joy_y < 400: dy = -1 
-                    elif joy_y > 600: dy = 1 
-                    self.player.move(dx, dy)
-                    if shoot_btn == 0:
-                        self.player.shoot(self.all_sprites, self.bullets)
-            except (ValueError, IndexError, UnicodeDecodeError):
-                pass
-                
+            return dx, dy, bool(keys[pygame.K_SPACE])
+        else:
+            state = self.serial_reader.take()
+            if state is None:
+                return 0, 0, False # Nenhuma amostra nova: o jogador fica parado
+            dx, dy = 0, 0
+            if state.joy_x < 400: dx = -1
+            elif state.joy_x > 600: dx = 1
+            if state.joy_y < 400: dy = -1
+            elif state.joy_y > 600: dy = 1
+            return dx, dy, state.shoot_btn == 0
+
     def update_playing_state(self, dt):
-        self.player.update(dt, self.screen)
-        self.bullets.update()
-        self.enemies.update(self.all_sprites, self.enemy_bullets)
-        self.enemy_bullets.update()
-        self.explosions.update()
+        """Um passo da simulação, de `dt` s (o passo fixo do FixedTimestep)."""
+        if RENDER_INTERPOLATION:
+            self.prev_centers = snapshot_centers(self.all_sprites)
+        with self.profiler.phase('waves'):
+            self.spawn_waves()
+        with self.profiler.phase('controls'):
+            self.handle_controls()
+        self.update_sprites(dt)
+        with self.profiler.phase('collisions'):
+            self.handle_collisions()
 
-        hits = pygame.sprite.groupcollide(self.enemies, self.bullets, False, True)
+    def update_sprites(self, dt):
+        sim_clock.advance(dt) # Animações e intervalos de tiro contam o tempo da simulação
+        phase = self.profiler.phase
+        with phase('animation'):
+            self.animations.update()
+        with phase('player'):
+            self.player.update(dt, self.screen)
+        with phase('enemies'):
+            self.enemies.update(self.projectiles)
+        with phase('projectiles'):
+            self.projectiles.update()
+
+    def handle_collisions(self):
+        # Rect/círculo primeiro; com COLLISION_MASKS, só os pares que passam conferem os pixels
+        masks = COLLISION_MASKS
+        hits = self.projectiles.collide_rects(self.enemies, PLAYER, mask_of=frame_mask if masks else None)
     
         # cada inimigo que foi atingido
         for enemy_hit in hits:
             # Cria uma pequena explosão no ponto de impacto
-            explosion_point = hits[enemy_hit][0].rect.center
-            explosion = Explosion(explosion_point, self.assets['explosion_anim'])
-            self.all_sprites.add(explosion)
-            self.explosions.add(explosion)
+            self.spawn_explosion(hits[enemy_hit][0].tolist())
         
-            # Verifica se o inimigo é um Bombardeiro
-            if isinstance(enemy_hit, Bomber):
-                # Chama o método 'hit()' do bombardeiro. Se retornar True, ele foi destruído.
-                if enemy_hit.hit():
-                    self.score += 50 
-                    self.assets['explosion_sound'].play() # Som de explosão maior
-            else:
-                # Se for um inimigo comum, ele é destruído na hora
-                enemy_hit.kill()
-                self.score += 10 
-                self.assets['explosion_sound'].play()
+            # O inimigo comum morre na hora; o bombardeiro aguenta alguns tiros.
+            # hit() devolve True quando o inimigo foi destruído.
+            if enemy_hit.hit():
+                self.score += enemy_hit.score_value
+                self.audio.play('explosion')
         
-        enemy_hits = pygame.sprite.spritecollide(self.player, self.enemies, True, pygame.sprite.collide_circle)
-        bullet_hits = pygame.sprite.spritecollide(self.player, self.enemy_bullets, True, pygame.sprite.collide_circle)
+        # Um sprite contra o grupo: o laço em C do pygame já é linear, e uma grade em
+        # Python por cima só custava mais (só os tiros têm broadphase, no ProjectileSystem)
+        enemy_hits = pygame.sprite.spritecollide(self.player, self.enemies, True,
+                                                 collide_circle_mask if masks else pygame.sprite.collide_circle)
+        bullet_hits = self.projectiles.collide_circle(self.player, sprite_radius(self.player), ENEMY,
+                                                      mask=frame_mask(self.player) if masks else None)
         if enemy_hits or bullet_hits:
             self.player_hit()
 
     def draw_playing_screen(self):
-        # --- MODIFICAÇÃO PARA O FUNDO ANIMADO ---
-        now = pygame.time.get_ticks()
-        if now - self.bg_last_update > self.bg_anim_speed:
-            self.bg_last_update = now
-            self.bg_current_frame = (self.bg_current_frame + 1) % len(self.assets['background_anim'])
-        current_bg_image = self.assets['background_anim'][self.bg_current_frame]
-        self.screen.blit(current_bg_image, (0, 0))
-    
-        self.all_sprites.draw(self.screen)
-    
-        score_text = f"Pontos: {self.score}"
-        text_surface = self.hud_font.render(score_text, True, WHITE)
-        text_rect = text_surface.get_rect(bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20))
-        self.screen.blit(text_surface, text_rect)
-    
-        self.send_data_to_arduino()
+        phase = self.profiler.phase
+        view = self.view
+        self.frame_direct = view.direct
+        with phase('background'):
+            self.draw_background()
+        with phase('sprites'):
+            self.renderer.add(self.draw_sprites())
+        with phase('proj_draw'):
+            self.renderer.add(self.projectiles.draw(view.surface, self.render_alpha(), view.scale, view.images))
+        with phase('hud'):
+            self.renderer.add(self.draw_hud())
+            overlay_rect = self.profiler.draw_overlay(view.surface)
+            if overlay_rect:
+                self.renderer.add([overlay_rect])
+        self.update_rects = self.renderer.end()
+        with phase('telemetry'):
+            self.send_data_to_arduino()
+
+    def render_alpha(self):
+        return self.timestep.alpha if RENDER_INTERPOLATION else 1.0
+
+    def draw_sprites(self):
+        # Group.draw() não devolve as áreas desenhadas, que o DirtyRenderer precisa
+        previous = self.prev_centers if RENDER_INTERPOLATION else {}
+        view = self.view
+        return draw_interpolated(view.surface, self.all_sprites, previous, self.render_alpha(), view.scale, view.images)
+
+    def draw_background(self):
+        # O AnimationScheduler troca o quadro; o BackgroundLoop aplica só os blocos que mudaram.
+        # Com o fundo congelado pelo governador, `image` fica no último quadro aplicado.
+        backdrop = self.view.backdrop
+        backdrop.current_frame = self.backdrop.current_frame # O agendador anima self.backdrop
+        changed = [] if self.governor.active('background') else backdrop.update()
+        self.renderer.begin(backdrop.image, changed)
+
+    def draw_hud(self):
+        # Calor e vidas como o Arduino recebe (send_data_to_arduino)
+        player = self.player
+        return self.hud.draw(self.view.surface, self.score, int(player.heat), player.max_heat, max(player.lives, 0))
+
+    def on_quality_change(self, previous, level):
+        self.apply_quality()
+        if not self.headless:
+            print(f"Qualidade: nível {previous} -> {level} (reduzido: {self.governor.describe()})")
+
+    def apply_quality(self):
+        """Aplica o nível do governador nas animações, no áudio e nos tiros inimigos."""
+        governor = self.governor
+        self.audio.throttle(QUALITY_SOUND_INTERVAL_MS if governor.active('sounds') else 0)
+        slowdown = QUALITY_ANIMATION_SLOWDOWN if governor.active('animation') else 1
+        for name in ('player', 'enemy', 'bomber'):
+            animation = self.animations.sets.get(name)
+            if animation is not None:
+                animation.frame_ms = animation.base_frame_ms * slowdown
+        explosion = self.animations.sets.get('explosion')
+        if explosion is not None:
+            explosion.step = QUALITY_EXPLOSION_STEP if governor.active('explosions') else 1
+        # Sem partida em andamento não há projéteis; start_new_game chama de novo
+        if getattr(self, 'projectiles', None) is not None:
+            self.projectiles.limit(ENEMY, QUALITY_MAX_ENEMY_SHOTS if governor.active('enemy_shots') else None)
+
+    def spawn(self, sprite, animation, *groups):
+        """Coloca um sprite em jogo (all_sprites e `groups`) já com a sua animação rodando."""
+        self.all_sprites.add(sprite)
+        for group in groups:
+            group.add(sprite)
+        self.animations.play(sprite, animation)
+        # Um sprite reaproveitado do pool ainda pode ter o centro do passo anterior
+        # no snapshot; sem ele, é desenhado onde nasceu, sem interpolar
+        self.prev_centers.pop(sprite, None)
+        return sprite
+
+    def spawn_explosion(self, center):
+        self.spawn(self.explosion_pool.acquire(center, self.assets['explosion_anim']), 'explosion', self.explosions)
+
+    def start_recording(self):
+        replay_dir = os.path.join(os.path.dirname(__file__), REPLAY_DIR)
+        os.makedirs(replay_dir, exist_ok=True)
+        # Duas partidas no mesmo segundo (e com a mesma seed) ganham um sufixo; nada é sobrescrito
+        base = os.path.join(replay_dir, time.strftime("replay-%Y%m%d-%H%M%S") + f"-{self.game_seed}")
+        attempt = 0
+        while self.recorder is None:
+            path = base + (f"-{attempt}" if attempt else "") + ".p51r"
+            try:
+                self.recorder = InputRecorder(path, self.game_seed, self.wave_profile)
+            except FileExistsError:
+                attempt += 1
+
+    def finish_recording(self):
+        if self.recorder:
+            self.recorder.close(self.replay_summary())
+            print(f"Partida gravada em {self.recorder.path}")
+            self.recorder = None
+
+    def replay_summary(self):
+        """Estado final que o replay precisa reproduzir."""
+        return {
+            'score': self.score,
+            'lives': self.player.lives,
+            'enemies': len(self.enemies),
+            'player_shots': self.projectiles.live(PLAYER),
+            'enemy_shots': self.projectiles.live(ENEMY),
+            'explosions': len(self.explosions),
+        }
+
+    def allocation_stats(self):
+        """Contadores acumulados de alocação (pools e cache de superfícies).
+
+        As Surfaces criadas de fato (textos, HUD, cópias) são contadas pelo
+        benchmark.py allocations, que observa o pygame durante a partida.
+        """
+        return {
+            'explosions_created': self.explosion_pool.created,
+            'explosions_reused': self.explosion_pool.reused,
+            'surface_cache_misses': self.surface_cache.misses,
+            'projectile_capacity': len(self.projectiles.speed),
+        }
 
     def player_hit(self):
         if self.player.alive():
             self.player.lives -= 1
-            self.assets['explosion_sound'].play()
-            explosion = Explosion(self.player.rect.center, self.assets['explosion_anim'])
-            self.all_sprites.add(explosion)
-            self.explosions.add(explosion)
+            self.audio.play('player_hit')
+            self.spawn_explosion(self.player.rect.center)
             if self.player.lives <= 0:
                 self.end_game()
 
     def end_game(self):
-        self.assets['engine_sound'].stop()
+        self.audio.stop_loop('engine')
         if self.player.alive(): self.player.kill() 
         self.game_state = "game_over"
 
@@ -252,33 +605,33 @@ class Game:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1: self.game_state = "intro"
                 
     def draw_game_over_screen(self):
-        self.screen.blit(self.assets['background_anim'][0], (0, 0))
+        self.backdrop.update() # Com a tela de jogo direto na janela, o fundo do canvas ficou para trás
+        self.screen.blit(self.backdrop.image, (0, 0))
         self.all_sprites.draw(self.screen)
+        self.projectiles.draw(self.screen)
         
-        text = self.font.render("Killed in Action", True, RED)
+        text = self.text_cache.render(self.font, "Killed in Action", RED)
         text_rect = text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 40))
         self.screen.blit(text, text_rect)
 
         final_score_text = f"Sua pontuacao: {self.score}"
-        score_surface = self.hud_font.render(final_score_text, True, WHITE)
+        score_surface = self.text_cache.render(self.hud_font, final_score_text, WHITE)
         score_rect = score_surface.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 40))
         self.screen.blit(score_surface, score_rect)
         
-        small_font = pygame.font.Font(None, 36)
-        restart_text = small_font.render("Clique ou pressione ENTER para voltar", True, WHITE)
+        restart_text = self.text_cache.render(self.small_font, "Clique ou pressione ENTER para voltar", WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 50))
         self.screen.blit(restart_text, restart_rect)
 
     def send_data_to_arduino(self):
-        if self.ser and self.player.alive():
-            try:
-                heat_level = int(self.player.heat)
-                lives_count = self.player.lives
-                data_string = f"H:{heat_level},L:{lives_count}\n"
-                self.ser.write(data_string.encode('utf-8'))
-            except Exception: pass
+        # Só envia quando calor ou vidas mudam (com limite de taxa no TelemetryWriter)
+        if self.telemetry and self.player.alive():
+            self.telemetry.update(int(self.player.heat), self.player.lives)
 
     def quit(self):
+        self.finish_recording()
+        self.loader.close()
+        if self.serial_reader: self.serial_reader.stop()
         if self.ser: self.ser.close()
         pygame.quit()
 
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Os testes importam main.py e classes/ como o jogo (rodando da pasta do jogo)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
@@ -0,0 +1,105 @@
+import os
+
+import pygame
+import pytest
+
+from classes.asset_cache import AssetCache
+
+
+@pytest.fixture(autouse=True)
+def display():
+    # convert()/convert_alpha() precisam de uma tela (driver dummy, ver conftest.py)
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+
+def save_png(path, size, color, alpha=255):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color + (alpha,))
+    surface.set_at((0, 0), (1, 2, 3, 255)) # Um pixel diferente para conferir a orientação
+    pygame.image.save(surface, str(path))
+
+
+def pixels(surface, fmt='RGBA'):
+    return pygame.image.tobytes(surface, fmt)
+
+
+@pytest.mark.parametrize('alpha, compress', [(True, False), (False, False), (True, True)])
+def test_second_load_hits_and_reads_back_same_pixels(tmp_path, alpha, compress):
+    png = tmp_path / "sprite.png"
+    save_png(png, (7, 5), (200, 100, 50), alpha=128)
+    cache = AssetCache(str(tmp_path / "cache"), validate='mtime', compress=compress)
+    fmt = 'RGBA' if alpha else 'RGB'
+    first = cache.image(str(png), alpha=alpha)
+    second = cache.image(str(png), alpha=alpha)
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert second.get_size() == (7, 5)
+    assert pixels(second, fmt) == pixels(first, fmt)
+
+
+def test_size_is_part_of_the_key(tmp_path):
+    png = tmp_path / "boom.png"
+    save_png(png, (10, 10), (255, 0, 0))
+    cache = AssetCache(str(tmp_path / "cache"))
+    assert cache.image(str(png), size=(4, 4)).get_size() == (4, 4)
+    assert cache.image(str(png)).get_size() == (10, 10)
+    assert cache.image(str(png), size=(4, 4)).get_size() == (4, 4)
+    assert (cache.misses, cache.hits) == (2, 1)
+
+
+def test_changed_mtime_invalidates(tmp_path):
+    png = tmp_path / "sprite.png"
+    save_png(png, (6, 6), (0, 255, 0))
+    cache = AssetCache(str(tmp_path / "cache"))
+    cache.image(str(png))
+    # Mesmo tamanho de arquivo, conteúdo novo e mtime diferente
+    save_png(png, (6, 6), (0, 0, 255))
+    stat = os.stat(png)
+    os.utime(png, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    reloaded = cache.image(str(png))
+    assert (cache.misses, cache.hits) == (2, 0)
+    assert reloaded.get_at((3, 3))[:3] == (0, 0, 255)
+
+
+def test_changed_size_invalidates_even_with_same_mtime(tmp_path):
+    png = tmp_path / "sprite.png"
+    save_png(png, (6, 6), (0, 255, 0))
+    mtime_ns = os.stat(png).st_mtime_ns
+    cache = AssetCache(str(tmp_path / "cache"))
+    cache.image(str(png))
+    size = os.stat(png).st_size
+    save_png(png, (64, 48), (0, 255, 0))
+    os.utime(png, ns=(mtime_ns, mtime_ns))
+    assert os.stat(png).st_size != size
+    reloaded = cache.image(str(png))
+    assert (cache.misses, cache.hits) == (2, 0)
+    assert reloaded.get_size() == (64, 48)
+
+
+def test_hash_validation_catches_same_mtime_and_size(tmp_path):
+    png = tmp_path / "sprite.png"
+    save_png(png, (6, 6), (0, 255, 0))
+    stat = os.stat(png)
+    by_mtime = AssetCache(str(tmp_path / "cache"))
+    by_hash = AssetCache(str(tmp_path / "cache"), validate='hash')
+    by_mtime.image(str(png))
+    save_png(png, (6, 6), (255, 0, 255))
+    assert os.stat(png).st_size == stat.st_size
+    os.utime(png, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert by_mtime.image(str(png)).get_at((3, 3))[:3] == (0, 255, 0) # Não percebe a troca
+    assert by_hash.image(str(png)).get_at((3, 3))[:3] == (255, 0, 255)
+    assert by_hash.misses == 1
+
+
+def test_truncated_cache_file_is_rebuilt(tmp_path):
+    png = tmp_path / "sprite.png"
+    save_png(png, (6, 6), (10, 20, 30))
+    cache_dir = tmp_path / "cache"
+    cache = AssetCache(str(cache_dir))
+    cache.image(str(png))
+    [cached] = list(cache_dir.iterdir())
+    cached.write_bytes(cached.read_bytes()[:-10])
+    assert cache.image(str(png)).get_at((3, 3))[:3] == (10, 20, 30)
+    assert (cache.misses, cache.hits) == (2, 0)
@@ -0,0 +1,124 @@
+import pygame
+import pytest
+
+from classes.audio import AudioManager
+
+CHANNELS = 4  # 1 reservado para loops + 3 para efeitos
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds=1.0):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def audio(clock):
+    pygame.mixer.init()
+    manager = AudioManager(channels=CHANNELS, reserved=1, clock=clock)
+    yield manager
+    manager.stop_all()
+    pygame.mixer.quit()
+
+
+def make_sound():
+    # 10 s de silêncio: o canal continua ocupado durante o teste
+    return pygame.mixer.Sound(buffer=bytes(44100 * 4 * 10))
+
+
+def play(audio, clock, name):
+    clock.advance()
+    return audio.play(name)
+
+
+def test_voice_cap_restarts_the_oldest_voice(audio, clock):
+    audio.register('shot', make_sound(), max_voices=2)
+    first = play(audio, clock, 'shot')
+    second = play(audio, clock, 'shot')
+    assert first is not second
+    assert play(audio, clock, 'shot') is first
+    assert play(audio, clock, 'shot') is second  # Agora a mais antiga é a segunda
+    assert audio.capped == 2 and audio.stolen == 0 and audio.busy() == 2
+
+
+def test_a_voice_that_ended_frees_its_slot(audio, clock):
+    audio.register('shot', make_sound(), max_voices=1)
+    play(audio, clock, 'shot').stop()
+    play(audio, clock, 'shot')
+    assert audio.capped == 0 and audio.played == 2
+
+
+def test_full_mixer_steals_the_oldest_of_the_lowest_priority(audio, clock):
+    audio.register('low_a', make_sound(), priority=0)
+    audio.register('low_b', make_sound(), priority=0)
+    audio.register('mid', make_sound(), priority=3)
+    audio.register('high', make_sound(), priority=5)
+    low_a, low_b, high = (play(audio, clock, name) for name in ('low_a', 'low_b', 'high'))
+    assert play(audio, clock, 'mid') is low_a  # Menor prioridade, o mais antigo dos dois
+    assert play(audio, clock, 'mid') is low_b
+    assert play(audio, clock, 'low_a') is None  # Só sobraram efeitos mais prioritários
+    assert play(audio, clock, 'mid') is low_a  # Mesma prioridade: rouba o 'mid' mais antigo
+    assert high.get_sound() is audio.specs['high'].sound
+    assert audio.stolen == 3 and audio.dropped == 1 and audio.busy() == CHANNELS - 1
+
+
+def test_never_steals_a_higher_priority_effect(audio, clock):
+    audio.register('low', make_sound(), priority=0)
+    for index in range(CHANNELS - 1):
+        audio.register(f'high{index}', make_sound(), priority=5)
+        play(audio, clock, f'high{index}')
+    assert play(audio, clock, 'low') is None
+    assert audio.dropped == 1 and audio.stolen == 0 and audio.busy() == CHANNELS - 1
+
+
+def test_loops_keep_their_reserved_channel(audio, clock):
+    engine = make_sound()
+    audio.register('engine', engine)
+    audio.play_loop('engine')
+    loop_channel = audio.loops['engine']
+    audio.register('shot', make_sound())
+    for _ in range(10):
+        assert play(audio, clock, 'shot') is not loop_channel
+    assert loop_channel.get_busy() and loop_channel.get_sound() is engine
+    assert audio.busy() == CHANNELS - 1
+
+
+def test_effects_never_take_an_idle_reserved_channel(audio, clock):
+    audio.register('shot', make_sound())
+    reserved = pygame.mixer.Channel(0)
+    for _ in range(CHANNELS):
+        play(audio, clock, 'shot')
+    assert not reserved.get_busy()
+    assert audio.busy() == CHANNELS - 1 and audio.stolen == 1
+
+
+def test_min_interval_and_throttle(audio, clock):
+    audio.register('hit', make_sound(), min_interval_ms=100)
+    assert audio.play('hit') is not None
+    clock.advance(0.05)
+    assert audio.play('hit') is None
+    clock.advance(0.05)
+    assert audio.play('hit') is not None
+    audio.throttle(500)
+    clock.advance(0.2)
+    assert audio.play('hit') is None
+    assert audio.rate_limited == 2
+
+
+def test_sounds_not_loaded_yet(audio, clock):
+    assert play(audio, clock, 'shot') is None
+    assert audio.dropped == 1
+    audio.play_loop('engine')
+    engine = make_sound()
+    audio.register('engine', engine)  # O loop pedido antes começa agora
+    assert audio.loops['engine'].get_sound() is engine
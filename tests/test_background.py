@@ -0,0 +1,79 @@
+import random
+
+import pygame
+
+from classes.background import BackgroundLoop
+
+SIZE = (101, 67) # Não é múltiplo do bloco: os retângulos da borda são cortados
+
+
+def synthetic_frames(count, seed=1):
+    """Quadros que diferem do anterior em alguns retângulos (como o fundo animado)."""
+    rng = random.Random(seed)
+    frame = pygame.Surface(SIZE)
+    frame.fill((20, 40, 60))
+    frames = [frame.copy()]
+    for _ in range(count - 1):
+        for _ in range(rng.randint(0, 4)):
+            rect = pygame.Rect(rng.randrange(SIZE[0]), rng.randrange(SIZE[1]), rng.randint(1, 30), rng.randint(1, 30))
+            frame.fill((rng.randrange(256), rng.randrange(256), rng.randrange(256)), rect)
+        frame.set_at((rng.randrange(SIZE[0]), rng.randrange(SIZE[1])), (255, 255, 255)) # Um pixel solto
+        frames.append(frame.copy())
+    return frames
+
+
+def same_pixels(a, b):
+    return pygame.image.tobytes(a, 'RGB') == pygame.image.tobytes(b, 'RGB')
+
+
+def build(frames, tile=8):
+    loop = BackgroundLoop(len(frames), size=SIZE, tile=tile)
+    for frame in frames:
+        loop.append(frame)
+    return loop
+
+
+def test_rebuilds_every_frame_exactly():
+    frames = synthetic_frames(14)
+    loop = build(frames)
+    assert len(loop) == len(frames)
+    assert loop.last is None # Depois do último quadro o anterior não fica guardado
+    for _ in range(2): # Duas voltas: a segunda começa pela cópia do quadro-chave
+        for index, frame in enumerate(frames):
+            loop.current_frame = index
+            loop.update()
+            assert same_pixels(loop.image, frame), index
+    assert loop.full_copies == 1
+
+
+def test_changed_rects_cover_every_changed_pixel():
+    frames = synthetic_frames(14, seed=5)
+    loop = build(frames, tile=5)
+    for index in range(1, len(frames)):
+        before = loop.image.copy()
+        loop.current_frame = index
+        changed = loop.update()
+        covered = pygame.Surface(SIZE)
+        covered.blit(before, (0, 0))
+        for rect in changed:
+            covered.blit(loop.image, rect, rect)
+        assert same_pixels(covered, loop.image)
+
+
+def test_skipping_frames_and_looping_back():
+    frames = synthetic_frames(10, seed=9)
+    loop = build(frames)
+    for index in (3, 4, 9, 2, 7, 0):
+        loop.current_frame = index
+        changed = loop.update()
+        assert same_pixels(loop.image, frames[index]), index
+        if index in (2, 0):
+            assert changed == [loop.rect] # Voltar no loop redesenha a tela toda
+
+
+def test_unchanged_frame_has_no_delta():
+    frame = synthetic_frames(1)[0]
+    loop = build([frame, frame.copy(), frame.copy()])
+    assert loop.deltas == [[], []]
+    loop.current_frame = 2
+    assert loop.update() == []
@@ -0,0 +1,19 @@
+from classes import batch
+
+
+def test_session_runs_through_game_step():
+    game = batch._worker_game()
+    before = game.timestep.steps
+    summary = batch.run_session(11, pilot='sweep', max_seconds=5, draw=True)
+    # Cada passo passou pelo Game.step (FixedTimestep, AssetLoader e desenho como no jogo)
+    assert summary['steps'] > 0
+    assert game.timestep.steps - before == summary['steps']
+    assert game.loader.ready()
+    assert len(game.backdrop) == game.backdrop.count
+
+
+def test_same_seed_gives_same_session():
+    first = batch.run_session(3, pilot='bot', wave_profile='stress', max_seconds=10)
+    second = batch.run_session(3, pilot='bot', wave_profile='stress', max_seconds=10)
+    for key in ('score', 'survived_s', 'died', 'steps', 'peak_enemies', 'peak_enemy_shots', 'peak_explosions'):
+        assert first[key] == second[key], key
@@ -0,0 +1,85 @@
+import random
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from classes.collision import frame_mask, collide_circle_mask, sprite_radius
+from classes.projectiles import ProjectileSystem, PLAYER, ENEMY
+
+
+def noise_surface(size, rng, density=0.4):
+    """Surface com pixels opacos espalhados ao acaso (e bordas transparentes às vezes)."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    for x in range(size[0]):
+        for y in range(size[1]):
+            if rng.random() < density:
+                surface.set_at((x, y), (255, 255, 255, 255))
+    return surface
+
+
+def masked_sprite(surface, topleft):
+    sprite = pygame.sprite.Sprite()
+    sprite.image = surface
+    sprite.rect = surface.get_rect(topleft=topleft)
+    sprite.animation = SimpleNamespace(masks=[pygame.mask.from_surface(surface)])
+    sprite.current_frame = 0
+    return sprite
+
+
+def placements(sprite, shot_size):
+    """Cantos do tiro em todas as posições em que o seu rect encosta no do sprite (e uma borda a mais)."""
+    rect = sprite.rect
+    return [(x, y) for x in range(rect.left - shot_size[0], rect.right + 1)
+            for y in range(rect.top - shot_size[1], rect.bottom + 1)]
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_hit_tables_match_mask_overlap(seed):
+    rng = random.Random(seed)
+    shot_size = (6, 10) # Lados pares: o centro do tiro fica num pixel inteiro mais meio
+    shot_image = noise_surface(shot_size, rng, 0.6)
+    projectiles = ProjectileSystem({PLAYER: shot_image, ENEMY: shot_image})
+    # Dois quadros com tamanhos diferentes usam tabelas diferentes no mesmo array
+    for frame_size in ((24, 18), (31, 27)):
+        sprite = masked_sprite(noise_surface(frame_size, rng, 0.3), (100, 80))
+        corners = placements(sprite, shot_size)
+        shot_mask = pygame.mask.from_surface(shot_image)
+        expected = {corner for corner in corners
+                    if frame_mask(sprite).overlap(shot_mask, (corner[0] - sprite.rect.x, corner[1] - sprite.rect.y))}
+        projectiles.clear()
+        projectiles.spawn_many([(x + shot_size[0] / 2, y + shot_size[1] / 2) for x, y in corners],
+                               [(0, -1)] * len(corners), 0, PLAYER)
+        hits = projectiles.collide_rects([sprite], PLAYER, dokill=False, mask_of=frame_mask)
+        found = {(int(x - shot_size[0] / 2), int(y - shot_size[1] / 2)) for x, y in hits.get(sprite, [])}
+        assert found == expected
+        assert 0 < len(expected) < len(corners)
+
+
+def test_circle_path_uses_the_same_tables():
+    rng = random.Random(7)
+    shot_image = noise_surface((6, 6), rng, 0.5)
+    projectiles = ProjectileSystem({PLAYER: shot_image, ENEMY: shot_image})
+    sprite = masked_sprite(noise_surface((20, 20), rng, 0.3), (200, 200))
+    shot_mask = pygame.mask.from_surface(shot_image)
+    for x, y in placements(sprite, (6, 6)):
+        projectiles.clear()
+        projectiles.spawn(x + 3, y + 3, 0, 1, 0, ENEMY)
+        # Raio enorme: o círculo deixa tudo passar e só as máscaras decidem
+        hit = projectiles.collide_circle(sprite, 1000, ENEMY, dokill=False, mask=frame_mask(sprite))
+        expected = frame_mask(sprite).overlap(shot_mask, (x - sprite.rect.x, y - sprite.rect.y)) is not None
+        assert bool(hit) == expected
+
+
+def test_collide_circle_mask_and_radius():
+    rng = random.Random(3)
+    left = masked_sprite(noise_surface((20, 20), rng, 1.0), (0, 0))
+    right = masked_sprite(noise_surface((20, 20), rng, 1.0), (15, 0))
+    assert collide_circle_mask(left, right)
+    right.rect.x = 40
+    assert not collide_circle_mask(left, right)
+    # O raio acompanha o rect e não fica guardado no sprite
+    radius = sprite_radius(left)
+    left.rect.size = (40, 40)
+    assert sprite_radius(left) == 2 * radius
+    assert not hasattr(left, 'radius')
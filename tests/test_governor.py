@@ -0,0 +1,31 @@
+from config import QUALITY_EXPLOSION_STEP
+from classes.governor import QualityGovernor
+from main import Game
+
+
+def test_drops_a_level_over_budget_and_recovers():
+    governor = QualityGovernor(levels=('a', 'b'), budget_ms=10, window=5, headroom=0.5, recover_frames=3,
+                               enabled=True)
+    for _ in range(5):
+        governor.frame(20)
+    assert governor.level == 1 and governor.active('a') and not governor.active('b')
+    for _ in range(3):
+        governor.frame(1)
+    assert governor.level == 0
+
+
+def test_new_game_starts_at_full_quality():
+    game = Game(headless=True, seed=5)
+    try:
+        game.start_new_game()
+        governor = game.governor
+        governor.set_level(governor.levels.index('explosions') + 1)
+        for _ in range(governor.recent.maxlen - 1):
+            governor.frame(1.0)
+        assert game.animations.sets['explosion'].step == QUALITY_EXPLOSION_STEP
+        game.start_new_game()
+        assert governor.level == 0
+        assert len(governor.recent) == 0 and governor.calm == 0
+        assert game.animations.sets['explosion'].step == 1
+    finally:
+        game.quit()
@@ -0,0 +1,128 @@
+import os
+import re
+
+import serial
+
+from classes import protocol
+from classes.protocol import (FrameDecoder, MSG_INPUT, MSG_TELEMETRY, TELEMETRY_PAYLOAD, crc8, decode_input,
+                              encode_frame, encode_input, encode_telemetry)
+from classes.serial_input import SerialReader, TelemetryWriter, ControllerState
+
+
+def test_constants_match_sketch():
+    sketch = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'controle', 'controle.ino')
+    with open(sketch, encoding='utf-8') as f:
+        constants = dict(re.findall(r'const byte (\w+) = (\w+);', f.read()))
+    for name in ('SYNC0', 'SYNC1', 'PROTOCOL_VERSION', 'MAX_PAYLOAD', 'MSG_INPUT', 'MSG_TELEMETRY',
+                 'BUTTON_JOY', 'BUTTON_SHOOT'):
+        assert int(constants[name], 0) == getattr(protocol, name), name
+
+
+def test_crc8_check_value():
+    # Valor de referência do CRC-8 (polinômio 0x07, início 0) para "123456789"
+    assert crc8(b"123456789") == 0xF4
+
+
+def test_input_round_trip():
+    for joy_btn in (0, 1):
+        for shoot_btn in (0, 1):
+            frame = encode_input(300, 0, 1023, joy_btn, shoot_btn)
+            [(msg_type, payload)] = FrameDecoder().feed(frame)
+            assert msg_type == MSG_INPUT
+            assert decode_input(payload) == (300 & 0xFF, 0, 1023, joy_btn, shoot_btn)
+
+
+def test_telemetry_round_trip_clamps_values():
+    frames = FrameDecoder().feed(encode_telemetry(120, -3) + encode_telemetry(300, 2))
+    assert [msg_type for msg_type, _ in frames] == [MSG_TELEMETRY, MSG_TELEMETRY]
+    assert [TELEMETRY_PAYLOAD.unpack(payload) for _, payload in frames] == [(120, 0), (255, 2)]
+
+
+def test_frames_split_across_reads():
+    data = encode_input(1, 10, 20, 1, 1) + encode_input(2, 30, 40, 0, 0)
+    decoder = FrameDecoder()
+    frames = []
+    for byte in data:
+        frames += decoder.feed(bytes((byte,)))
+    assert [decode_input(payload)[:3] for _, payload in frames] == [(1, 10, 20), (2, 30, 40)]
+
+
+def test_crc_mismatch_is_dropped():
+    good = encode_input(7, 512, 512, 1, 1)
+    bad = bytearray(good)
+    bad[5] ^= 0x01 # Muda um bit do payload
+    decoder = FrameDecoder()
+    frames = decoder.feed(bytes(bad) + good)
+    assert decoder.bad_crc == 1
+    assert [decode_input(payload)[0] for _, payload in frames] == [7]
+
+
+def test_resync_after_garbage():
+    decoder = FrameDecoder()
+    garbage = b"\x00\xff\xa5\x13hello\xa5"
+    frames = decoder.feed(garbage + encode_input(1, 100, 200, 1, 0) + b"\x5a\x5a" + encode_input(2, 300, 400, 0, 1))
+    assert [decode_input(payload)[:3] for _, payload in frames] == [(1, 100, 200), (2, 300, 400)]
+    assert decoder.frames == 2
+    assert decoder.skipped_bytes >= len(garbage)
+
+
+def test_unknown_version_is_skipped():
+    frame = bytearray(encode_frame(MSG_INPUT, b"\x00" * 6))
+    frame[2] = (15 << 4) | MSG_INPUT
+    decoder = FrameDecoder()
+    frames = decoder.feed(bytes(frame) + encode_input(9, 1, 2, 1, 1))
+    assert decoder.bad_version == 1
+    assert [decode_input(payload)[0] for _, payload in frames] == [9]
+
+
+def test_reader_counts_bad_frames_and_lost_samples():
+    reader = SerialReader(None, protocol='binary')
+    corrupted = bytearray(encode_input(1, 0, 0, 1, 1))
+    corrupted[-1] ^= 0xFF
+    reader.feed_bytes(encode_input(0, 1, 2, 1, 1) + bytes(corrupted) + encode_input(3, 5, 6, 1, 0))
+    assert reader.malformed == 1
+    assert reader.lost == 2 # seq 1 (CRC errado) e 2 (nunca enviado)
+    assert reader.take() == ControllerState(5, 6, 1, 0)
+
+
+class Loopback:
+    """Porta serial falsa: guarda o que o jogo escreve."""
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data):
+        self.data += data
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_telemetry_writer_sends_changes_only_and_rate_limits():
+    port, clock = Loopback(), Clock()
+    writer = TelemetryWriter(port, protocol='binary', min_interval=0.05, clock=clock)
+    assert writer.update(10, 3)
+    assert not writer.update(10, 3) # Nada mudou
+    clock.now = 0.01
+    assert not writer.update(20, 3) # Mudou, mas dentro do intervalo
+    assert writer.rate_limited == 1
+    clock.now = 0.06
+    assert writer.update(20, 3) # A mudança barrada sai depois do intervalo
+    frames = FrameDecoder().feed(bytes(port.data))
+    assert [TELEMETRY_PAYLOAD.unpack(payload) for _, payload in frames] == [(10, 3), (20, 3)]
+    assert writer.messages_sent == 2
+    assert writer.bytes_sent == len(port.data)
+
+
+def test_telemetry_writer_survives_write_errors():
+    class Unplugged:
+        def write(self, data):
+            raise serial.SerialException("write failed")
+
+    writer = TelemetryWriter(Unplugged(), protocol='binary', min_interval=0.0, clock=Clock())
+    assert not writer.update(10, 3)
+    assert writer.messages_sent == 0
@@ -0,0 +1,93 @@
+import pytest
+
+import main
+from classes.controls import BotPilot
+from classes.replay import InputRecorder, ReplayLog, replay
+
+
+def record_session(tmp_path, monkeypatch, frames, wave_profile='normal', quality=()):
+    """Grava uma partida headless com seed e devolve (caminho do replay, resumo final)."""
+    monkeypatch.setattr(main, 'REPLAY_DIR', str(tmp_path))
+    game = main.Game(headless=True, seed=2024, record=True, wave_profile=wave_profile)
+    game.input_source = BotPilot(game)
+    try:
+        game.start_new_game()
+        path = game.recorder.path
+        for frame in range(frames):
+            if frame in quality:
+                game.governor.set_level(quality[frame])
+            # Passos variados por frame, como um frame lento que recupera o atraso
+            game.step(1 / 60 * (1 + frame % 3))
+            if game.game_state != "playing":
+                break
+        summary = game.replay_summary()
+        game.finish_recording()
+    finally:
+        game.quit()
+    return path, summary
+
+
+def test_replay_reproduces_recorded_session(tmp_path, monkeypatch):
+    path, summary = record_session(tmp_path, monkeypatch, 600)
+    log = ReplayLog.load(path)
+    assert len(log.frames) == 600
+    game, expected, result = replay(path)
+    game.quit()
+    assert expected is not None
+    assert result == expected
+    for name in ('score', 'lives', 'enemies', 'player_shots', 'enemy_shots', 'explosions'):
+        assert result[name] == summary[name]
+    assert result['score'] > 0 # A partida teve acertos, não só o jogador parado
+
+
+def test_replay_follows_quality_levels(tmp_path, monkeypatch):
+    # O nível 'enemy_shots' limita os tiros inimigos e muda a simulação
+    path, _ = record_session(tmp_path, monkeypatch, 300, quality={100: 5, 200: 0})
+    log = ReplayLog.load(path)
+    assert log.levels[99:102] == [0, 5, 5]
+    assert log.levels[-1] == 0
+    game, expected, result = replay(path)
+    game.quit()
+    assert result == expected
+
+
+def test_truncated_file_still_loads(tmp_path):
+    path = str(tmp_path / "cut.p51r")
+    recorder = InputRecorder(path, 7, 'normal')
+    for frame in range(50):
+        recorder.command(1, 0, True)
+        recorder.end_frame()
+    recorder.close({'score': 0, 'lives': 3, 'enemies': 0, 'player_shots': 0, 'enemy_shots': 0, 'explosions': 0})
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(data[:-8])
+    log = ReplayLog.load(path)
+    assert log.seed == 7 and log.wave_profile == 'normal'
+    assert log.summary is None
+    assert all(commands == [(1, 0, True)] for commands in log.frames)
+
+
+def test_recordings_in_the_same_second_get_distinct_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, 'REPLAY_DIR', str(tmp_path))
+    game = main.Game(headless=True, seed=99, record=True)
+    try:
+        paths = []
+        for _ in range(3):
+            game.start_new_game()
+            paths.append(game.recorder.path)
+            game.step(1 / 60)
+        game.finish_recording()
+    finally:
+        game.quit()
+    assert len(set(paths)) == 3
+    for path in paths:
+        assert ReplayLog.load(path).frames # Nenhuma gravação foi truncada pela seguinte
+
+
+def test_recorder_never_overwrites(tmp_path):
+    path = str(tmp_path / "taken.p51r")
+    InputRecorder(path, 1, 'normal').close({'score': 0, 'lives': 3, 'enemies': 0, 'player_shots': 0,
+                                            'enemy_shots': 0, 'explosions': 0})
+    with pytest.raises(FileExistsError):
+        InputRecorder(path, 2, 'normal')
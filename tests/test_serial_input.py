@@ -0,0 +1,102 @@
+import os
+import time
+
+import pytest
+import serial
+
+from classes.fake_arduino import FakeArduino
+from classes.serial_input import SerialReader, ControllerState
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'openpty'), reason="FakeArduino usa um pty (só POSIX)")
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+@pytest.fixture
+def link(request):
+    """(FakeArduino, SerialReader) ligados por um pty, no protocolo do parâmetro."""
+    protocol = getattr(request, 'param', 'text')
+    fake = FakeArduino(interval=0.01, sample=lambda seq: (seq % 1024, 1023 - seq % 1024, 1, seq % 2),
+                       protocol=protocol).start()
+    ser = serial.Serial(fake.port, 115200, timeout=0.05)
+    reader = SerialReader(ser, protocol=protocol).start()
+    yield fake, reader
+    reader.stop()
+    ser.close()
+    fake.stop()
+
+
+@pytest.mark.parametrize('link', ['text', 'binary'], indirect=True)
+def test_reads_samples_from_fake_arduino(link):
+    fake, reader = link
+    assert wait_for(lambda: reader.samples_read >= 5)
+    state = reader.latest()
+    assert isinstance(state, ControllerState)
+    # Toda amostra que o fake gera tem joy_x + joy_y == 1023 e o botão do joystick solto
+    assert state.joy_x + state.joy_y == 1023
+    assert state.joy_btn == 1
+    assert reader.malformed == 0
+    assert reader.error is None
+
+
+def test_malformed_lines_are_counted(link):
+    fake, reader = link
+    fake.write(b"1,2,3\r\nabc,1,1,1\r\n\r\n")
+    assert wait_for(lambda: reader.malformed >= 3)
+    assert wait_for(lambda: reader.samples_read >= 3)
+
+
+def test_take_consumes_latest_and_counts_dropped():
+    reader = SerialReader(None, protocol='text')
+    assert reader.take() is None
+    for x in (100, 200, 300):
+        reader.feed_line(b"%d,512,1,1" % x)
+    assert reader.dropped == 2
+    assert reader.take() == ControllerState(300, 512, 1, 1)
+    assert reader.take() is None
+    assert reader.latest() == ControllerState(300, 512, 1, 1)
+
+
+def test_feed_line_parsing():
+    reader = SerialReader(None, protocol='text')
+    reader.feed_line(b" 10,20,0,1\r")
+    assert reader.take() == ControllerState(10, 20, 0, 1)
+    for line in (b"", b"1,2,3", b"1,2,3,4,5", b"1,x,3,4"):
+        reader.feed_line(line)
+    assert reader.malformed == 4
+    assert reader.take() is None
+
+
+def test_read_failure_is_recorded():
+    class BrokenPort:
+        in_waiting = 0
+
+        def read(self, size):
+            raise serial.SerialException("device disconnected")
+
+    reader = SerialReader(BrokenPort(), protocol='text').start()
+    assert wait_for(lambda: not reader._thread.is_alive())
+    assert isinstance(reader.error, serial.SerialException)
+
+
+def test_game_falls_back_to_keyboard_when_link_fails():
+    from main import Game
+
+    fake = FakeArduino(interval=0.01, protocol='binary').start()
+    game = Game(headless=True, seed=1, serial_port=fake.port)
+    try:
+        assert game.serial_reader is not None
+        assert wait_for(lambda: game.serial_reader.samples_read > 0)
+        fake.stop() # Fecha o pty: a próxima leitura falha
+        assert wait_for(lambda: game.serial_reader.error is not None)
+        assert game.read_controls() == (0, 0, False)
+        assert game.ser is None and game.serial_reader is None
+    finally:
+        game.quit()
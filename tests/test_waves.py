@@ -0,0 +1,117 @@
+import pygame
+import pytest
+
+from classes.waves import TypedGroup, WaveDirector, load_wave_profiles
+
+KINDS = ('enemy', 'bomber')
+
+
+class Enemy(pygame.sprite.Sprite):
+    def __init__(self, kind):
+        super().__init__()
+        self.kind = kind
+
+
+def spawn_all(spawns, group):
+    for kind, count in spawns:
+        for _ in range(count):
+            group.add(Enemy(kind))
+
+
+def profile(**spawns):
+    return {'spawns': spawns}
+
+
+def test_typed_group_tracks_add_kill_and_remove():
+    group, other = TypedGroup(), TypedGroup()
+    enemies = [Enemy('enemy') for _ in range(3)]
+    bomber = Enemy('bomber')
+    group.add(*enemies, bomber)
+    other.add(enemies[0])
+    assert group.count('enemy') == 3 and group.count('bomber') == 1 and group.count('boss') == 0
+    enemies[0].kill()
+    group.remove(bomber)
+    group.add(enemies[1])  # Já está no grupo: não conta duas vezes
+    assert group.count('enemy') == 2 and group.count('bomber') == 0
+    assert set(group.of_kind('enemy')) == set(enemies[1:])
+    assert other.count('enemy') == 0 and len(other) == 0
+    group.empty()
+    assert group.count('enemy') == 0 and list(group.of_kind('boss')) == []
+
+
+def test_cap_trims_the_spawn_and_counts_the_rest():
+    director = WaveDirector(profile(enemy={'interval_ms': 100, 'count': 3, 'cap': 5}), KINDS)
+    group = TypedGroup()
+    assert director.update(99, group) == []
+    spawns = director.update(100, group)
+    assert spawns == [('enemy', 3)]
+    spawn_all(spawns, group)
+    assert director.update(200, group) == [('enemy', 2)]  # 3 devidos, só 2 cabem
+    spawn_all([('enemy', 2)], group)
+    assert director.update(300, group) == []  # Cheio: nada nasce
+    assert director.spawned['enemy'] == 5 and director.capped['enemy'] == 4
+
+
+def test_cap_frees_up_when_enemies_die():
+    director = WaveDirector(profile(enemy={'interval_ms': 100, 'count': 2, 'cap': 2}), KINDS)
+    group = TypedGroup()
+    spawn_all(director.update(100, group), group)
+    assert director.update(200, group) == []
+    next(iter(group.of_kind('enemy'))).kill()
+    # A vaga abre, mas o spawn espera o próximo intervalo (não acumula os perdidos)
+    assert director.update(250, group) == []
+    assert director.update(300, group) == [('enemy', 1)]
+
+
+def test_caps_are_per_kind():
+    director = WaveDirector(profile(enemy={'interval_ms': 100, 'count': 1, 'cap': None},
+                                    bomber={'interval_ms': 100, 'count': 1, 'cap': 1}), KINDS)
+    group = TypedGroup()
+    for now in range(100, 600, 100):
+        spawn_all(director.update(now, group), group)
+    assert group.count('enemy') == 5 and group.count('bomber') == 1
+    assert director.capped == {'enemy': 0, 'bomber': 4}
+
+
+def test_a_long_step_catches_up_every_missed_interval():
+    director = WaveDirector(profile(enemy={'interval_ms': 100, 'count': 2, 'start_ms': 0}), KINDS)
+    group = TypedGroup()
+    assert director.update(0, group) == [('enemy', 2)]
+    assert director.update(350, group) == [('enemy', 6)]
+    assert director.update(399, group) == []
+    assert director.update(400, group) == [('enemy', 2)]
+
+
+def test_difficulty_shortens_the_interval():
+    director = WaveDirector({'spawns': {'enemy': {'interval_ms': 100, 'start_ms': 0}},
+                             'difficulty': [[1000, 2.0], [0, 1.0]]}, KINDS)
+    assert director.difficulty(-5) == 1.0
+    assert director.difficulty(500) == pytest.approx(1.5)
+    assert director.difficulty(5000) == 2.0
+    group = TypedGroup()
+    director.update(0, group)
+    director.next_spawn['enemy'] = 2000
+    director.update(2000, group)
+    assert director.next_spawn['enemy'] == pytest.approx(2050)
+
+
+def test_reset_restarts_the_schedule_and_counters():
+    director = WaveDirector(profile(enemy={'interval_ms': 100, 'cap': 0}), KINDS)
+    director.update(1000, TypedGroup())
+    assert director.capped['enemy'] == 10
+    director.reset()
+    assert director.next_spawn['enemy'] == 100
+    assert director.spawned['enemy'] == 0 and director.capped['enemy'] == 0
+
+
+def test_invalid_profiles_are_rejected():
+    with pytest.raises(ValueError):
+        WaveDirector(profile(boss={'interval_ms': 100}), KINDS)
+    with pytest.raises(ValueError):
+        WaveDirector(profile(enemy={'interval_ms': 0}), KINDS)
+
+
+@pytest.mark.parametrize('name', sorted(load_wave_profiles()))
+def test_shipped_profiles_load(name):
+    director = WaveDirector(load_wave_profiles()[name], KINDS)
+    assert {rule.kind for rule in director.rules} == set(KINDS)